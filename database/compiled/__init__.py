@@ -0,0 +1,26 @@
+"""
+Compiled, in-memory representations of game data tables.
+"""
+from .cache import LRUCache
+from .progressions import CompiledProgression
+from .dps import CompiledDpsTable
+from .registry import ProgressionRegistry, progression_registry, get_registry
+from .names import NameIndex, name_index, get_name_index
+from .equipment import EquipmentStatMatrix, EquipmentStatMatrixCache, equipment_matrices, get_equipment_matrix
+from .essences import (
+    DEFAULT_EV_PROFILE, EssenceSelector, EVProfile, ev_profiles, load_ev_profiles,
+    EssenceReference, EssenceReferenceCache, essence_references, get_essence_reference
+)
+from .ev_calculator import EVCalculator, get_ev_calculator
+
+__all__ = [
+    'LRUCache',
+    'CompiledProgression',
+    'CompiledDpsTable',
+    'ProgressionRegistry', 'progression_registry', 'get_registry',
+    'NameIndex', 'name_index', 'get_name_index',
+    'EquipmentStatMatrix', 'EquipmentStatMatrixCache', 'equipment_matrices', 'get_equipment_matrix',
+    'DEFAULT_EV_PROFILE', 'EssenceSelector', 'EVProfile', 'ev_profiles', 'load_ev_profiles',
+    'EssenceReference', 'EssenceReferenceCache', 'essence_references', 'get_essence_reference',
+    'EVCalculator', 'get_ev_calculator'
+]
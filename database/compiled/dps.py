@@ -0,0 +1,85 @@
+"""
+Compiled, in-memory form of weapon DPS tables.
+
+Each table is expanded into dense arrays indexed directly by level (0..the table's last level), one
+per quality with the quality factor already applied, plus one for qualities without a factor. Weapon
+DPS at any level and quality is then a single array index.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .progressions import CompiledProgression
+
+
+def quality_key(quality) -> str:
+    """Normalise an ItemQuality enum (or its name/value string) to the lowercase quality key."""
+    return str(getattr(quality, 'value', quality)).lower()
+
+
+@dataclass(frozen=True)
+class CompiledDpsTable:
+    """A DPS table compiled into a linear base curve plus its quality factors."""
+    table_id: str
+    base: CompiledProgression
+    quality_factors: Dict[str, float] = field(default_factory=dict)  # quality key -> factor
+
+    # Dense DPS by level: quality key -> values, and the unscaled values for qualities without a factor.
+    # Lists serve scalar lookups, numpy arrays vectorised ones.
+    _dense: Dict[str, List[float]] = field(init=False, repr=False, compare=False)
+    _dense_arrays: Dict[str, np.ndarray] = field(init=False, repr=False, compare=False)
+    _base_dense: List[float] = field(init=False, repr=False, compare=False)
+    _base_array: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        max_level = self.base.levels[-1] if self.base.levels else -1
+        base_array = self.base.get_values(np.arange(max_level + 1))
+        dense_arrays = {key: base_array * factor for key, factor in self.quality_factors.items()}
+        # Frozen dataclass - derived fields are set once here
+        object.__setattr__(self, '_base_array', base_array)
+        object.__setattr__(self, '_base_dense', base_array.tolist())
+        object.__setattr__(self, '_dense_arrays', dense_arrays)
+        object.__setattr__(self, '_dense', {key: array.tolist() for key, array in dense_arrays.items()})
+
+    @classmethod
+    def from_points(
+        cls,
+        table_id: str,
+        points: Iterable[Tuple[int, float]],
+        quality_factors: Optional[Dict[str, Optional[float]]] = None
+    ) -> 'CompiledDpsTable':
+        """Build a compiled DPS table from (level, base DPS) pairs and raw quality factors."""
+        factors = {
+            key: factor for key, factor in (quality_factors or {}).items()
+            if factor  # Missing or zero factors fall back to 1.0, as on the model
+        }
+        return cls(
+            table_id=table_id,
+            base=CompiledProgression.from_points(table_id, True, points),
+            quality_factors=factors
+        )
+
+    def get_quality_factor(self, quality) -> float:
+        """Get the quality factor for an ItemQuality (or quality string), defaulting to 1.0."""
+        return self.quality_factors.get(quality_key(quality), 1.0)
+
+    def get_base_dps_at_level(self, level: int) -> float:
+        """Get the base DPS value at a specific level."""
+        return self.base.get_value(level)
+
+    def get_dps_at_level(self, level: int, quality) -> float:
+        """Get the final DPS value at a specific level with quality factor applied."""
+        dense = self._dense.get(quality_key(quality), self._base_dense)
+        if 0 <= level < len(dense):
+            return dense[level]
+        return 0.0
+
+    def get_dps_at_levels(self, levels, quality) -> np.ndarray:
+        """Vectorised get_dps_at_level over an array of levels."""
+        dense = self._dense_arrays.get(quality_key(quality), self._base_array)
+        levels = np.asarray(levels)
+        result = np.zeros(levels.shape, dtype=float)
+        inside = (levels >= 0) & (levels < len(dense))
+        result[inside] = dense[levels[inside]]
+        return result
@@ -0,0 +1,175 @@
+"""
+Compiled items x stats matrix of the equipment catalog, for catalog-wide scoring.
+
+Every equipment item's stats are read once (as plain column tuples) and stored as sparse
+(row, column) entries grouped by compiled progression curve, so evaluating the whole catalog at an
+item level is one vectorised get_values call per distinct curve, scattered into a dense
+items x stats matrix. Socket counts are kept as an items x socket types matrix alongside it.
+
+The process-wide matrix is rebuilt when the progression registry reports a newer data version.
+"""
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .progressions import CompiledProgression
+from .registry import ProgressionRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+# Column order of the socket matrix (as in EquipmentItem.socket_summary)
+SOCKET_TYPES = ('basic', 'primary', 'vital', 'cloak', 'necklace', 'pvp')
+
+
+@dataclass(frozen=True)
+class EquipmentStatMatrix:
+    """Stats and sockets of every equipment item, as arrays indexed by item row."""
+    keys: np.ndarray  # Item key per row, ascending
+    slots: np.ndarray  # Equipment slot per row
+    base_ilvls: np.ndarray  # Base item level per row
+    stat_names: List[str]  # Stat per column
+    sockets: np.ndarray  # items x SOCKET_TYPES socket counts
+    # (curve, rows, columns) per distinct compiled curve used by any item stat
+    curves: List[Tuple[CompiledProgression, np.ndarray, np.ndarray]]
+    version: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @classmethod
+    def from_rows(cls, item_rows, stat_rows, registry: ProgressionRegistry) -> 'EquipmentStatMatrix':
+        """
+        Build the matrix from plain rows.
+
+        Args:
+            item_rows: (key, slot, base_ilvl, *socket counts in SOCKET_TYPES order) per item
+            stat_rows: (item_key, stat_name, value_table_id) per item stat
+            registry: Compiled progression tables to resolve the value tables with
+        """
+        item_rows = sorted(item_rows, key=lambda row: row[0])
+        row_of = {row[0]: index for index, row in enumerate(item_rows)}
+
+        stat_names: List[str] = []
+        column_of: Dict[str, int] = {}
+        curves: Dict[int, CompiledProgression] = {}
+        entries = defaultdict(lambda: ([], []))  # id(curve) -> (rows, columns)
+        for item_key, stat_name, table_id in stat_rows:
+            row = row_of.get(item_key)
+            curve = registry.get_progression(table_id)
+            if row is None or curve is None:
+                continue  # Not equipment, or an unknown table (worth 0.0 at every level)
+            column = column_of.get(stat_name)
+            if column is None:
+                column = column_of[stat_name] = len(stat_names)
+                stat_names.append(stat_name)
+            # Alias tables share their canonical curve object, so group by identity
+            curves[id(curve)] = curve
+            rows, columns = entries[id(curve)]
+            rows.append(row)
+            columns.append(column)
+
+        return cls(
+            keys=np.array([row[0] for row in item_rows], dtype=np.int64),
+            slots=np.array([row[1] for row in item_rows], dtype=object),
+            base_ilvls=np.array([row[2] for row in item_rows], dtype=float),
+            stat_names=stat_names,
+            sockets=np.array([row[3:] for row in item_rows], dtype=float).reshape(len(item_rows), len(SOCKET_TYPES)),
+            curves=[
+                (curves[curve_id], np.array(rows, dtype=np.intp), np.array(columns, dtype=np.intp))
+                for curve_id, (rows, columns) in entries.items()
+            ],
+            version=registry.version
+        )
+
+    @classmethod
+    def load(cls, session: Session, registry: ProgressionRegistry) -> 'EquipmentStatMatrix':
+        """Build the matrix from every equipment item in the database."""
+        # Imported here to keep the models free to import the compiled package at module level
+        from ..models.items import EquipmentItem, ItemStat
+
+        item_rows = session.execute(select(
+            EquipmentItem.key, EquipmentItem.slot, EquipmentItem.base_ilvl,
+            EquipmentItem.sockets_basic, EquipmentItem.sockets_primary, EquipmentItem.sockets_vital,
+            EquipmentItem.sockets_cloak, EquipmentItem.sockets_necklace, EquipmentItem.sockets_pvp
+        )).all()
+        stat_rows = session.execute(
+            select(ItemStat.item_key, ItemStat.stat_name, ItemStat.value_table_id)
+            .join(EquipmentItem, EquipmentItem.key == ItemStat.item_key)
+        ).all()
+        return cls.from_rows(item_rows, stat_rows, registry)
+
+    def get_values(self, ilvls) -> np.ndarray:
+        """
+        Evaluate every item stat at an item level.
+
+        Args:
+            ilvls: One item level for every item, or an array with an item level per row
+                   (e.g. base_ilvls)
+
+        Returns:
+            items x stat_names matrix of concrete values (0.0 where an item lacks a stat)
+        """
+        ilvls = np.broadcast_to(np.asarray(ilvls, dtype=float), self.keys.shape)
+        values = np.zeros((len(self.keys), len(self.stat_names)), dtype=float)
+        for curve, rows, columns in self.curves:
+            # add.at so an item listing the same stat twice gets the sum, as scoring its stat list would
+            np.add.at(values, (rows, columns), curve.get_values(ilvls[rows]))
+        return values
+
+
+class EquipmentStatMatrixCache:
+    """Holds the process-wide equipment stat matrix for the current data version."""
+
+    def __init__(self):
+        self._matrix: Optional[EquipmentStatMatrix] = None
+        self._lock = threading.Lock()
+
+    def ensure_current(self, session: Optional[Session] = None) -> EquipmentStatMatrix:
+        """
+        Get the matrix, building it if it has not been built yet or the registry has moved on to
+        a newer data version (which the registry checks at most every VERSION_POLL_SECONDS).
+
+        Args:
+            session: Database session to use. If None, a short-lived session is opened when needed.
+        """
+        registry = get_registry(session)
+        matrix = self._matrix
+        if matrix is not None and matrix.version == registry.version:
+            return matrix
+        with self._lock:
+            matrix = self._matrix
+            if matrix is not None and matrix.version == registry.version:
+                return matrix
+            if session is not None:
+                matrix = EquipmentStatMatrix.load(session, registry)
+            else:
+                from ..session import SessionLocal
+                with SessionLocal() as own_session:
+                    matrix = EquipmentStatMatrix.load(own_session, registry)
+            logger.info(f"Built {len(matrix)} x {len(matrix.stat_names)} equipment stat matrix at data version {matrix.version}")
+            self._matrix = matrix
+            return matrix
+
+    def invalidate(self) -> None:
+        """Drop the matrix so the next lookup rebuilds it."""
+        self._matrix = None
+
+
+# Process-wide equipment stat matrix
+equipment_matrices = EquipmentStatMatrixCache()
+
+
+def get_equipment_matrix(session: Optional[Session] = None) -> EquipmentStatMatrix:
+    """
+    Get the process-wide equipment stat matrix, building it on first use.
+
+    Args:
+        session: Optional session to build with if the matrix needs (re)building
+    """
+    return equipment_matrices.ensure_current(session)
@@ -0,0 +1,214 @@
+"""
+Compiled essence reference tables for essence value (EV) scoring.
+
+EV expresses an item's stats as the number of essences it would take to replicate them, so scoring
+needs, for each stat, the value of one reference essence, plus the value of a vital socket (the
+VITALITY of the essence it holds, in reference VITALITY essences).
+
+Which essences are the reference is a named EV profile, defined as data in config/ev_profiles.json:
+each profile selects an essence (item level, and optionally a name fragment or tier) for every stat,
+with per-stat overrides. The "default" profile uses Vivid essences at ilvl 532, and Supplemental
+essences at ilvl 508 for VITALITY and FATE.
+
+A profile's reference table is read from the database once (as plain column tuples) and resolved
+through the compiled progression tables, so scoring an item does no database access. The
+process-wide tables are compiled per profile on first use and recompiled when the progression
+registry reports a newer data version.
+"""
+import json
+import logging
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .registry import ProgressionRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+# Profile definitions, and the profile used when none is requested (and for the stored ev column)
+EV_PROFILES_PATH = Path(__file__).resolve().parents[2] / 'config' / 'ev_profiles.json'
+DEFAULT_EV_PROFILE = 'default'
+
+
+@dataclass(frozen=True)
+class EssenceSelector:
+    """Picks reference essences: those at an item level, optionally by name fragment and tier."""
+    ilvl: int
+    name: Optional[str] = None
+    tier: Optional[int] = None
+
+    def matches(self, name: str, base_ilvl: int, tier: Optional[int]) -> bool:
+        """Whether an essence is selected."""
+        return (
+            base_ilvl == self.ilvl
+            and (self.name is None or self.name in name)
+            and (self.tier is None or tier == self.tier)
+        )
+
+
+@dataclass(frozen=True)
+class EVProfile:
+    """A named choice of reference essences."""
+    name: str
+    essence: EssenceSelector  # For every stat without an override
+    stats: Dict[str, EssenceSelector] = field(default_factory=dict)  # Per-stat overrides
+    vital_socket: Optional[EssenceSelector] = None  # Essence a vital socket holds (its VITALITY)
+    description: str = ''
+
+    def get_selector(self, stat_name: str) -> EssenceSelector:
+        """Get the selector of the reference essence for a stat."""
+        return self.stats.get(stat_name, self.essence)
+
+    @classmethod
+    def from_dict(cls, name: str, data: Dict) -> 'EVProfile':
+        """Build a profile from its ev_profiles.json entry."""
+        return cls(
+            name=name,
+            essence=EssenceSelector(**data['essence']),
+            stats={stat_name: EssenceSelector(**selector) for stat_name, selector in data.get('stats', {}).items()},
+            vital_socket=EssenceSelector(**data['vital_socket']) if data.get('vital_socket') else None,
+            description=data.get('description', '')
+        )
+
+
+def load_ev_profiles(path: Path = EV_PROFILES_PATH) -> Dict[str, EVProfile]:
+    """Read the EV profile definitions."""
+    with open(path, encoding='utf-8') as profiles_file:
+        definitions = json.load(profiles_file)
+    profiles = {name: EVProfile.from_dict(name, data) for name, data in definitions.items()}
+    if DEFAULT_EV_PROFILE not in profiles:
+        raise ValueError(f"{path} must define the '{DEFAULT_EV_PROFILE}' EV profile")
+    return profiles
+
+
+# Process-wide profile definitions
+ev_profiles = load_ev_profiles()
+
+
+@dataclass(frozen=True)
+class EssenceReference:
+    """Reference essence value per stat for one EV profile, compiled at one data version."""
+    stat_values: Dict[str, float]
+    vital_socket_ratio: Optional[float]  # None if either VITALITY essence is missing
+    version: Optional[int] = None
+    profile: str = DEFAULT_EV_PROFILE
+
+    @classmethod
+    def load(
+        cls,
+        session: Session,
+        registry: ProgressionRegistry,
+        profile: Optional[EVProfile] = None
+    ) -> 'EssenceReference':
+        """
+        Compile the reference table of a profile from the essences in the database.
+
+        Args:
+            session: Database session to read the essences with
+            registry: Compiled progression tables to evaluate the essence stats with
+            profile: Profile choosing the reference essences (the default profile if None)
+        """
+        # Imported here to keep the models free to import the compiled package at module level
+        from ..models.items import Essence, ItemStat
+
+        profile = profile or ev_profiles[DEFAULT_EV_PROFILE]
+        selectors = [profile.essence, *profile.stats.values()]
+        if profile.vital_socket is not None:
+            selectors.append(profile.vital_socket)
+
+        rows = session.execute(
+            select(Essence.name, Essence.base_ilvl, Essence.tier, ItemStat.stat_name, ItemStat.value_table_id)
+            .join(ItemStat, ItemStat.item_key == Essence.key)
+            .where(Essence.base_ilvl.in_({selector.ilvl for selector in selectors}))
+            .order_by(Essence.key, ItemStat.order)
+        ).all()
+
+        # The first selected essence (by key) with a stat is its reference
+        stat_values: Dict[str, float] = {}
+        vital_socket_vitality = 0.0
+        for name, base_ilvl, tier, stat_name, table_id in rows:
+            if stat_name not in stat_values and profile.get_selector(stat_name).matches(name, base_ilvl, tier):
+                stat_values[stat_name] = registry.get_value(table_id, base_ilvl)
+            if (stat_name == 'VITALITY' and not vital_socket_vitality and profile.vital_socket is not None
+                    and profile.vital_socket.matches(name, base_ilvl, tier)):
+                vital_socket_vitality = registry.get_value(table_id, base_ilvl)
+
+        reference_vitality = stat_values.get('VITALITY', 0.0)
+        vital_socket_ratio = (
+            vital_socket_vitality / reference_vitality
+            if vital_socket_vitality > 0 and reference_vitality > 0 else None
+        )
+        return cls(
+            stat_values=stat_values,
+            vital_socket_ratio=vital_socket_ratio,
+            version=registry.version,
+            profile=profile.name
+        )
+
+
+class EssenceReferenceCache:
+    """Holds the process-wide essence reference table of each EV profile for the current data version."""
+
+    def __init__(self):
+        self._references: Dict[str, EssenceReference] = {}
+        self._lock = threading.Lock()
+
+    def ensure_current(self, session: Optional[Session] = None, profile: str = DEFAULT_EV_PROFILE) -> EssenceReference:
+        """
+        Get a profile's reference table, compiling it if it has not been compiled yet or the registry
+        has moved on to a newer data version (which the registry checks at most every VERSION_POLL_SECONDS).
+
+        Args:
+            session: Database session to use. If None, a short-lived session is opened when needed.
+            profile: Name of the EV profile
+
+        Raises:
+            KeyError: If there is no such profile
+        """
+        ev_profile = ev_profiles[profile]
+        registry = get_registry(session)
+        reference = self._references.get(profile)
+        if reference is not None and reference.version == registry.version:
+            return reference
+        with self._lock:
+            reference = self._references.get(profile)
+            if reference is not None and reference.version == registry.version:
+                return reference
+            if session is not None:
+                reference = EssenceReference.load(session, registry, ev_profile)
+            else:
+                from ..session import SessionLocal
+                with SessionLocal() as own_session:
+                    reference = EssenceReference.load(own_session, registry, ev_profile)
+            logger.info(
+                f"Compiled {len(reference.stat_values)} essence reference values of EV profile "
+                f"'{profile}' at data version {reference.version}"
+            )
+            self._references[profile] = reference
+            return reference
+
+    def invalidate(self) -> None:
+        """Drop the reference tables so the next lookups recompile them."""
+        self._references = {}
+
+
+# Process-wide reference tables
+essence_references = EssenceReferenceCache()
+
+
+def get_essence_reference(session: Optional[Session] = None, profile: str = DEFAULT_EV_PROFILE) -> EssenceReference:
+    """
+    Get the process-wide essence reference table of an EV profile, compiling it on first use.
+
+    Args:
+        session: Optional session to compile with if the table needs (re)compiling
+        profile: Name of the EV profile
+
+    Raises:
+        KeyError: If there is no such profile
+    """
+    return essence_references.ensure_current(session, profile)
@@ -0,0 +1,228 @@
+"""
+Essence Value (EV) calculator.
+
+Calculates essence value scores for equipment items based on their concrete stats.
+The EV represents how many essences it would take to replicate the stats on an item.
+
+Scoring works from a compiled essence reference table (see essences.py), so a
+calculator does no database access per item. get_ev_calculator returns a process-wide calculator
+per EV profile for the current data version.
+
+Many items are scored at once with calculate_batch_ev: an items x stats matrix of concrete values
+times a per-stat weight vector (the reciprocal essence values, with ARMOUR mapped onto the
+mitigations it grants), plus an items x socket types matrix times a per-socket weight vector.
+"""
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+from .equipment import SOCKET_TYPES, EquipmentStatMatrix
+from .essences import DEFAULT_EV_PROFILE, EssenceReference, get_essence_reference
+
+class EVCalculator:
+    """Calculates Essence Value scores against a reference essence table."""
+    
+    # Mitigations granted per point of ARMOUR
+    ARMOUR_MITIGATIONS = (('PHYSICAL_MITIGATION', 1.0), ('TACTICAL_MITIGATION', 0.2))
+    
+    def __init__(self, reference: EssenceReference):
+        """
+        Args:
+            reference: Reference essence values to score against
+        """
+        self.reference = reference
+        self._essence_values = reference.stat_values
+        self._stat_weights: Dict[Tuple[str, ...], np.ndarray] = {}
+    
+    @property
+    def version(self) -> Optional[int]:
+        """Data version of the reference table."""
+        return self.reference.version
+    
+    def calculate_stat_ev(self, stat_name: str, stat_value: float) -> float:
+        """Calculate EV contribution for a single stat."""
+        essence_values = self._essence_values
+        
+        # Handle ARMOUR special case - convert to mitigations
+        if stat_name == 'ARMOUR':
+            # Physical mitigation = armour value * 1.0, tactical mitigation = armour value * 0.2
+            return sum(
+                stat_value * factor / essence_values[mitigation]
+                for mitigation, factor in self.ARMOUR_MITIGATIONS
+                if mitigation in essence_values
+            )
+        
+        # Standard stat calculation
+        if stat_name not in essence_values:
+            return 0.0
+        
+        return stat_value / essence_values[stat_name]
+    
+    def calculate_socket_ev(self, socket_summary: Dict[str, int]) -> float:
+        """Calculate EV contribution for sockets."""
+        total_socket_ev = 0.0
+        
+        # Most sockets are worth 1 EV each
+        basic_sockets = socket_summary.get('basic', 0)
+        primary_sockets = socket_summary.get('primary', 0)
+        cloak_sockets = socket_summary.get('cloak', 0)
+        necklace_sockets = socket_summary.get('necklace', 0)
+        pvp_sockets = socket_summary.get('pvp', 0)
+        
+        total_socket_ev += basic_sockets + primary_sockets + cloak_sockets + necklace_sockets + pvp_sockets
+        
+        # Vital sockets are special - they're worth the ratio of vivid to supplemental vitality
+        vital_sockets = socket_summary.get('vital', 0)
+        if vital_sockets > 0:
+            vital_socket_value = self.reference.vital_socket_ratio
+            if vital_socket_value is not None:
+                total_socket_ev += vital_sockets * vital_socket_value
+            else:
+                # Fallback to 1 EV per socket if we can't calculate the ratio
+                total_socket_ev += vital_sockets
+        
+        return total_socket_ev
+    
+    def calculate_equipment_ev(self, stat_values: list, socket_summary: Optional[Dict[str, int]] = None) -> float:
+        """
+        Calculate total EV for an equipment item.
+        
+        Args:
+            stat_values: List of stat dictionaries with 'stat_name' and 'value' keys
+            socket_summary: Dictionary with socket counts by type
+            
+        Returns:
+            Total essence value score
+        """
+        total_ev = 0.0
+        
+        # Calculate EV from stats
+        for stat in stat_values:
+            stat_name = stat['stat_name']
+            stat_value = stat['value']
+            stat_ev = self.calculate_stat_ev(stat_name, stat_value)
+            total_ev += stat_ev
+        
+        # Calculate EV from sockets
+        if socket_summary:
+            socket_ev = self.calculate_socket_ev(socket_summary)
+            total_ev += socket_ev
+        
+        return total_ev
+    
+    def get_stat_weights(self, stat_names: Sequence[str]) -> np.ndarray:
+        """
+        Get the EV of one point of each stat, for scoring a matrix with these stat columns.
+        
+        The weights are the reciprocal essence values of the reference stats, mapped onto the
+        columns by a stats x reference stats transform: the identity for ordinary stats and the
+        ARMOUR_MITIGATIONS factors for ARMOUR. Stats without a reference essence weigh 0.
+        """
+        key = tuple(stat_names)
+        weights = self._stat_weights.get(key)
+        if weights is not None:
+            return weights
+        
+        reference_names = list(self._essence_values)
+        reference_column = {name: column for column, name in enumerate(reference_names)}
+        reference_values = np.array([self._essence_values[name] for name in reference_names], dtype=float)
+        reciprocal = np.divide(1.0, reference_values, out=np.zeros_like(reference_values), where=reference_values != 0)
+        
+        transform = np.zeros((len(key), len(reference_names)), dtype=float)
+        for row, stat_name in enumerate(key):
+            if stat_name == 'ARMOUR':
+                for mitigation, factor in self.ARMOUR_MITIGATIONS:
+                    if mitigation in reference_column:
+                        transform[row, reference_column[mitigation]] = factor
+            elif stat_name in reference_column:
+                transform[row, reference_column[stat_name]] = 1.0
+        
+        weights = transform @ reciprocal
+        self._stat_weights[key] = weights
+        return weights
+    
+    def get_socket_weights(self) -> np.ndarray:
+        """Get the EV of one socket of each type, in SOCKET_TYPES order."""
+        vital_socket_value = self.reference.vital_socket_ratio
+        return np.array([
+            (vital_socket_value if vital_socket_value is not None else 1.0) if socket_type == 'vital' else 1.0
+            for socket_type in SOCKET_TYPES
+        ])
+    
+    def calculate_batch_ev(
+        self,
+        stat_values: np.ndarray,
+        stat_names: Sequence[str],
+        socket_counts: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Calculate total EV for many items at once.
+        
+        Args:
+            stat_values: items x stats matrix of concrete stat values
+            stat_names: Stat of each column of stat_values
+            socket_counts: Optional items x SOCKET_TYPES matrix of socket counts
+            
+        Returns:
+            Essence value score per item
+        """
+        total_ev = stat_values @ self.get_stat_weights(stat_names)
+        if socket_counts is not None:
+            total_ev = total_ev + socket_counts @ self.get_socket_weights()
+        return total_ev
+    
+    def score_equipment(self, matrix: EquipmentStatMatrix, ilvls) -> np.ndarray:
+        """
+        Calculate the EV of every item of an equipment stat matrix.
+        
+        Args:
+            matrix: Compiled equipment stats and sockets
+            ilvls: Item level to score at, or an array with one per item (e.g. matrix.base_ilvls)
+            
+        Returns:
+            Essence value score per matrix row
+        """
+        return self.calculate_batch_ev(matrix.get_values(ilvls), matrix.stat_names, matrix.sockets)
+    
+    def calculate_curve_ev(self, stat_curve: Dict, socket_summary: Dict[str, int]) -> np.ndarray:
+        """
+        Calculate the EV of one item at every item level of a stat curve.
+        
+        Args:
+            stat_curve: An item's get_stats_curve_json (stat_values[i][j] is stat_names[i] at min_ilvl + j)
+            socket_summary: Dictionary with socket counts by type
+            
+        Returns:
+            Essence value score per item level, from min_ilvl to max_ilvl
+        """
+        levels = stat_curve['max_ilvl'] - stat_curve['min_ilvl'] + 1
+        # Each item level is a row of the batch, with the item's sockets on every row
+        stat_values = np.asarray(stat_curve['stat_values'], dtype=float).reshape(len(stat_curve['stat_names']), levels).T
+        socket_counts = np.tile([socket_summary.get(socket_type, 0) for socket_type in SOCKET_TYPES], (levels, 1))
+        return self.calculate_batch_ev(stat_values, stat_curve['stat_names'], socket_counts)
+
+
+_calculators: Dict[str, EVCalculator] = {}
+_calculators_lock = threading.Lock()
+
+
+def get_ev_calculator(session: Optional[Session] = None, profile: str = DEFAULT_EV_PROFILE) -> EVCalculator:
+    """
+    Get the process-wide calculator of an EV profile for the current data version.
+
+    Args:
+        session: Optional session to compile the essence reference table with if it needs (re)compiling
+        profile: Name of the EV profile choosing the reference essences
+
+    Raises:
+        KeyError: If there is no such profile
+    """
+    reference = get_essence_reference(session, profile)
+    calculator = _calculators.get(profile)
+    if calculator is None or calculator.reference is not reference:
+        with _calculators_lock:
+            calculator = _calculators.get(profile)
+            if calculator is None or calculator.reference is not reference:
+                calculator = _calculators[profile] = EVCalculator(reference)
+    return calculator
@@ -0,0 +1,174 @@
+"""
+In-memory prefix index over item names, for search-as-you-type suggestions.
+
+Every item name is indexed under its full name (lowercased, runs of spaces collapsed) and under the
+rest of the name from each later word, e.g. "vivid essence of might" is also found by "essence of"
+and "might".
+Both lists are sorted, so the matches for a prefix are a contiguous range found with two bisects
+and no database access. Full-name matches are suggested before later-word matches.
+
+The index is built from the database once and rebuilt when the progression registry reports a
+newer data version, so it never outlives a reimport by more than the registry's poll interval.
+"""
+import logging
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .registry import get_registry
+
+logger = logging.getLogger(__name__)
+
+# Sorts after any character that can follow a prefix
+_PREFIX_END = '\U0010ffff'
+
+
+class NameIndex:
+    """Sorted token arrays mapping name prefixes to items."""
+
+    def __init__(self):
+        # Parallel arrays: item key, name and equipment slot (None for non-equipment) per entry
+        self._keys: List[int] = []
+        self._names: List[str] = []
+        self._slots: List[Optional[str]] = []
+        # Sorted (token, entry) pairs split into parallel arrays for bisect
+        self._name_tokens: List[str] = []
+        self._name_entries: List[int] = []
+        self._word_tokens: List[str] = []
+        self._word_entries: List[int] = []
+        self._version: Optional[int] = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> Optional[int]:
+        """Data version of the registry the index was built alongside."""
+        return self._version
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def build(self, rows: List[Tuple[int, str, Optional[str]]], version: Optional[int] = None) -> None:
+        """
+        Build the index from (key, name, slot) rows, replacing the current contents.
+
+        Args:
+            rows: One row per item
+            version: Data version the rows were read at
+        """
+        keys, names, slots = [], [], []
+        name_tokens: List[Tuple[str, int]] = []
+        word_tokens: List[Tuple[str, int]] = []
+        for entry, (key, name, slot) in enumerate(rows):
+            keys.append(key)
+            names.append(name)
+            slots.append(slot)
+            lowered = ' '.join(name.lower().split())
+            name_tokens.append((lowered, entry))
+            # The rest of the name from the start of every later word
+            for position in range(1, len(lowered)):
+                if lowered[position - 1] == ' ':
+                    word_tokens.append((lowered[position:], entry))
+        name_tokens.sort()
+        word_tokens.sort()
+
+        # Swap everything in at once so concurrent readers see either the old or the new index
+        (self._keys, self._names, self._slots,
+         self._name_tokens, self._name_entries,
+         self._word_tokens, self._word_entries) = (
+            keys, names, slots,
+            [token for token, _ in name_tokens], [entry for _, entry in name_tokens],
+            [token for token, _ in word_tokens], [entry for _, entry in word_tokens]
+        )
+        self._version = version
+        self._loaded = True
+
+    def load(self, session: Session, version: Optional[int] = None) -> None:
+        """Build the index from every item in the database."""
+        # Imported here to keep the models free to import the compiled package at module level
+        from ..models.items import EquipmentItem, Item
+
+        equipment = EquipmentItem.__table__
+        rows = session.execute(
+            select(Item.key, Item.name, equipment.c.slot)
+            .outerjoin(equipment, equipment.c.key == Item.key)
+        ).all()
+        self.build(rows, version)
+        logger.info(f"Indexed {len(rows)} item names at data version {version}")
+
+    def ensure_current(self, session: Optional[Session] = None) -> None:
+        """
+        Build the index if it has not been built yet, or rebuild it if the registry has moved on
+        to a newer data version (which the registry checks at most every VERSION_POLL_SECONDS).
+
+        Args:
+            session: Database session to use. If None, a short-lived session is opened when needed.
+        """
+        version = get_registry(session).version
+        if self._loaded and self._version == version:
+            return
+        with self._lock:
+            if self._loaded and self._version == version:
+                return
+            if session is not None:
+                self.load(session, version)
+            else:
+                from ..session import SessionLocal
+                with SessionLocal() as own_session:
+                    self.load(own_session, version)
+
+    def invalidate(self) -> None:
+        """Mark the index stale so the next lookup rebuilds it."""
+        self._loaded = False
+
+    def suggest(self, prefix: str, slot: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """
+        Get items whose name, or a later part of it, starts with a prefix.
+
+        Args:
+            prefix: Case-insensitive prefix
+            slot: Only suggest equipment for this slot
+            limit: Maximum number of suggestions
+
+        Returns:
+            List of {key, name} dicts - full-name matches by name first, then later-word matches
+        """
+        prefix = ' '.join(prefix.lower().split())
+        if not prefix or limit <= 0:
+            return []
+
+        suggestions: List[Dict] = []
+        seen = set()
+        for tokens, entries in (
+            (self._name_tokens, self._name_entries),
+            (self._word_tokens, self._word_entries)
+        ):
+            start = bisect_left(tokens, prefix)
+            end = bisect_left(tokens, prefix + _PREFIX_END, start)
+            for position in range(start, end):
+                entry = entries[position]
+                if entry in seen or (slot is not None and self._slots[entry] != slot):
+                    continue
+                seen.add(entry)
+                suggestions.append({'key': self._keys[entry], 'name': self._names[entry]})
+                if len(suggestions) == limit:
+                    return suggestions
+        return suggestions
+
+
+# Process-wide index instance
+name_index = NameIndex()
+
+
+def get_name_index(session: Optional[Session] = None) -> NameIndex:
+    """
+    Get the process-wide name index, building it on first use.
+
+    Args:
+        session: Optional session to build with if the index needs (re)building
+    """
+    name_index.ensure_current(session)
+    return name_index
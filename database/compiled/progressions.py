@@ -0,0 +1,100 @@
+"""
+Compiled, in-memory form of progression tables.
+Points are flattened once into sorted level/value arrays so that every lookup is a binary search
+instead of a scan over ORM rows.
+
+LINEAR tables are also split into segments, one per point: segment i starts at levels[i] with
+values[i] and rises by slopes[i] per level until the next point. The last point gets a flat
+segment so that it is still inside the table. Evaluating a level is then one binary search and one
+multiply-add, for a single level or for a whole array of levels at once. Anchoring each segment
+at its start point (rather than at level 0) keeps the stored points exact.
+"""
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CompiledProgression:
+    """A progression table compiled into parallel, level-sorted arrays."""
+    table_id: str
+    linear: bool  # True for LINEAR (interpolated) tables, False for ARRAY (exact lookup) tables
+    levels: List[int]
+    values: List[float]
+    slopes: List[float] = field(init=False, repr=False, compare=False)
+
+    # numpy copies of the arrays above for vectorised evaluation
+    _level_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _value_array: np.ndarray = field(init=False, repr=False, compare=False)
+    _slope_array: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        slopes = [
+            (self.values[i + 1] - self.values[i]) / (self.levels[i + 1] - self.levels[i])
+            for i in range(len(self.levels) - 1)
+        ]
+        if self.levels:
+            slopes.append(0.0)  # Flat segment for the last point
+        # Frozen dataclass - derived fields are set once here
+        object.__setattr__(self, 'slopes', slopes)
+        object.__setattr__(self, '_level_array', np.asarray(self.levels, dtype=float))
+        object.__setattr__(self, '_value_array', np.asarray(self.values, dtype=float))
+        object.__setattr__(self, '_slope_array', np.asarray(slopes, dtype=float))
+
+    @classmethod
+    def from_points(cls, table_id: str, linear: bool, points: Iterable[Tuple[int, float]]) -> 'CompiledProgression':
+        """Build a compiled table from (item_level, value) pairs in any order."""
+        ordered = sorted(points)
+        return cls(
+            table_id=table_id,
+            linear=linear,
+            levels=[level for level, _ in ordered],
+            values=[value for _, value in ordered]
+        )
+
+    def get_value(self, item_level: int) -> float:
+        """
+        Get the value at the given item level.
+        ARRAY tables only answer exact levels; LINEAR tables interpolate between the surrounding
+        points. Levels outside the table (or missing ARRAY entries) give 0.0.
+        """
+        levels = self.levels
+        index = bisect_right(levels, item_level) - 1
+        if index < 0:
+            return 0.0
+
+        if not self.linear:
+            return self.values[index] if levels[index] == item_level else 0.0
+
+        # Past the last point
+        if index == len(levels) - 1 and item_level != levels[index]:
+            return 0.0
+
+        return self.values[index] + self.slopes[index] * (item_level - levels[index])
+
+    def get_values(self, item_levels) -> np.ndarray:
+        """
+        Vectorised get_value: evaluate the table at every level in an array in one pass.
+        Follows the same rules as get_value for out-of-range and missing levels.
+        """
+        item_levels = np.asarray(item_levels, dtype=float)
+        result = np.zeros(item_levels.shape, dtype=float)
+        if not self.levels:
+            return result
+
+        levels = self._level_array
+        index = np.searchsorted(levels, item_levels, side='right') - 1
+        if self.linear:
+            inside = (index >= 0) & (item_levels <= levels[-1])
+            index = index[inside]
+            result[inside] = self._value_array[index] + self._slope_array[index] * (item_levels[inside] - levels[index])
+        else:
+            index = np.maximum(index, 0)
+            exact = levels[index] == item_levels
+            result[exact] = self._value_array[index[exact]]
+        return result
+
+    def __len__(self) -> int:
+        return len(self.levels)
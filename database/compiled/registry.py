@@ -0,0 +1,251 @@
+"""
+Process-wide registry of compiled progression and DPS tables.
+
+Every ProgressionTable and DpsTable is read from the database once (as plain column tuples, with no
+ORM hydration) and compiled into sorted arrays. Model methods resolve stat and DPS values through the
+registry, so request handlers never need to load ProgressionValue or DpsValue rows.
+
+Interned (alias) progression tables share the compiled object of their canonical table, so the number
+of compiled curves is the number of distinct curves, not the number of table IDs.
+
+Scalar (table_id, item_level) lookups go through a bounded LRU cache. The registry remembers the data
+version it compiled and re-reads it from the database at most every VERSION_POLL_SECONDS; when an
+import has bumped it, the tables are recompiled and the cache starts empty, so a worker never serves
+values from before a reimport for longer than the poll interval. Along with the version, the registry
+keeps the item level band of the materialized stat values recorded at that version.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .cache import LRUCache, MISSING
+from .dps import CompiledDpsTable
+from .progressions import CompiledProgression
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressionRegistry:
+    """In-memory cache of compiled progression and DPS tables."""
+
+    # Maximum number of memoized (table_id, item_level) values
+    VALUE_CACHE_SIZE = 4096
+
+    # How often a loaded registry checks the database for a newer data version
+    VERSION_POLL_SECONDS = 1.0
+
+    def __init__(self):
+        self._progressions: Dict[str, CompiledProgression] = {}
+        self._dps_tables: Dict[str, CompiledDpsTable] = {}
+        self._value_cache = LRUCache(self.VALUE_CACHE_SIZE)
+        self._curve_count = 0
+        self._version: Optional[int] = None
+        self._stat_values_band: Optional[Tuple[int, int]] = None
+        self._version_checked_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the registry currently holds compiled tables."""
+        return self._loaded
+
+    def load(self, session: Session) -> None:
+        """
+        Compile every progression and DPS table from the database, replacing the current contents.
+
+        Args:
+            session: Database session to read the tables with
+        """
+        # Imported here to keep the models free to import the registry at module level
+        from ..models.progressions import ProgressionTable, ProgressionValue, ProgressionType
+        from ..models.dps import DpsTable, DpsValue
+        from ..models.data_version import DataVersion
+
+        # Read the version first: an import committing during the load bumps it past this value
+        version = DataVersion.get_current(session)
+        stat_values_band = DataVersion.get_stat_values_band(session)
+
+        # Progression tables
+        progression_points: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for table_id, item_level, value in session.execute(
+            select(ProgressionValue.table_id, ProgressionValue.item_level, ProgressionValue.value)
+        ):
+            progression_points[table_id].append((item_level, value))
+
+        progressions: Dict[str, CompiledProgression] = {}
+        aliases: Dict[str, str] = {}
+        for table_id, progression_type, canonical_id in session.execute(
+            select(ProgressionTable.table_id, ProgressionTable.progression_type, ProgressionTable.canonical_id)
+        ):
+            if canonical_id is not None:
+                aliases[table_id] = canonical_id
+                continue
+            progressions[table_id] = CompiledProgression.from_points(
+                table_id,
+                progression_type == ProgressionType.LINEAR,
+                progression_points.get(table_id, ())
+            )
+        curve_count = len(progressions)
+        for table_id, canonical_id in aliases.items():
+            canonical = progressions.get(canonical_id)
+            if canonical is None:
+                logger.warning(f"Progression table {table_id} aliases missing table {canonical_id}")
+                continue
+            progressions[table_id] = canonical
+
+        # DPS tables
+        dps_points: Dict[str, List[Tuple[int, float]]] = defaultdict(list)
+        for table_id, level, value in session.execute(
+            select(DpsValue.dps_table_id, DpsValue.level, DpsValue.value)
+        ):
+            dps_points[table_id].append((level, value))
+
+        dps_tables = {}
+        for row in session.execute(select(
+            DpsTable.id,
+            DpsTable.quality_common,
+            DpsTable.quality_uncommon,
+            DpsTable.quality_rare,
+            DpsTable.quality_incomparable,
+            DpsTable.quality_legendary
+        )):
+            dps_tables[row.id] = CompiledDpsTable.from_points(
+                row.id,
+                dps_points.get(row.id, ()),
+                {
+                    'common': row.quality_common,
+                    'uncommon': row.quality_uncommon,
+                    'rare': row.quality_rare,
+                    'incomparable': row.quality_incomparable,
+                    'legendary': row.quality_legendary,
+                }
+            )
+
+        # Swap in the new tables in one step so readers never see a partial registry.
+        # The cache is replaced after the tables, so values computed from the old tables only
+        # ever land in the old cache.
+        self._progressions, self._dps_tables = progressions, dps_tables
+        self._value_cache = LRUCache(self.VALUE_CACHE_SIZE)
+        self._curve_count = curve_count
+        self._version = version
+        self._stat_values_band = stat_values_band
+        self._version_checked_at = time.monotonic()
+        self._loaded = True
+        logger.info(
+            f"Compiled {len(progressions)} progression tables ({curve_count} unique curves) "
+            f"and {len(dps_tables)} DPS tables at data version {version}"
+        )
+
+    def _is_fresh(self) -> bool:
+        """Whether the registry is loaded and its data version was checked recently."""
+        return self._loaded and time.monotonic() - self._version_checked_at < self.VERSION_POLL_SECONDS
+
+    def _refresh(self, session: Session) -> None:
+        """Load the registry, or reload it if the data version in the database has moved on."""
+        if self._loaded:
+            from ..models.data_version import DataVersion
+            version = DataVersion.get_current(session)
+            self._version_checked_at = time.monotonic()
+            if version == self._version:
+                return
+            logger.info(f"Data version changed from {self._version} to {version}, recompiling tables")
+        self.load(session)
+
+    def ensure_loaded(self, session: Optional[Session] = None) -> None:
+        """
+        Load the registry if it has not been loaded yet, or if the data version has changed since
+        it was loaded (checked at most every VERSION_POLL_SECONDS).
+
+        Args:
+            session: Database session to load with. If None, a short-lived session is opened.
+        """
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            if session is not None:
+                self._refresh(session)
+            else:
+                from ..session import SessionLocal
+                with SessionLocal() as own_session:
+                    self._refresh(own_session)
+
+    def rebuild(self, session: Session) -> None:
+        """Recompile all tables, e.g. after an import has committed."""
+        with self._lock:
+            self.load(session)
+
+    def invalidate(self) -> None:
+        """Mark the registry stale so the next lookup recompiles from the database."""
+        self._loaded = False
+
+    @property
+    def version(self) -> Optional[int]:
+        """Data version the loaded tables were compiled from."""
+        return self._version
+
+    @property
+    def stat_values_band(self) -> Optional[Tuple[int, int]]:
+        """(min, max) item level band of item_stat_values at the loaded data version, or None if unknown."""
+        return self._stat_values_band
+
+    @property
+    def curve_count(self) -> int:
+        """Number of distinct compiled progression curves (aliases excluded)."""
+        return self._curve_count
+
+    def get_progression(self, table_id: str) -> Optional[CompiledProgression]:
+        """
+        Get a compiled progression table by ID.
+        For an alias table this is its canonical table's compiled curve (whose table_id is the canonical ID).
+        """
+        return self._progressions.get(table_id)
+
+    def get_canonical_id(self, table_id: str) -> Optional[str]:
+        """Get the ID of the canonical table whose curve a table uses."""
+        table = self._progressions.get(table_id)
+        return table.table_id if table else None
+
+    def get_value(self, table_id: str, item_level: int) -> float:
+        """Get the value of a progression table at an item level (0.0 for unknown tables)."""
+        cache = self._value_cache
+        key = (table_id, item_level)
+        value = cache.get(key)
+        if value is MISSING:
+            table = self._progressions.get(table_id)
+            value = table.get_value(item_level) if table is not None else 0.0
+            cache.put(key, value)
+        return value
+
+    def get_cache_stats(self) -> Dict:
+        """Get the value cache counters (since the last load) and the loaded data version."""
+        return {
+            'data_version': self._version,
+            **self._value_cache.get_stats()
+        }
+
+    def get_dps_table(self, table_id: str) -> Optional[CompiledDpsTable]:
+        """Get a compiled DPS table by ID."""
+        return self._dps_tables.get(table_id)
+
+
+# Process-wide registry instance
+progression_registry = ProgressionRegistry()
+
+
+def get_registry(session: Optional[Session] = None) -> ProgressionRegistry:
+    """
+    Get the process-wide registry, loading it on first use.
+
+    Args:
+        session: Optional session to load with if the registry is not loaded yet
+    """
+    progression_registry.ensure_loaded(session)
+    return progression_registry
@@ -0,0 +1,193 @@
+"""
+Server-side evaluation of progression and DPS tables.
+
+Builds SQL that interpolates a table at an item level inside the database, so that the catalog can be
+filtered and sorted by concrete stat values (at any item level, for every item) in one statement,
+without loading table points into Python.
+
+Each evaluation is a neighbour lookup: the query is outer-joined to the nearest point at or below the
+item level and to the nearest point above it, each located with a correlated max()/min() on the
+(table_id, item_level) primary key, and then follows the same rules as CompiledProgression.get_value.
+Plain correlated subqueries are used rather than a LATERAL join so the same SQL runs on PostgreSQL and
+on the SQLite test database.
+"""
+from typing import Dict, Iterable, Tuple
+
+from sqlalchemy import Float, and_, case, cast, func, literal, select, true, union_all
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql.elements import ColumnElement
+
+from .models.dps import DpsTable, DpsValue
+from .models.items import ItemQuality, ItemStat, ItemStatValue, Weapon
+from .models.progressions import ProgressionTable, ProgressionType, ProgressionValue
+
+
+def _join_interpolated(query, point_model, table_id_column: str, level_column: str, table_id, item_level, linear):
+    """
+    Outer-join the points around an item level and build the interpolated value from them.
+
+    Args:
+        query: Query (or select) to join into
+        point_model: ProgressionValue or DpsValue
+        table_id_column, level_column: Names of the point model's table ID and level attributes
+        table_id: Expression for the table whose points to use
+        item_level: Item level - a column expression or a plain int
+        linear: Boolean expression, true for tables that interpolate between points
+
+    Returns:
+        (query, value)
+    """
+    lower, upper = aliased(point_model), aliased(point_model)
+    points = aliased(point_model)
+    point_table_id, point_level = getattr(points, table_id_column), getattr(points, level_column)
+    lower_level = select(func.max(point_level)).where(
+        point_table_id == table_id, point_level <= item_level
+    ).scalar_subquery()
+    upper_level = select(func.min(point_level)).where(
+        point_table_id == table_id, point_level > item_level
+    ).scalar_subquery()
+
+    query = query.outerjoin(lower, and_(
+        getattr(lower, table_id_column) == table_id, getattr(lower, level_column) == lower_level
+    )).outerjoin(upper, and_(
+        getattr(upper, table_id_column) == table_id, getattr(upper, level_column) == upper_level
+    ))
+
+    lower_at, upper_at = getattr(lower, level_column), getattr(upper, level_column)
+    value = case(
+        # Exact point
+        (lower_at == item_level, lower.value),
+        # Between two points of a LINEAR table
+        (
+            and_(linear, lower_at.is_not(None), upper_at.is_not(None)),
+            lower.value + (upper.value - lower.value) * (item_level - lower_at) / cast(upper_at - lower_at, Float)
+        ),
+        # Outside the table, or a missing ARRAY level
+        else_=literal(0.0)
+    )
+    return query, value
+
+
+def join_progression_value(query, table, item_level):
+    """
+    Outer-join what is needed to evaluate a progression table at an item level.
+
+    Args:
+        query: Query (or select) that already includes table
+        table: ProgressionTable (or an alias of it) joined into the query
+        item_level: Item level - a column expression or a plain int
+
+    Returns:
+        (query, value) - interned alias tables are evaluated against their canonical table's points.
+        Like ProgressionRegistry.get_value, the value is 0.0 outside the table or for missing
+        ARRAY levels.
+    """
+    return _join_interpolated(
+        query, ProgressionValue, 'table_id', 'item_level',
+        func.coalesce(table.canonical_id, table.table_id),
+        item_level,
+        table.progression_type == ProgressionType.LINEAR
+    )
+
+
+def dps_quality_factor(dps_table, quality) -> ColumnElement:
+    """
+    SQL expression for a DPS table's factor for an item quality column.
+    Missing or zero factors fall back to 1.0, as on the model.
+    """
+    factor = case(
+        (quality == ItemQuality.COMMON, dps_table.quality_common),
+        (quality == ItemQuality.UNCOMMON, dps_table.quality_uncommon),
+        (quality == ItemQuality.RARE, dps_table.quality_rare),
+        (quality == ItemQuality.INCOMPARABLE, dps_table.quality_incomparable),
+        (quality == ItemQuality.LEGENDARY, dps_table.quality_legendary),
+    )
+    return func.coalesce(func.nullif(factor, 0.0), 1.0)
+
+
+def join_dps_value(query, dps_table, quality, level):
+    """
+    Outer-join what is needed to evaluate a DPS table at a level.
+
+    Args:
+        query: Query (or select) that already includes dps_table
+        dps_table: DpsTable (or an alias of it) joined into the query
+        quality: The weapon's quality column
+        level: Item level - a column expression or a plain int
+
+    Returns:
+        (query, value) - the base DPS with the quality factor applied
+    """
+    query, base = _join_interpolated(query, DpsValue, 'dps_table_id', 'level', dps_table.id, level, true())
+    return query, base * dps_quality_factor(dps_table, quality)
+
+
+def join_item_stat_value(query, item, stat_name: str, item_level):
+    """
+    Outer-join what is needed to evaluate one stat of every item in a query, in SQL.
+
+    Args:
+        query: Query selecting item (an Item subclass)
+        item: The item entity of the query, e.g. EquipmentItem
+        stat_name: ItemStat name, or ItemStatValue.DPS_STAT_NAME for weapon DPS
+        item_level: Item level - a column expression (e.g. item.base_ilvl) or a plain int
+
+    Returns:
+        (query, value) - the joined query and an expression for the stat value, which is NULL for
+        items without the stat, as for items without a materialized item_stat_values row
+    """
+    if stat_name == ItemStatValue.DPS_STAT_NAME:
+        weapons = Weapon.__table__
+        dps_table = aliased(DpsTable)
+        query = query.outerjoin(weapons, weapons.c.key == item.key).outerjoin(
+            dps_table, dps_table.id == weapons.c.dps_table_id
+        )
+        query, dps = join_dps_value(query, dps_table, item.quality, item_level)
+        # Same fallback as Weapon.get_dps_at_ilvl: the base DPS when there is no DPS table
+        value = case((dps_table.id.is_not(None), dps), else_=weapons.c.dps)
+    else:
+        stat = aliased(ItemStat)
+        table = aliased(ProgressionTable)
+        query = query.outerjoin(stat, and_(stat.item_key == item.key, stat.stat_name == stat_name)).outerjoin(
+            table, table.table_id == stat.value_table_id
+        )
+        query, table_value = join_progression_value(query, table, item_level)
+        value = case((table.table_id.is_not(None), table_value))
+    return query, value
+
+
+def select_progression_values(pairs: Iterable[Tuple[str, int]]):
+    """
+    Build one SELECT returning (table_id, item_level, value) for every (table_id, item_level) pair.
+    Unknown table IDs give no row.
+    """
+    pairs = list(pairs)
+    if not pairs:
+        raise ValueError("At least one (table_id, item_level) pair is required")
+    requested = union_all(*(
+        select(literal(table_id).label('table_id'), literal(item_level).label('item_level'))
+        for table_id, item_level in pairs
+    )).subquery('requested')
+
+    table = aliased(ProgressionTable)
+    query = select(requested.c.table_id, requested.c.item_level).join(
+        table, table.table_id == requested.c.table_id
+    )
+    query, value = join_progression_value(query, table, requested.c.item_level)
+    return query.add_columns(value.label('value'))
+
+
+def get_progression_values(session: Session, pairs: Iterable[Tuple[str, int]]) -> Dict[Tuple[str, int], float]:
+    """
+    Evaluate many (table_id, item_level) pairs in a single statement.
+
+    Returns:
+        Dict mapping each pair to its value (pairs with unknown tables are left out)
+    """
+    pairs = list(pairs)
+    if not pairs:
+        return {}
+    return {
+        (table_id, item_level): value
+        for table_id, item_level, value in session.execute(select_progression_values(pairs))
+    }
@@ -3,15 +3,17 @@ Database models for LOTRO Forge.
 """
 
 from .base import Base
-from .items import Item, EquipmentItem, Weapon, Essence, ItemStat, ItemQuality
+from .items import Item, EquipmentItem, Weapon, Essence, ItemStat, ItemStatValue, ItemRender, ItemQuality
 from .dps import DpsTable, DpsValue
 from .progressions import ProgressionTable, ProgressionValue, ProgressionType
+from .data_version import DataVersion
 from .user import User, UserSession, UserRole
 
 __all__ = [
     'Base',
-    'Item', 'EquipmentItem', 'Weapon', 'Essence', 'ItemStat', 'ItemQuality',
+    'Item', 'EquipmentItem', 'Weapon', 'Essence', 'ItemStat', 'ItemStatValue', 'ItemRender', 'ItemQuality',
     'DpsTable', 'DpsValue',
     'ProgressionTable', 'ProgressionValue', 'ProgressionType',
+    'DataVersion',
     'User', 'UserSession', 'UserRole'
 ] 
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Database model for the game data version.
+A single counter that every import bumps in the same transaction as its data, so any process can
+tell cheaply whether its in-memory copies of the data are out of date.
+
+The row also records the item level band the last stat values import materialized
+(item_stat_values), so readers know which ilvls they can look up instead of interpolating.
+"""
+from typing import Optional, Tuple
+
+from sqlalchemy import Integer, select
+from sqlalchemy.orm import Mapped, mapped_column, Session
+
+from .base import Base
+
+
+class DataVersion(Base):
+    """Model for the single-row game data version counter."""
+    __tablename__ = "data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # Always SINGLETON_ID
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Item level band of item_stat_values (NULL until a stat values import has recorded it)
+    stat_values_min_ilvl: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    stat_values_max_ilvl: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    SINGLETON_ID = 1
+
+    def __repr__(self) -> str:
+        return f"<DataVersion(version={self.version})>"
+
+    @classmethod
+    def get_current(cls, session: Session) -> int:
+        """Get the current data version (0 if no import has bumped it yet)."""
+        version = session.scalar(select(cls.version).where(cls.id == cls.SINGLETON_ID))
+        return version or 0
+
+    @classmethod
+    def get_stat_values_band(cls, session: Session) -> Optional[Tuple[int, int]]:
+        """Get the (min, max) item level band of the materialized stat values, or None if unknown."""
+        row = session.execute(
+            select(cls.stat_values_min_ilvl, cls.stat_values_max_ilvl).where(cls.id == cls.SINGLETON_ID)
+        ).first()
+        if row is None or row.stat_values_min_ilvl is None or row.stat_values_max_ilvl is None:
+            return None
+        return row.stat_values_min_ilvl, row.stat_values_max_ilvl
+
+    @classmethod
+    def set_stat_values_band(cls, session: Session, min_ilvl: int, max_ilvl: int) -> None:
+        """
+        Record the item level band of the materialized stat values inside the caller's transaction.
+        Like the data values themselves, it becomes visible with the import's version bump.
+        """
+        row = session.get(cls, cls.SINGLETON_ID, with_for_update=True)
+        if row is None:
+            row = cls(id=cls.SINGLETON_ID, version=0)
+            session.add(row)
+        row.stat_values_min_ilvl = min_ilvl
+        row.stat_values_max_ilvl = max_ilvl
+        session.flush()
+
+    @classmethod
+    def bump(cls, session: Session) -> int:
+        """
+        Increment the data version inside the caller's transaction.
+        Call this right before committing an import so the new version becomes visible together
+        with the new data.
+
+        Returns:
+            int: The new data version
+        """
+        row = session.get(cls, cls.SINGLETON_ID, with_for_update=True)
+        if row is None:
+            row = cls(id=cls.SINGLETON_ID, version=0)
+            session.add(row)
+        row.version += 1
+        session.flush()
+        return row.version
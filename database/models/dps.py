@@ -4,11 +4,11 @@ Database models for LOTRO DPS (damage per second) tables.
 from enum import Enum as PyEnum
 from typing import List, Optional
 from sqlalchemy import String, Integer, Float, ForeignKey, DateTime
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 from sqlalchemy.sql import func
 
 from .base import Base
-from .items.item_quality import ItemQuality
+from ..compiled import CompiledDpsTable, get_registry
 
 
 class DpsTable(Base):
@@ -39,47 +39,24 @@ class DpsTable(Base):
     def __repr__(self) -> str:
         return f"<DpsTable(id='{self.id}')>"
     
+    def _compiled(self) -> Optional[CompiledDpsTable]:
+        """Get the compiled form of this table from the registry."""
+        return get_registry(object_session(self)).get_dps_table(self.id)
+    
     def get_quality_factor(self, quality) -> float:
         """Get the quality factor for this DPS table."""
-        
-        quality_map = {
-            ItemQuality.COMMON: self.quality_common or 1.0,
-            ItemQuality.UNCOMMON: self.quality_uncommon or 1.0,
-            ItemQuality.RARE: self.quality_rare or 1.0,
-            ItemQuality.INCOMPARABLE: self.quality_incomparable or 1.0,
-            ItemQuality.LEGENDARY: self.quality_legendary or 1.0,
-        }
-        return quality_map.get(quality, 1.0)
+        compiled = self._compiled()
+        return compiled.get_quality_factor(quality) if compiled else 1.0
     
     def get_base_dps_at_level(self, level: int) -> float:
         """Get the base DPS value at a specific level."""
-        if not self.values:
-            return 0.0
-        
-        # Find exact level match
-        exact_match = next((v.value for v in self.values if v.level == level), None)
-        if exact_match is not None:
-            return exact_match
-        
-        # Find surrounding values for interpolation
-        values = sorted(self.values, key=lambda v: v.level)
-        lower = next((v for v in reversed(values) if v.level <= level), None)
-        upper = next((v for v in values if v.level >= level), None)
-        
-        if not lower or not upper:
-            return 0.0
-        if lower.level == upper.level:
-            return lower.value
-            
-        # Linear interpolation
-        ratio = (level - lower.level) / (upper.level - lower.level)
-        return lower.value + (upper.value - lower.value) * ratio
+        compiled = self._compiled()
+        return compiled.get_base_dps_at_level(level) if compiled else 0.0
     
     def get_dps_at_level(self, level: int, quality) -> float:
         """Get the final DPS value at a specific level with quality factor applied."""
-        base_dps = self.get_base_dps_at_level(level)
-        quality_factor = self.get_quality_factor(quality)
-        return base_dps * quality_factor
+        compiled = self._compiled()
+        return compiled.get_dps_at_level(level, quality) if compiled else 0.0
 
 
 class DpsValue(Base):
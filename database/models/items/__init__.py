@@ -4,16 +4,35 @@ Database models for LOTRO items and their stats.
 
 from .item_quality import ItemQuality
 from .item_stat import ItemStat
+from .item_stat_value import ItemStatValue
+from .item_render import ItemRender
 from .item import Item
 from .equipment_item import EquipmentItem
 from .weapon import Weapon
 from .essence import Essence
+from .loaders import polymorphic_item, item_detail_options, load_item, load_items
+from .projections import (
+    project_equipment_list, equipment_list_json, equipment_list_bytes,
+    project_essence_list, essence_list_json, essence_list_bytes
+)
 
 __all__ = [
     'ItemQuality',
     'ItemStat', 
+    'ItemStatValue',
+    'ItemRender',
     'Item',
     'EquipmentItem',
     'Weapon',
-    'Essence'
+    'Essence',
+    'polymorphic_item',
+    'item_detail_options',
+    'load_item',
+    'load_items',
+    'project_equipment_list',
+    'equipment_list_json',
+    'equipment_list_bytes',
+    'project_essence_list',
+    'essence_list_json',
+    'essence_list_bytes'
 ] 
\ No newline at end of file
@@ -2,7 +2,7 @@
 Database model for equipment items (weapons, armor, etc.).
 """
 from typing import Optional, Dict
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, Float, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .item import Item
@@ -31,6 +31,9 @@ class EquipmentItem(Item):
     sockets_necklace: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     sockets_pvp: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     
+    # Essence value at base ilvl (default EV profile) - computed at import (scripts/importers/ev_values.py)
+    ev: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default='0')
+    
     # Socket type mapping for parsing XML strings
     SOCKET_TYPE_MAPPING = {
         'S': 'basic',
@@ -41,6 +44,11 @@ class EquipmentItem(Item):
         'W': 'pvp'
     }
     
+    __table_args__ = (
+        # Keyset pagination order of the EV sort (ev DESC, key DESC), also used by min_ev filters
+        Index('ix_equipment_items_ev_key', 'ev', 'key'),
+    )
+    
     __mapper_args__ = {
         'polymorphic_identity': 'equipment',
     }
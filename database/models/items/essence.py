@@ -39,9 +39,14 @@ class Essence(Item):
     @property
     def essence_type_name(self) -> Optional[str]:
         """Get the readable name for this essence type."""
-        if self.essence_type is None:
+        return self.get_essence_type_name(self.essence_type)
+    
+    @classmethod
+    def get_essence_type_name(cls, essence_type: Optional[int]) -> Optional[str]:
+        """Get the readable name for an essence type ID."""
+        if essence_type is None:
             return None
-        return self.ESSENCE_TYPE_NAMES.get(self.essence_type, f'Unknown ({self.essence_type})')
+        return cls.ESSENCE_TYPE_NAMES.get(essence_type, f'Unknown ({essence_type})')
     
     def __repr__(self) -> str:
         return f"<Essence(key={self.key}, name='{self.name}')>"
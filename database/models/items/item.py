@@ -2,10 +2,12 @@
 Base database model for all LOTRO items.
 """
 from typing import Optional, List, Dict
-from sqlalchemy import String, Integer, Enum
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+import numpy as np
+from sqlalchemy import String, Integer, Enum, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 
 from ..base import Base
+from ...compiled import get_registry
 from .item_quality import ItemQuality
 from .item_stat import ItemStat
 
@@ -39,6 +41,12 @@ class Item(Base):
         'polymorphic_on': item_type
     }
     
+    __table_args__ = (
+        # Keyset pagination orders of the listings (recent is served by the primary key)
+        Index('ix_items_name_key', 'name', 'key'),
+        Index('ix_items_base_ilvl_name_key', base_ilvl.desc(), name, key),
+    )
+    
     def __repr__(self) -> str:
         return f"<Item(key={self.key}, name='{self.name}')>"
     
@@ -56,6 +64,13 @@ class Item(Base):
             for stat in self.stats
         }
     
+    @staticmethod
+    def get_icon_urls(icon: Optional[str]) -> List[str]:
+        """Convert a hyphen-separated icon ID string to icon URLs."""
+        if not icon:
+            return []
+        return [f"/static/icons/items/{icon_id}.png" for icon_id in icon.split('-') if icon_id]
+    
     def to_dict(self, ilvl: Optional[int] = None) -> Dict:
         """
         Convert the item to a dictionary representation.
@@ -88,12 +103,7 @@ class Item(Base):
         Convert the item to a JSON representation for API responses.
         Returns base item data suitable for frontend consumption.
         """
-        # Process icon URLs
-        icon_urls = []
-        if self.icon:
-            # Split hyphen-separated icon IDs and convert to URLs
-            icon_ids = self.icon.split('-')
-            icon_urls = [f"/static/icons/items/{icon_id}.png" for icon_id in icon_ids if icon_id]
+        icon_urls = self.get_icon_urls(self.icon)
         
         return {
             'key': self.key,
@@ -110,12 +120,7 @@ class Item(Base):
         Convert the item to a minimal JSON representation for list views.
         Returns only essential data: key, name, icon_urls, quality.
         """
-        # Process icon URLs
-        icon_urls = []
-        if self.icon:
-            # Split hyphen-separated icon IDs and convert to URLs
-            icon_ids = self.icon.split('-')
-            icon_urls = [f"/static/icons/items/{icon_id}.png" for icon_id in icon_ids if icon_id]
+        icon_urls = self.get_icon_urls(self.icon)
         
         return {
             'key': self.key,
@@ -140,4 +145,27 @@ class Item(Base):
         return {
             'ilvl': ilvl,
             'stat_values': stat_values
-        } 
\ No newline at end of file
+        }
+    
+    def get_stats_curve_json(self, min_ilvl: int, max_ilvl: int) -> Dict:
+        """
+        Get concrete stats for this item at every item level in [min_ilvl, max_ilvl].
+        Returns compact parallel arrays: stat_values[i][j] is stat_names[i] at min_ilvl + j.
+        """
+        ilvls = np.arange(min_ilvl, max_ilvl + 1)
+        registry = get_registry(object_session(self))
+        
+        stat_names = []
+        stat_values = []
+        for stat in self.stats:
+            table = registry.get_progression(stat.value_table_id)
+            values = table.get_values(ilvls) if table else np.zeros(len(ilvls))
+            stat_names.append(stat.stat_name)
+            stat_values.append(values.tolist())
+        
+        return {
+            'min_ilvl': min_ilvl,
+            'max_ilvl': max_ilvl,
+            'stat_names': stat_names,
+            'stat_values': stat_values
+        }
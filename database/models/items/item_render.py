@@ -0,0 +1,42 @@
+"""
+Database model for pre-rendered item JSON.
+Item base data only changes when an import runs, so the importer serializes each item's detail
+(to_json) and list (to_list_json) representations once and the API splices the stored bytes into
+responses instead of rebuilding and re-encoding them per request.
+"""
+from typing import Any, Dict, TYPE_CHECKING
+
+import orjson
+from sqlalchemy import ForeignKey, LargeBinary
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+if TYPE_CHECKING:
+    from .item import Item
+
+
+class ItemRender(Base):
+    """Model for the serialized JSON representations of one item."""
+    __tablename__ = "item_renders"
+
+    item_key: Mapped[int] = mapped_column(ForeignKey("items.key", ondelete="CASCADE"), primary_key=True)
+    detail_json: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # UTF-8 JSON of to_json()
+    list_json: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # UTF-8 JSON of to_list_json()
+
+    def __repr__(self) -> str:
+        return f"<ItemRender(item_key={self.item_key})>"
+
+    @staticmethod
+    def serialize(content: Any) -> bytes:
+        """Serialize JSON content the same way the data API encodes responses."""
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    @classmethod
+    def render(cls, item: "Item") -> Dict[str, Any]:
+        """Render an item (loaded as its concrete subclass, with stats) into item_renders column values."""
+        return {
+            'item_key': item.key,
+            'detail_json': cls.serialize(item.to_json()),
+            'list_json': cls.serialize(item.to_list_json())
+        }
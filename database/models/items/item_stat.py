@@ -3,10 +3,11 @@ Database model for stats on items, including their value table references.
 """
 from typing import TYPE_CHECKING
 from sqlalchemy import String, Integer, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 
 from ..base import Base
-from ..progressions import ProgressionTable, ProgressionType
+from ..progressions import ProgressionTable
+from ...compiled import get_registry
 
 if TYPE_CHECKING:
     from .item import Item
@@ -31,25 +32,5 @@ class ItemStat(Base):
     
     def get_value(self, item_level: int) -> float:
         """Get the concrete value for this stat at the given item level."""
-        if not self.value_table or not self.value_table.values:
-            return 0.0
-            
-        # Find the closest value in the loaded values list
-        if self.value_table.progression_type == ProgressionType.ARRAY:
-            # Direct lookup
-            value = next((v.value for v in self.value_table.values if v.item_level == item_level), None)
-            return value if value is not None else 0.0
-        else:  # LINEAR
-            # Find surrounding points for interpolation
-            values = sorted(self.value_table.values, key=lambda v: v.item_level)
-            lower = next((v for v in reversed(values) if v.item_level <= item_level), None)
-            upper = next((v for v in values if v.item_level >= item_level), None)
-            
-            if not lower or not upper:
-                return 0.0
-            if lower.item_level == upper.item_level:
-                return lower.value
-                
-            # Linear interpolation
-            ratio = (item_level - lower.item_level) / (upper.item_level - lower.item_level)
-            return lower.value + (upper.value - lower.value) * ratio 
\ No newline at end of file
+        # Resolved through the compiled registry - never touches value_table.values
+        return get_registry(object_session(self)).get_value(self.value_table_id, item_level)
@@ -0,0 +1,35 @@
+"""
+Database model for materialized concrete stat values.
+Each row is the value of one item stat (or weapon DPS) at one item level, precomputed at import time
+so that SQL can filter and sort items by concrete stat values.
+"""
+from sqlalchemy import String, Integer, Float, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ..base import Base
+
+
+class ItemStatValue(Base):
+    """Model for the concrete value of an item stat at a specific item level."""
+    __tablename__ = "item_stat_values"
+
+    # Composite primary key of item, stat name and item level
+    item_key: Mapped[int] = mapped_column(ForeignKey("items.key", ondelete="CASCADE"), primary_key=True)
+    stat_name: Mapped[str] = mapped_column(String(50), primary_key=True)  # ItemStat name, or DPS for weapons
+    ilvl: Mapped[int] = mapped_column(Integer, primary_key=True)
+    value: Mapped[float] = mapped_column(Float, nullable=False)
+
+    # Default item level band to materialize - endgame gear is where most lookups happen
+    DEFAULT_MIN_ILVL = 500
+    DEFAULT_MAX_ILVL = 600
+
+    # Stat name used for weapon DPS rows
+    DPS_STAT_NAME = 'DPS'
+
+    __table_args__ = (
+        # Serves "items ordered/filtered by stat X at ilvl Y"
+        Index('ix_item_stat_values_stat_ilvl_value', 'stat_name', 'ilvl', 'value'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<ItemStatValue(item_key={self.item_key}, stat_name='{self.stat_name}', ilvl={self.ilvl}, value={self.value})>"
@@ -0,0 +1,52 @@
+"""
+Loader strategies for reading items in a fixed number of queries.
+
+Item is a joined-table hierarchy, so a plain query(Item) only selects the items table: the
+subclass columns and the stats collection are then lazy-loaded on first access. The helpers here
+load every subclass table in the item query and the stats in one extra SELECT ... IN query.
+
+Stat and DPS values are resolved through the compiled registry, so the per-stat value_table and
+the weapon dps_table relationships are set to raise instead of lazy-loading. Any code path that
+starts touching them again shows up as an error rather than a silent N+1.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, raiseload, selectinload, with_polymorphic
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from .item import Item
+from .item_stat import ItemStat
+
+
+def polymorphic_item():
+    """Get an Item entity that selects the columns of every subclass table in one query."""
+    return with_polymorphic(Item, "*")
+
+
+def item_detail_options(entity) -> Tuple[LoaderOption, ...]:
+    """
+    Get the loader options for item detail, stats and curve responses.
+
+    Args:
+        entity: Entity returned by polymorphic_item()
+    """
+    return (
+        selectinload(entity.stats).raiseload(ItemStat.value_table),
+        raiseload(entity.Weapon.dps_table),
+    )
+
+
+def load_item(db: Session, item_key: int) -> Optional[Item]:
+    """Load one item as its concrete subclass, with stats, in two queries."""
+    entity = polymorphic_item()
+    return db.query(entity).options(
+        *item_detail_options(entity)
+    ).filter(entity.key == item_key).first()
+
+
+def load_items(db: Session, item_keys: Iterable[int]) -> List[Item]:
+    """Load many items as their concrete subclasses, with stats, in two queries."""
+    entity = polymorphic_item()
+    return db.query(entity).options(
+        *item_detail_options(entity)
+    ).filter(entity.key.in_(set(item_keys))).all()
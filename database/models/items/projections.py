@@ -0,0 +1,92 @@
+"""
+Column-only projections of items for list views.
+
+List responses only need a handful of columns, so instead of hydrating polymorphic ORM objects
+(and lazy-loading each weapon's own table) the listing query is narrowed to those columns, with
+one outer join to weapons, and the list JSON is built straight from the row tuples. The output is
+identical to each model's to_list_json.
+
+The projections also pick up each item's list JSON pre-rendered at import time (item_renders),
+which the *_list_bytes helpers prefer over rendering the row again.
+"""
+from typing import Dict
+
+from .item import Item
+from .item_render import ItemRender
+from .equipment_item import EquipmentItem
+from .weapon import Weapon
+from .essence import Essence
+
+
+def project_equipment_list(query):
+    """
+    Narrow an equipment listing query (over EquipmentItem) to the columns of its list JSON.
+    Filters, joins and sorting already applied to the query are kept. ev is not part of the JSON but
+    is selected for the cursors of the EV sort order.
+    """
+    # Aliased so it never clashes with a weapons join the query already has (e.g. for stat=DPS)
+    weapons = Weapon.__table__.alias('list_weapons')
+    return query.with_entities(
+        EquipmentItem.key, EquipmentItem.name, EquipmentItem.base_ilvl, EquipmentItem.quality,
+        EquipmentItem.icon, EquipmentItem.item_type, EquipmentItem.slot, EquipmentItem.armour_type,
+        EquipmentItem.sockets_basic, EquipmentItem.sockets_primary, EquipmentItem.sockets_vital,
+        EquipmentItem.sockets_cloak, EquipmentItem.sockets_necklace, EquipmentItem.sockets_pvp,
+        EquipmentItem.ev, weapons.c.weapon_type, weapons.c.dps, ItemRender.list_json
+    ).outerjoin(weapons, weapons.c.key == EquipmentItem.key).outerjoin(
+        ItemRender, ItemRender.item_key == EquipmentItem.key
+    )
+
+
+def equipment_list_json(row) -> Dict:
+    """Build the list JSON of an equipment row from project_equipment_list."""
+    result = {
+        'key': row.key,
+        'name': row.name,
+        'quality': row.quality.value.upper(),
+        'icon_urls': Item.get_icon_urls(row.icon)
+    }
+    # Only weapons extend the base list representation
+    if row.item_type == 'weapon':
+        result.update({
+            'slot': row.slot,
+            'armour_type': row.armour_type,
+            'weapon_type': row.weapon_type,
+            'base_dps': row.dps,
+            'total_sockets': (row.sockets_basic + row.sockets_primary + row.sockets_vital +
+                              row.sockets_cloak + row.sockets_necklace + row.sockets_pvp)
+        })
+    return result
+
+
+def equipment_list_bytes(row) -> bytes:
+    """Get the encoded list JSON of an equipment row: the pre-rendered bytes, or rendered now."""
+    if row.list_json is not None:
+        return row.list_json
+    return ItemRender.serialize(equipment_list_json(row))
+
+
+def project_essence_list(query):
+    """Narrow an essence listing query (over Essence) to the columns of its list JSON."""
+    return query.with_entities(
+        Essence.key, Essence.name, Essence.base_ilvl, Essence.quality, Essence.icon, Essence.essence_type,
+        ItemRender.list_json
+    ).outerjoin(ItemRender, ItemRender.item_key == Essence.key)
+
+
+def essence_list_json(row) -> Dict:
+    """Build the list JSON of an essence row from project_essence_list."""
+    return {
+        'key': row.key,
+        'name': row.name,
+        'quality': row.quality.value.upper(),
+        'icon_urls': Item.get_icon_urls(row.icon),
+        'essence_type': row.essence_type,
+        'essence_type_name': Essence.get_essence_type_name(row.essence_type)
+    }
+
+
+def essence_list_bytes(row) -> bytes:
+    """Get the encoded list JSON of an essence row: the pre-rendered bytes, or rendered now."""
+    if row.list_json is not None:
+        return row.list_json
+    return ItemRender.serialize(essence_list_json(row))
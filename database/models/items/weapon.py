@@ -2,14 +2,16 @@
 Database model for weapon items.
 """
 from typing import Optional, Dict, TYPE_CHECKING
+import numpy as np
 from sqlalchemy import String, Integer, Float, ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, object_session
 
 from .equipment_item import EquipmentItem
-from .item_quality import ItemQuality
+from ...compiled import get_registry
 
 if TYPE_CHECKING:
     from ..dps import DpsTable
+    from ...compiled import CompiledDpsTable
 
 
 class Weapon(EquipmentItem):
@@ -40,6 +42,12 @@ class Weapon(EquipmentItem):
     def __repr__(self) -> str:
         return f"<Weapon(key={self.key}, name='{self.name}', weapon_type='{self.weapon_type}')>"
     
+    def _get_compiled_dps_table(self) -> Optional["CompiledDpsTable"]:
+        """Get this weapon's compiled DPS table from the registry, if it has one."""
+        if not self.dps_table_id:
+            return None
+        return get_registry(object_session(self)).get_dps_table(self.dps_table_id)
+    
     def get_dps_at_ilvl(self, ilvl: Optional[int] = None) -> Optional[float]:
         """
         Get the calculated DPS for this weapon at a specific item level.
@@ -48,10 +56,10 @@ class Weapon(EquipmentItem):
         if ilvl is None:
             ilvl = self.base_ilvl
             
-        if self.dps_table:
-            # Calculate DPS using the DPS table and weapon quality
-            quality_enum = ItemQuality(self.quality)
-            return self.dps_table.get_dps_at_level(ilvl, quality_enum)
+        dps_table = self._get_compiled_dps_table()
+        if dps_table:
+            # Calculate DPS using the compiled DPS table and weapon quality
+            return dps_table.get_dps_at_level(ilvl, self.quality)
         else:
             # Fall back to base DPS value
             return self.dps
@@ -122,4 +130,23 @@ class Weapon(EquipmentItem):
                 'value': calculated_dps
             })
         
-        return result 
\ No newline at end of file
+        return result
+    
+    def get_stats_curve_json(self, min_ilvl: int, max_ilvl: int) -> Dict:
+        """
+        Get concrete stats for this weapon across a range of item levels.
+        Extends the base get_stats_curve_json with the weapon DPS curve.
+        """
+        result = super().get_stats_curve_json(min_ilvl, max_ilvl)
+        
+        dps_table = self._get_compiled_dps_table()
+        if dps_table:
+            dps_values = dps_table.get_dps_at_levels(np.arange(min_ilvl, max_ilvl + 1), self.quality).tolist()
+        elif self.dps is not None:
+            dps_values = [self.dps] * (max_ilvl - min_ilvl + 1)
+        else:
+            return result
+        
+        result['stat_names'].append('DPS')
+        result['stat_values'].append(dps_values)
+        return result
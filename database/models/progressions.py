@@ -2,11 +2,13 @@
 Database models for progression tables.
 These tables map item levels to stat values, supporting both linear interpolation and array lookup.
 """
+import hashlib
 from enum import Enum
 from sqlalchemy import Column, Integer, String, Float, ForeignKey, UniqueConstraint, Enum as SQLEnum
-from sqlalchemy.orm import relationship, Mapped
+from sqlalchemy.orm import relationship, Mapped, object_session
 from .base import Base
-from typing import List, Optional
+from ..compiled import get_registry
+from typing import Iterable, List, Optional, Tuple
 from sqlalchemy.orm import mapped_column
 
 class ProgressionType(Enum):
@@ -23,29 +25,30 @@ class ProgressionTable(Base):
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     description: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
+    # Identical tables are interned: only the canonical table stores values, and every
+    # table with the same content points at it through canonical_id
+    content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True, index=True)
+    canonical_id: Mapped[Optional[str]] = mapped_column(ForeignKey("progression_tables.table_id"), nullable=True, index=True)
+    
     # For array type, we store exact values
     # For linear type, we store control points for interpolation
+    # (Empty for alias tables - see canonical_id)
     values: Mapped[List["ProgressionValue"]] = relationship("ProgressionValue", back_populates="table", cascade="all, delete-orphan")
     
+    @property
+    def is_alias(self) -> bool:
+        """Whether this table shares the values of another, identical table."""
+        return self.canonical_id is not None
+    
+    @staticmethod
+    def hash_points(progression_type: ProgressionType, points: Iterable[Tuple[int, float]]) -> str:
+        """Get a content hash identifying a table by its type and (item_level, value) points."""
+        content = ";".join(f"{level}:{value!r}" for level, value in sorted(points))
+        return hashlib.sha256(f"{progression_type.value}|{content}".encode()).hexdigest()
+    
     def get_value(self, item_level: int) -> float:
         """Get the value for a given item level using appropriate calculation method."""
-        if self.progression_type == ProgressionType.ARRAY:
-            # Direct lookup
-            value = self.values.filter_by(item_level=item_level).first()
-            return value.value if value else 0.0
-        else:  # LINEAR
-            # Find surrounding points for interpolation
-            lower = self.values.filter(ProgressionValue.item_level <= item_level).order_by(ProgressionValue.item_level.desc()).first()
-            upper = self.values.filter(ProgressionValue.item_level >= item_level).order_by(ProgressionValue.item_level.asc()).first()
-            
-            if not lower or not upper:
-                return 0.0
-            if lower.item_level == upper.item_level:
-                return lower.value
-                
-            # Linear interpolation
-            ratio = (item_level - lower.item_level) / (upper.item_level - lower.item_level)
-            return lower.value + (upper.value - lower.value) * ratio
+        return get_registry(object_session(self)).get_value(self.table_id, item_level)
 
     def __repr__(self):
         return f"<ProgressionTable(table_id='{self.table_id}', name='{self.name}')>"
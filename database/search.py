@@ -0,0 +1,103 @@
+"""
+Item name search.
+
+Two modes:
+- substring: case-insensitive `name ILIKE '%term%'`
+- fuzzy: substring matches plus names that contain a word similar to the term, ranked by
+  trigram word similarity, so typos like "braclet" still find "Bracelet"
+
+On PostgreSQL both modes are served by the pg_trgm GIN index on items.name (see migration
+c4d9e8a1f5b2); fuzzy matching uses the `<%` operator and word_similarity(). Other databases (the
+SQLite test and snapshot databases) get a Python implementation of word_similarity registered on
+the connection that runs the search, so the same queries return the same kind of results everywhere.
+"""
+import sqlite3
+from typing import List, Set
+
+from sqlalchemy import func, literal, or_, select
+
+SEARCH_MODES = ('substring', 'fuzzy')
+SEARCH_MODE_PATTERN = f"^({'|'.join(SEARCH_MODES)})$"
+
+# Minimum word similarity for a fuzzy match. pg_trgm's default (0.6) misses most single typos
+# in short words, so the `<%` operator's threshold is lowered to this for the transaction.
+WORD_SIMILARITY_THRESHOLD = 0.4
+
+
+def _trigrams(text: str) -> List[str]:
+    """Trigrams of a string in order, the way pg_trgm extracts them (words padded with spaces)."""
+    trigrams = []
+    word = []
+    for char in text.lower() + ' ':
+        if char.isalnum():
+            word.append(char)
+        elif word:
+            padded = '  ' + ''.join(word) + ' '
+            trigrams.extend(padded[i:i + 3] for i in range(len(padded) - 2))
+            word = []
+    return trigrams
+
+
+def word_similarity(term: str, text: str) -> float:
+    """
+    Python version of pg_trgm's word_similarity(term, text): the best trigram similarity between
+    the term and any continuous extent of the text.
+    """
+    if term is None or text is None:
+        return 0.0
+    term_trigrams: Set[str] = set(_trigrams(term))
+    if not term_trigrams:
+        return 0.0
+    text_trigrams = _trigrams(text)
+
+    # The best extent starts and ends on trigrams the term shares
+    shared_positions = [i for i, trigram in enumerate(text_trigrams) if trigram in term_trigrams]
+    best = 0.0
+    for start_index, start in enumerate(shared_positions):
+        for end in shared_positions[start_index:]:
+            extent = set(text_trigrams[start:end + 1])
+            shared = len(extent & term_trigrams)
+            best = max(best, shared / len(extent | term_trigrams))
+    return best
+
+
+def _is_postgresql(query) -> bool:
+    return query.session.get_bind().dialect.name == 'postgresql'
+
+
+def _register_sqlite_functions(query) -> None:
+    """Make word_similarity() available on the query's connection if it is SQLite."""
+    dbapi_connection = query.session.connection().connection.driver_connection
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        dbapi_connection.create_function("word_similarity", 2, word_similarity, deterministic=True)
+
+
+def filter_by_name(query, column, term: str, mode: str = 'substring'):
+    """
+    Filter a query to items whose name matches a search term.
+
+    Args:
+        query: ORM query to filter
+        column: Name column, e.g. EquipmentItem.name
+        term: Search term
+        mode: substring or fuzzy
+    """
+    substring = column.ilike(f"%{term.lower()}%")
+    if mode != 'fuzzy':
+        return query.filter(substring)
+    if _is_postgresql(query):
+        query.session.execute(select(func.set_config(
+            'pg_trgm.word_similarity_threshold', str(WORD_SIMILARITY_THRESHOLD), True
+        )))
+        similar = literal(term).op('<%')(column)
+    else:
+        _register_sqlite_functions(query)
+        similar = func.word_similarity(term, column) >= WORD_SIMILARITY_THRESHOLD
+    return query.filter(or_(substring, similar))
+
+
+def order_by_relevance(query, column, term: str, *tiebreakers):
+    """Sort a query by how well names match a search term, best matches first."""
+    if not _is_postgresql(query):
+        _register_sqlite_functions(query)
+    return query.order_by(func.word_similarity(term, column).desc(), *tiebreakers)
@@ -0,0 +1,39 @@
+"""Add item_stat_values table for materialized concrete stat values
+
+Revision ID: 1ec8d230c8ea
+Revises: e336f51dd809
+Create Date: 2026-10-17 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1ec8d230c8ea'
+down_revision: Union[str, None] = 'e336f51dd809'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('item_stat_values',
+    sa.Column('item_key', sa.Integer(), nullable=False),
+    sa.Column('stat_name', sa.String(length=50), nullable=False),
+    sa.Column('ilvl', sa.Integer(), nullable=False),
+    sa.Column('value', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['item_key'], ['items.key'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_key', 'stat_name', 'ilvl')
+    )
+    op.create_index('ix_item_stat_values_stat_ilvl_value', 'item_stat_values', ['stat_name', 'ilvl', 'value'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_item_stat_values_stat_ilvl_value', table_name='item_stat_values')
+    op.drop_table('item_stat_values')
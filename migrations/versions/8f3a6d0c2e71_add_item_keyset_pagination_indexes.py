@@ -0,0 +1,31 @@
+"""Add composite indexes for keyset pagination of item listings
+
+Revision ID: 8f3a6d0c2e71
+Revises: 5b7e2c91d4a3
+Create Date: 2026-10-17 12:08:36.154922
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a6d0c2e71'
+down_revision: Union[str, None] = '5b7e2c91d4a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # (key DESC) is served by the primary key
+    op.create_index('ix_items_name_key', 'items', ['name', 'key'], unique=False)
+    op.create_index('ix_items_base_ilvl_name_key', 'items', [sa.text('base_ilvl DESC'), 'name', 'key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_items_base_ilvl_name_key', table_name='items')
+    op.drop_index('ix_items_name_key', table_name='items')
@@ -0,0 +1,31 @@
+"""Record the materialized stat values ilvl band on data_version
+
+Revision ID: a6e3d9b4c7f1
+Revises: f2a8c5d3b1e4
+Create Date: 2026-10-17 17:08:45.912733
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6e3d9b4c7f1'
+down_revision: Union[str, None] = 'f2a8c5d3b1e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left NULL: the API interpolates every stat_ilvl until the next stat values import records its band
+    op.add_column('data_version', sa.Column('stat_values_min_ilvl', sa.Integer(), nullable=True))
+    op.add_column('data_version', sa.Column('stat_values_max_ilvl', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('data_version', 'stat_values_max_ilvl')
+    op.drop_column('data_version', 'stat_values_min_ilvl')
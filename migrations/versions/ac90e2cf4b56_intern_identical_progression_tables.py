@@ -0,0 +1,47 @@
+"""Intern identical progression tables by content hash
+
+Revision ID: ac90e2cf4b56
+Revises: 1ec8d230c8ea
+Create Date: 2026-10-17 10:03:17.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ac90e2cf4b56'
+down_revision: Union[str, None] = '1ec8d230c8ea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing tables keep NULL hashes (and their own values) until they are next imported
+    op.add_column('progression_tables', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    op.add_column('progression_tables', sa.Column('canonical_id', sa.String(length=50), nullable=True))
+    op.create_foreign_key(
+        'fk_progression_tables_canonical_id', 'progression_tables', 'progression_tables',
+        ['canonical_id'], ['table_id']
+    )
+    op.create_index(op.f('ix_progression_tables_content_hash'), 'progression_tables', ['content_hash'], unique=False)
+    op.create_index(op.f('ix_progression_tables_canonical_id'), 'progression_tables', ['canonical_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Give every alias table its own copy of its canonical table's values again
+    op.execute(
+        "INSERT INTO table_values (table_id, item_level, value, created_at, updated_at) "
+        "SELECT t.table_id, v.item_level, v.value, v.created_at, v.updated_at "
+        "FROM progression_tables t JOIN table_values v ON v.table_id = t.canonical_id "
+        "WHERE t.canonical_id IS NOT NULL"
+    )
+    op.drop_index(op.f('ix_progression_tables_canonical_id'), table_name='progression_tables')
+    op.drop_index(op.f('ix_progression_tables_content_hash'), table_name='progression_tables')
+    op.drop_constraint('fk_progression_tables_canonical_id', 'progression_tables', type_='foreignkey')
+    op.drop_column('progression_tables', 'canonical_id')
+    op.drop_column('progression_tables', 'content_hash')
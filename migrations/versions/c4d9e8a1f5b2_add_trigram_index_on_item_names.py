@@ -0,0 +1,33 @@
+"""Add pg_trgm GIN index on item names for substring and fuzzy search
+
+Revision ID: c4d9e8a1f5b2
+Revises: 8f3a6d0c2e71
+Create Date: 2026-10-17 12:47:02.661813
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4d9e8a1f5b2'
+down_revision: Union[str, None] = '8f3a6d0c2e71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves both name ILIKE '%term%' and the word similarity operator (<%)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index(
+        'ix_items_name_trgm', 'items', ['name'], unique=False,
+        postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_items_name_trgm', table_name='items')
+    # The pg_trgm extension is left installed - other objects may depend on it
@@ -0,0 +1,36 @@
+"""Add item_renders table of pre-rendered item JSON
+
+Revision ID: e7b1f4c2a9d6
+Revises: c4d9e8a1f5b2
+Create Date: 2026-10-17 13:41:19.507231
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b1f4c2a9d6'
+down_revision: Union[str, None] = 'c4d9e8a1f5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('item_renders',
+    sa.Column('item_key', sa.Integer(), nullable=False),
+    sa.Column('detail_json', sa.LargeBinary(), nullable=False),
+    sa.Column('list_json', sa.LargeBinary(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['item_key'], ['items.key'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('item_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('item_renders')
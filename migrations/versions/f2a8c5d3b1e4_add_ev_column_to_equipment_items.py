@@ -0,0 +1,31 @@
+"""Add precomputed essence value (ev) column to equipment_items
+
+Revision ID: f2a8c5d3b1e4
+Revises: e7b1f4c2a9d6
+Create Date: 2026-10-17 14:52:37.218406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8c5d3b1e4'
+down_revision: Union[str, None] = 'e7b1f4c2a9d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing rows start at 0 until the next import (or --import-type ev-values) computes them
+    op.add_column('equipment_items', sa.Column('ev', sa.Float(), server_default='0', nullable=False))
+    op.create_index('ix_equipment_items_ev_key', 'equipment_items', ['ev', 'key'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_equipment_items_ev_key', table_name='equipment_items')
+    op.drop_column('equipment_items', 'ev')
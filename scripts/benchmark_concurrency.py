@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for a running LOTRO Forge server.
+
+Keeps a fixed number of connections busy with requests to one or more URLs and reports the latency
+distribution, to check that a slow request does not stall the others (handlers must not block the
+event loop). The default of 25 connections matches the fly.io hard_limit.
+
+Example:
+    python scripts/benchmark_concurrency.py --cookie <auth_session_token> \\
+        /api/data/equipment/?limit=99 /api/data/items/1879049233
+
+Comparing two builds (e.g. before and after a change to how handlers run) only means something against
+the deployed backend, PostgreSQL: in-process SQLite is CPU-bound, so it cannot show handlers overlapping
+their waits on the database. Run each build against the same PostgreSQL database and request mix, with a
+warmup so compiling the in-memory tables is not counted, and save the first run to compare the second with:
+    python scripts/benchmark_concurrency.py --warmup 200 --save before.json <paths>
+    python scripts/benchmark_concurrency.py --warmup 200 --compare before.json --save after.json <paths>
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+import httpx
+
+# Cookie holding the auth session token (see web/middleware/auth.py)
+AUTH_SESSION_COOKIE_NAME = "auth_session_token"
+
+# Reported latency percentiles
+PERCENTILES = (('p50', 0.50), ('p90', 0.90), ('p99', 0.99))
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(sorted_values: List[float]) -> Dict[str, float]:
+    """Latency statistics of already sorted values, in milliseconds."""
+    stats = {'mean': statistics.mean(sorted_values)}
+    stats.update({name: percentile(sorted_values, fraction) for name, fraction in PERCENTILES})
+    stats['max'] = sorted_values[-1]
+    return {name: value * 1e3 for name, value in stats.items()}
+
+
+async def run(base_url: str, paths, connections: int, total: int, cookie: str, warmup: int = 0,
+              timeout: float = 60.0):
+    """
+    Send total requests over a pool of connections, after warmup requests that are not measured.
+    A request that fails or times out counts as an error, with its latency up to the failure.
+
+    Returns:
+        (latencies by path, errors, seconds)
+    """
+    latencies = {path: [] for path in paths}
+    errors = 0
+    next_request = 0
+    measured = total
+
+    cookies = {AUTH_SESSION_COOKIE_NAME: cookie} if cookie else None
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=base_url, cookies=cookies, limits=limits, timeout=timeout) as client:
+
+        async def worker():
+            nonlocal next_request, errors
+            while next_request < total:
+                path = paths[next_request % len(paths)]
+                next_request += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    failed = response.status_code != 200
+                except httpx.HTTPError:
+                    failed = True
+                latencies[path].append(time.perf_counter() - started)
+                if failed:
+                    errors += 1
+
+        if warmup:
+            # Same request mix, so every path's caches are warm before measuring
+            total, next_request = warmup, 0
+            await asyncio.gather(*(worker() for _ in range(connections)))
+            latencies = {path: [] for path in paths}
+            errors, next_request, total = 0, 0, measured
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(connections)))
+        return latencies, errors, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure request latency under concurrent connections')
+    parser.add_argument('paths', nargs='+', help='Paths to request in turn, e.g. /api/data/equipment/')
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000', help='Server base URL')
+    parser.add_argument('--connections', type=int, default=25, help='Simultaneous connections')
+    parser.add_argument('--requests', type=int, default=2000, help='Total number of requests')
+    parser.add_argument('--cookie', help='Auth session token for the protected /api/data routes')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Seconds before a request counts as failed')
+    parser.add_argument('--warmup', type=int, default=0, help='Requests to send before measuring')
+    parser.add_argument('--save', help='Write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON file of an earlier run to compare p99 latencies with')
+    args = parser.parse_args()
+
+    latencies, errors, seconds = asyncio.run(
+        run(args.base_url, args.paths, args.connections, args.requests, args.cookie, args.warmup, args.timeout)
+    )
+    every = sorted(latency for path_latencies in latencies.values() for latency in path_latencies)
+    print(f"{len(every)} requests over {args.connections} connections in {seconds:.2f} s "
+          f"({len(every) / seconds:.0f} req/s, {errors} failed or non-200)")
+
+    # Overall, then per path so fast requests stuck behind slow ones stand out
+    rows = {'all': summarize(every)}
+    if len(args.paths) > 1:
+        rows.update({path: summarize(sorted(values)) for path, values in latencies.items() if values})
+    columns = ['mean', *(name for name, _ in PERCENTILES), 'max']
+    print(f"  {'':<50} " + " ".join(f"{name:>9}" for name in columns))
+    for label, stats in rows.items():
+        print(f"  {label[:50]:<50} " + " ".join(f"{stats[name]:7.1f}ms" for name in columns))
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as results_file:
+            before = json.load(results_file)['latencies']
+        print(f"\n  p99 compared with {args.compare}")
+        for label, stats in rows.items():
+            if label in before:
+                p99_before, p99_after = before[label]['p99'], stats['p99']
+                print(f"  {label[:50]:<50} {p99_before:7.1f}ms -> {p99_after:7.1f}ms "
+                      f"({(p99_after - p99_before) / p99_before:+.0%})")
+
+    if args.save:
+        results = {
+            'base_url': args.base_url, 'paths': args.paths, 'connections': args.connections,
+            'requests': len(every), 'warmup': args.warmup, 'seconds': seconds, 'errors': errors,
+            'latencies': rows
+        }
+        with open(args.save, 'w', encoding='utf-8') as results_file:
+            json.dump(results, results_file, indent=2)
+
+if __name__ == "__main__":
+    main()
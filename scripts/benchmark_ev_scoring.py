@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark for scoring the equipment catalog by essence value (EV).
+
+Compares, over a synthetic catalog, scoring every item at one item level:
+- per item: a stat dict list per item, scored with EVCalculator.calculate_equipment_ev
+- batch: EquipmentStatMatrix values times the stat weights (EVCalculator.score_equipment)
+
+Runs against an in-memory SQLite database, so no .env or PostgreSQL is needed.
+"""
+import sys
+import argparse
+import random
+import timeit
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from database.compiled.equipment import SOCKET_TYPES
+from database.compiled import EquipmentStatMatrix, EssenceReference, EVCalculator, progression_registry
+from database.models import (
+    Base, EquipmentItem, Essence, ItemQuality, ItemStat, ProgressionTable, ProgressionType, ProgressionValue
+)
+
+STATS = ['MIGHT', 'AGILITY', 'VITALITY', 'WILL', 'FATE', 'CRITICAL_RATING', 'FINESSE', 'PHYSICAL_MASTERY',
+         'TACTICAL_MASTERY', 'PHYSICAL_MITIGATION', 'TACTICAL_MITIGATION', 'ARMOUR']
+SLOTS = ['HEAD', 'CHEST', 'HANDS', 'LEGS', 'FEET', 'SHOULDER', 'BACK', 'FINGER', 'EAR', 'NECK']
+
+
+def build_database(items: int, tables: int):
+    """Create an in-memory database of equipment with 4-8 stats each, plus reference essences."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    for index in range(tables):
+        table_id = f"t{index}"
+        session.add(ProgressionTable(table_id=table_id, progression_type=ProgressionType.LINEAR))
+        session.add_all(
+            ProgressionValue(table_id=table_id, item_level=level, value=random.uniform(10, 50) * level / 100)
+            for level in range(400, 601, 10)
+        )
+
+    for key, stat_name in enumerate(STATS[:-1], start=1):
+        name = "Supplemental" if stat_name in ('VITALITY', 'FATE') else "Vivid"
+        ilvl = 508 if name == "Supplemental" else 532
+        session.add(Essence(key=key, name=f"{name} Essence of {stat_name.title()}", base_ilvl=ilvl, quality=ItemQuality.RARE))
+        session.add(ItemStat(item_key=key, stat_name=stat_name, value_table_id=f"t{key}", order=0))
+
+    for key in range(1000, 1000 + items):
+        session.add(EquipmentItem(
+            key=key, name=f"Item {key}", base_ilvl=random.randint(450, 550), quality=ItemQuality.RARE,
+            slot=random.choice(SLOTS), sockets_basic=random.randint(0, 2), sockets_vital=random.randint(0, 1)
+        ))
+        for order, stat_name in enumerate(random.sample(STATS, random.randint(4, 8))):
+            session.add(ItemStat(item_key=key, stat_name=stat_name, value_table_id=f"t{random.randrange(tables)}", order=order))
+    session.commit()
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark catalog-wide EV scoring')
+    parser.add_argument('--items', type=int, default=5000, help='Number of equipment items')
+    parser.add_argument('--tables', type=int, default=200, help='Number of distinct progression tables')
+    parser.add_argument('--ilvl', type=int, default=520, help='Item level to score at')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of catalog scorings per path')
+    args = parser.parse_args()
+
+    random.seed(0)
+    session = build_database(args.items, args.tables)
+    progression_registry.rebuild(session)
+    calculator = EVCalculator(EssenceReference.load(session, progression_registry))
+    matrix = EquipmentStatMatrix.load(session, progression_registry)
+
+    # What scoring item by item works from: each item's (stat, table) list and socket summary
+    stats_by_key = {}
+    for item_key, stat_name, table_id in session.query(ItemStat.item_key, ItemStat.stat_name, ItemStat.value_table_id):
+        stats_by_key.setdefault(item_key, []).append((stat_name, table_id))
+    sockets = [dict(zip(SOCKET_TYPES, row)) for row in matrix.sockets.tolist()]
+
+    def per_item():
+        return [
+            calculator.calculate_equipment_ev(
+                [{'stat_name': name, 'value': progression_registry.get_value(table_id, args.ilvl)}
+                 for name, table_id in stats_by_key.get(key, ())],
+                socket_summary
+            )
+            for key, socket_summary in zip(matrix.keys.tolist(), sockets)
+        ]
+
+    def batch():
+        return calculator.score_equipment(matrix, args.ilvl)
+
+    # Both paths must produce the same scores before timing them
+    assert np.allclose(per_item(), batch())
+
+    timings = {
+        'per item': timeit.timeit(per_item, number=args.repeat),
+        'batch (matrix)': timeit.timeit(batch, number=args.repeat),
+    }
+
+    print(f"{args.items}-item catalog, {len(matrix.stat_names)} stats, {args.repeat} scorings per path")
+    for name, seconds in timings.items():
+        print(f"  {name:<16} {seconds * 1e3 / args.repeat:8.2f} ms/catalog")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for building equipment list pages.
+
+Compares, over a synthetic catalog of armour and weapons:
+- ORM: query(EquipmentItem) hydrating polymorphic objects, then to_list_json (weapon columns are
+  lazy-loaded per weapon row, as in the previous list path)
+- projection: project_equipment_list rows turned into JSON by equipment_list_json
+
+Runs against an in-memory SQLite database, so no .env or PostgreSQL is needed.
+"""
+import sys
+import argparse
+import random
+import timeit
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from database.models import Base, EquipmentItem, ItemQuality, Weapon
+from database.models.items import equipment_list_json, project_equipment_list
+
+QUALITIES = list(ItemQuality)
+
+
+def build_database(items: int):
+    """Create an in-memory database with a mix of armour (two thirds) and weapons."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    for key in range(1, items + 1):
+        common = dict(
+            key=key, name=f"Item {key}", base_ilvl=random.randint(400, 550),
+            quality=random.choice(QUALITIES), icon=f"{key}-{key + 1}",
+            sockets_basic=random.randint(0, 2), sockets_vital=random.randint(0, 1)
+        )
+        if key % 3:
+            session.add(EquipmentItem(slot="CHEST", armour_type="HEAVY", **common))
+        else:
+            session.add(Weapon(slot="MAIN_HAND", weapon_type="ONE_HANDED_SWORD", dps=random.uniform(10, 100), **common))
+    session.commit()
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark equipment list page building')
+    parser.add_argument('--items', type=int, default=5000, help='Number of items in the catalog')
+    parser.add_argument('--page', type=int, default=99, help='Items per page')
+    parser.add_argument('--repeat', type=int, default=50, help='Number of pages built per path')
+    args = parser.parse_args()
+
+    random.seed(0)
+    session = build_database(args.items)
+
+    def orm_page():
+        session.expunge_all()  # A request starts with an empty identity map
+        query = session.query(EquipmentItem).order_by(EquipmentItem.key.desc()).limit(args.page)
+        return [item.to_list_json() for item in query]
+
+    def projection_page():
+        query = project_equipment_list(session.query(EquipmentItem)).order_by(EquipmentItem.key.desc()).limit(args.page)
+        return [equipment_list_json(row) for row in query]
+
+    # Both paths must produce the same JSON before timing them
+    assert orm_page() == projection_page()
+
+    timings = {
+        'ORM + to_list_json': timeit.timeit(orm_page, number=args.repeat),
+        'projection': timeit.timeit(projection_page, number=args.repeat),
+    }
+
+    rows = args.repeat * args.page
+    print(f"{args.items}-item catalog, {args.repeat} pages of {args.page} items per path")
+    for name, seconds in timings.items():
+        print(f"  {name:<20} {rows / seconds:10.0f} rows/s  {seconds * 1e3 / args.repeat:7.2f} ms/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for progression table evaluation.
+
+Compares, over a synthetic LINEAR table:
+- neighbour search: the previous read path, which finds the points below and above the item level
+  and interpolates between them
+- ItemStat.get_value: one item level at a time through the compiled registry
+- CompiledProgression.get_value: one item level at a time on the segment arrays
+- CompiledProgression.get_values: every item level in one vectorised call
+
+Runs against an in-memory SQLite database, so no .env or PostgreSQL is needed.
+"""
+import sys
+import argparse
+import random
+import timeit
+from bisect import bisect_left
+from pathlib import Path
+
+import numpy as np
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from database.models import Base, EquipmentItem, ItemQuality, ItemStat, ProgressionTable, ProgressionType, ProgressionValue
+from database.compiled import get_registry
+
+
+def neighbour_search_value(levels, values, item_level):
+    """Interpolate by searching for the lower and upper neighbouring points (the previous algorithm)."""
+    index = bisect_left(levels, item_level)
+    if index < len(levels) and levels[index] == item_level:
+        return values[index]
+    if index == 0 or index == len(levels):
+        return 0.0
+    lower_level, upper_level = levels[index - 1], levels[index]
+    lower_value, upper_value = values[index - 1], values[index]
+    return lower_value + (upper_value - lower_value) * (item_level - lower_level) / (upper_level - lower_level)
+
+
+def build_database(points: int):
+    """Create an in-memory database with one item whose stat uses a table of the given size."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+
+    levels = sorted(random.sample(range(1, 1000), points))
+    session.add(ProgressionTable(table_id="bench", progression_type=ProgressionType.LINEAR))
+    session.add_all(
+        ProgressionValue(table_id="bench", item_level=level, value=random.uniform(0, 10000))
+        for level in levels
+    )
+    session.add(EquipmentItem(key=1, name="Benchmark Ring", base_ilvl=500, quality=ItemQuality.RARE, slot="FINGER"))
+    session.add(ItemStat(item_key=1, stat_name="MIGHT", value_table_id="bench", order=0))
+    session.commit()
+    return session
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark progression table evaluation')
+    parser.add_argument('--points', type=int, default=40, help='Number of points in the table')
+    parser.add_argument('--repeat', type=int, default=200, help='Number of passes over the item level range')
+    args = parser.parse_args()
+
+    random.seed(0)
+    session = build_database(args.points)
+    stat = session.get(ItemStat, (1, "MIGHT"))
+    table = get_registry(session).get_progression("bench")
+    ilvl_list = list(range(1, 1000))
+    ilvls = np.arange(1, 1000)
+
+    # All three paths must agree before timing them
+    reference = [neighbour_search_value(table.levels, table.values, ilvl) for ilvl in ilvl_list]
+    assert np.allclose(reference, [stat.get_value(ilvl) for ilvl in ilvl_list])
+    assert np.allclose(reference, table.get_values(ilvls))
+
+    timings = {
+        'neighbour search': timeit.timeit(
+            lambda: [neighbour_search_value(table.levels, table.values, ilvl) for ilvl in ilvl_list],
+            number=args.repeat
+        ),
+        'ItemStat.get_value': timeit.timeit(
+            lambda: [stat.get_value(ilvl) for ilvl in ilvl_list],
+            number=args.repeat
+        ),
+        'get_value (segments)': timeit.timeit(
+            lambda: [table.get_value(ilvl) for ilvl in ilvl_list],
+            number=args.repeat
+        ),
+        'get_values (vectorised)': timeit.timeit(
+            lambda: table.get_values(ilvls),
+            number=args.repeat
+        ),
+    }
+
+    evaluations = args.repeat * len(ilvl_list)
+    print(f"{args.points}-point LINEAR table, {evaluations} evaluations per method")
+    for name, seconds in timings.items():
+        print(f"  {name:<25} {seconds * 1e9 / evaluations:8.1f} ns/ilvl")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark for encoding a data API list page.
+
+Compares, for one equipment list page:
+- FastAPI default: jsonable_encoder over the response dict, then JSONResponse (json.dumps)
+- orjson: a single orjson.dumps pass, as DataJSONResponse does
+
+Runs against an in-memory SQLite database, so no .env or PostgreSQL is needed.
+"""
+import sys
+import argparse
+import random
+import timeit
+from pathlib import Path
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from database.models import EquipmentItem
+from database.models.items import equipment_list_json, project_equipment_list
+from benchmark_list_projection import build_database
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark data API response encoding')
+    parser.add_argument('--page', type=int, default=99, help='Items per page')
+    parser.add_argument('--repeat', type=int, default=2000, help='Number of pages encoded per path')
+    args = parser.parse_args()
+
+    random.seed(0)
+    session = build_database(args.page * 3)
+    rows = project_equipment_list(session.query(EquipmentItem)).order_by(EquipmentItem.key.desc()).limit(args.page)
+    page = {
+        "result": [equipment_list_json(row) for row in rows],
+        "total": args.page * 3,
+        "total_is_estimate": False,
+        "limit": args.page,
+        "skip": 0,
+        "has_more": True,
+        "next_cursor": "eyJzIjoicmVjZW50IiwidiI6WzIwMV19"
+    }
+
+    def fastapi_default():
+        return JSONResponse(jsonable_encoder(page)).body
+
+    def orjson_response():
+        return orjson.dumps(page, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    # Both paths must encode the same document before timing them
+    assert orjson.loads(fastapi_default()) == orjson.loads(orjson_response())
+
+    timings = {
+        'jsonable_encoder + json': timeit.timeit(fastapi_default, number=args.repeat),
+        'orjson': timeit.timeit(orjson_response, number=args.repeat),
+    }
+
+    print(f"{args.page}-item equipment page ({len(orjson_response())} bytes), {args.repeat} encodings per path")
+    for name, seconds in timings.items():
+        print(f"  {name:<25} {seconds * 1e6 / args.repeat:8.1f} us/page")
+
+
+if __name__ == "__main__":
+    main()
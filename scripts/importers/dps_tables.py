@@ -11,6 +11,8 @@ from lxml import etree
 from sqlalchemy.orm import Session
 
 from database.models.dps import DpsTable, DpsValue
+from database.models.data_version import DataVersion
+from database.compiled import progression_registry
 from .base import BaseImporter
 
 
@@ -26,6 +28,7 @@ class DpsTablesImporter(BaseImporter):
         """
         super().__init__(source_path, db_session)
         self.dps_tables_file = source_path  # source_path is now the direct path to dpsTables.xml
+        self.imported_table_ids: set[str] = set()  # Tables written by this importer
     
     def parse_source(self) -> List[Dict]:
         """Parse dpsTables.xml into DPS table data."""
@@ -133,6 +136,7 @@ class DpsTablesImporter(BaseImporter):
                     self.db.add(dps_value)
                 
                 imported_count += 1
+                self.imported_table_ids.add(table_data['id'])
                 if imported_count % 100 == 0:
                     logging.info(f"Imported {imported_count} DPS tables so far...")
                     
@@ -140,7 +144,9 @@ class DpsTablesImporter(BaseImporter):
                 logging.error(f"Error importing DPS table {table_data['id']}: {e}")
                 raise
         
+        DataVersion.bump(self.db)
         self.db.commit()
+        progression_registry.invalidate()
         logging.info(f"Successfully imported {imported_count} DPS tables")
     
     def run(self) -> None:
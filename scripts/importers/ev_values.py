@@ -0,0 +1,59 @@
+"""
+Import stage that precomputes equipment essence values (EV).
+
+Once items, essences and progression tables are in the database, this stage scores every
+equipment item at its base item level with EVCalculator, using the default EV profile, and stores
+the result in equipment_items.ev, so the API can sort and filter by EV in SQL across the whole
+catalog.
+
+EV is relative to the reference essences, so a change to any essence or progression table can
+change every item's score - the stage always refreshes all equipment.
+"""
+import logging
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from database.compiled import EquipmentStatMatrix, EssenceReference, EVCalculator, progression_registry
+from database.models.items import EquipmentItem
+
+
+class EVValuesImporter:
+    """Precomputes the essence value of every equipment item at its base item level."""
+
+    # Rows sent per UPDATE
+    UPDATE_BATCH_SIZE = 1000
+
+    def __init__(self, db_session: Session):
+        """Initialize the stage.
+
+        Args:
+            db_session: Database session
+        """
+        self.db = db_session
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def refresh(self) -> int:
+        """Recompute the EV of every equipment item.
+
+        Returns:
+            int: Number of items scored
+        """
+        # Compile tables from this session so uncommitted import changes are included
+        self.db.flush()
+        progression_registry.rebuild(self.db)
+        self.logger.info("Computing equipment essence values...")
+
+        # Score the whole catalog at once against the essences in this session (not the
+        # process-wide reference table, which only sees committed data)
+        matrix = EquipmentStatMatrix.load(self.db, progression_registry)
+        calculator = EVCalculator(EssenceReference.load(self.db, progression_registry))
+        scores = calculator.score_equipment(matrix, matrix.base_ilvls)
+        rows = [{'key': key, 'ev': ev} for key, ev in zip(matrix.keys.tolist(), scores.tolist())]
+
+        # Bulk UPDATE by primary key - the scored items are not loaded as ORM objects
+        for start in range(0, len(rows), self.UPDATE_BATCH_SIZE):
+            self.db.execute(update(EquipmentItem), rows[start:start + self.UPDATE_BATCH_SIZE])
+
+        self.logger.info(f"Computed essence values of {len(rows)} items")
+        return len(rows)
@@ -0,0 +1,69 @@
+"""
+Import stage that pre-renders item JSON.
+
+Once items and their stats are in the database, this stage serializes each item's detail and list
+representations into item_renders, so the API can serve them without rebuilding them per request.
+It can refresh everything, or only the items written by an import.
+"""
+import logging
+from typing import Iterable, Iterator, List, Optional, Set
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from database.models.items import Item, ItemRender, item_detail_options, polymorphic_item
+
+
+class ItemRendersImporter:
+    """Pre-renders the JSON representations of items."""
+
+    # Items loaded and rendered per batch
+    KEY_BATCH_SIZE = 1000
+
+    def __init__(self, db_session: Session):
+        """Initialize the stage.
+
+        Args:
+            db_session: Database session
+        """
+        self.db = db_session
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _chunks(self, keys: Iterable[int]) -> Iterator[List[int]]:
+        """Split keys into lists small enough for an IN (...) clause."""
+        keys = sorted(keys)
+        for start in range(0, len(keys), self.KEY_BATCH_SIZE):
+            yield keys[start:start + self.KEY_BATCH_SIZE]
+
+    def refresh(self, item_keys: Optional[Set[int]] = None) -> int:
+        """Re-render items.
+
+        Args:
+            item_keys: Items to re-render; None re-renders every item
+
+        Returns:
+            int: Number of items rendered
+        """
+        # Render from this session so uncommitted import changes are included
+        self.db.flush()
+
+        if item_keys is None:
+            self.logger.info("Rendering all items...")
+            self.db.execute(delete(ItemRender))
+            item_keys = set(self.db.scalars(select(Item.key)))
+        else:
+            self.logger.info(f"Rendering {len(item_keys)} items...")
+
+        entity = polymorphic_item()
+        written = 0
+        for chunk in self._chunks(item_keys):
+            items = self.db.scalars(
+                select(entity).options(*item_detail_options(entity)).where(entity.key.in_(chunk))
+            ).all()
+            self.db.execute(delete(ItemRender).where(ItemRender.item_key.in_(chunk)))
+            if items:
+                self.db.execute(insert(ItemRender), [ItemRender.render(item) for item in items])
+            written += len(items)
+
+        self.logger.info(f"Rendered {written} items")
+        return written
@@ -53,6 +53,8 @@ class ItemImporter(BaseImporter):
         self.skip_filters = skip_filters
         self.required_icons = set()  # Track unique icon IDs needed
         self.dps_tables_path = dps_tables_path
+        self.imported_item_keys: Set[int] = set()  # Items written by this importer
+        self.imported_dps_table_ids: Set[str] = set()  # DPS tables written by this importer
         
     def validate_source(self) -> bool:
         """Validate that items.xml exists and has the expected structure."""
@@ -304,6 +306,9 @@ class ItemImporter(BaseImporter):
                     # Add new stat
                     self.db.add(stat)
             
+            self.imported_item_keys.update(item.key for item in equipment_items)
+            self.imported_item_keys.update(essence.key for essence in essences)
+            
             self.logger.info(f"Successfully imported {len(equipment_items)} equipment items, {len(essences)} essences, and {len(item_stats)} stats")
             
         except Exception as e:
@@ -404,6 +409,7 @@ class ItemImporter(BaseImporter):
             
             if required_dps_data:
                 dps_importer.import_data(required_dps_data)
+                self.imported_dps_table_ids.update(dps_importer.imported_table_ids)
                 self.logger.info(f"Successfully imported {len(required_dps_data)} DPS tables")
             else:
                 self.logger.warning(f"None of the required DPS tables were found in {self.dps_tables_path}")
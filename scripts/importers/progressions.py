@@ -2,12 +2,15 @@
 Importer for progression tables from XML data.
 """
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from xml.etree import ElementTree
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from database.models.progressions import ProgressionTable, ProgressionValue, ProgressionType
+from database.compiled import progression_registry
 from scripts.importers.base import BaseImporter
 
 class ProgressionsImporter(BaseImporter):
@@ -22,6 +25,7 @@ class ProgressionsImporter(BaseImporter):
         """
         super().__init__(source_path, db_session)
         self.progressions_file = source_path  # source_path is now the direct path to progressions.xml
+        self.imported_table_ids: set[str] = set()  # Tables written by this importer
         
     def _validate_table(self, table_elem: ElementTree.Element, required_table_ids: set[str] = None) -> bool:
         """Validate a single progression table element.
@@ -191,11 +195,16 @@ class ProgressionsImporter(BaseImporter):
         
         for table_id, table_data in data.items():
             # Create table model
+            progression_type = ProgressionType(table_data['type'])
             table = ProgressionTable(
                 table_id=table_id,
-                progression_type=ProgressionType(table_data['type']),
+                progression_type=progression_type,
                 name=table_data.get('name'),
-                description=table_data.get('description')
+                description=table_data.get('description'),
+                content_hash=ProgressionTable.hash_points(
+                    progression_type,
+                    ((value_data['level'], value_data['value']) for value_data in table_data['values'])
+                )
             )
             tables.append(table)
             
@@ -210,32 +219,128 @@ class ProgressionsImporter(BaseImporter):
         
         return tables, values
     
+    def _intern_tables(self, tables: List[ProgressionTable]) -> None:
+        """Point each incoming table at the canonical table for its content hash.
+        
+        Sets canonical_id on every incoming table (None when it is canonical itself). Stored tables
+        that alias an incoming table stay valid: if the incoming table's content changed they are
+        re-homed onto a copy of the old values, otherwise they follow it to its new canonical table.
+        
+        Args:
+            tables: Incoming tables with content_hash set
+        """
+        incoming = {table.table_id: table for table in tables}
+        
+        # Current hashes of the incoming tables, and stored tables that alias one of them
+        stored_hashes = dict(self.db.execute(
+            select(ProgressionTable.table_id, ProgressionTable.content_hash)
+            .where(ProgressionTable.table_id.in_(incoming))
+        ).all())
+        dependents: Dict[str, List[str]] = defaultdict(list)
+        for table_id, canonical_id in self.db.execute(
+            select(ProgressionTable.table_id, ProgressionTable.canonical_id)
+            .where(ProgressionTable.canonical_id.in_(incoming))
+        ):
+            if table_id not in incoming:
+                dependents[canonical_id].append(table_id)
+        
+        # Stored canonical tables for the incoming hashes that this import leaves untouched
+        canonical_by_hash: Dict[str, str] = {}
+        for table_id, content_hash in self.db.execute(
+            select(ProgressionTable.table_id, ProgressionTable.content_hash).where(
+                ProgressionTable.content_hash.in_({table.content_hash for table in tables}),
+                ProgressionTable.canonical_id.is_(None)
+            ).order_by(ProgressionTable.table_id)
+        ):
+            if table_id not in incoming:
+                canonical_by_hash.setdefault(content_hash, table_id)
+        
+        # Re-home aliases of tables whose content is changing, before their old values are deleted
+        for old_canonical_id, alias_ids in dependents.items():
+            old_hash = stored_hashes.get(old_canonical_id)
+            if old_hash == incoming[old_canonical_id].content_hash:
+                continue
+            
+            new_canonical_id = canonical_by_hash.get(old_hash)
+            if new_canonical_id is None:
+                # Promote the first alias to canonical and give it a copy of the old values
+                new_canonical_id = min(alias_ids)
+                for item_level, value in self.db.execute(
+                    select(ProgressionValue.item_level, ProgressionValue.value)
+                    .where(ProgressionValue.table_id == old_canonical_id)
+                ).all():
+                    self.db.add(ProgressionValue(table_id=new_canonical_id, item_level=item_level, value=value))
+                if old_hash is not None:
+                    canonical_by_hash[old_hash] = new_canonical_id
+            
+            self.db.execute(
+                update(ProgressionTable).where(ProgressionTable.table_id.in_(alias_ids))
+                .values(canonical_id=new_canonical_id)
+            )
+            self.db.execute(
+                update(ProgressionTable).where(ProgressionTable.table_id == new_canonical_id)
+                .values(canonical_id=None)
+            )
+        
+        # Intern the incoming tables - the first table seen for a hash becomes canonical
+        for table in sorted(tables, key=lambda t: t.table_id):
+            canonical_id = canonical_by_hash.setdefault(table.content_hash, table.table_id)
+            table.canonical_id = None if canonical_id == table.table_id else canonical_id
+        
+        # Aliases of unchanged tables follow them to their (possibly new) canonical table
+        for old_canonical_id, alias_ids in dependents.items():
+            table = incoming[old_canonical_id]
+            if stored_hashes.get(old_canonical_id) != table.content_hash or not table.is_alias:
+                continue
+            self.db.execute(
+                update(ProgressionTable).where(ProgressionTable.table_id.in_(alias_ids))
+                .values(canonical_id=table.canonical_id)
+            )
+    
     def import_data(self, data: Tuple[List[ProgressionTable], List[ProgressionValue]]) -> None:
-        """Import the transformed data into the database."""
+        """Import the transformed data into the database, interning identical tables."""
         tables, values = data
         try:
-            # Update or insert tables
-            for table in tables:
-                existing = self.db.query(ProgressionTable).filter_by(table_id=table.table_id).first()
-                if existing:
-                    # Update existing table
-                    existing.progression_type = table.progression_type
-                    existing.name = table.name
-                    existing.description = table.description
-                else:
-                    # Insert new table
-                    self.db.add(table)
+            self._intern_tables(tables)
+            
+            # Update or insert tables - canonical tables first so aliases can reference them
+            canonical_tables = [table for table in tables if not table.is_alias]
+            alias_tables = [table for table in tables if table.is_alias]
+            for batch in (canonical_tables, alias_tables):
+                for table in batch:
+                    existing = self.db.query(ProgressionTable).filter_by(table_id=table.table_id).first()
+                    if existing:
+                        # Update existing table
+                        existing.progression_type = table.progression_type
+                        existing.name = table.name
+                        existing.description = table.description
+                        existing.content_hash = table.content_hash
+                        existing.canonical_id = table.canonical_id
+                    else:
+                        # Insert new table
+                        self.db.add(table)
+                self.db.flush()
             
             # Update values
             for table in tables:
                 # Remove existing values
                 self.db.query(ProgressionValue).filter_by(table_id=table.table_id).delete()
             
-            # Add new values
-            for value in values:
+            # Add new values - only canonical tables store them
+            canonical_ids = {table.table_id for table in canonical_tables}
+            stored_values = [value for value in values if value.table_id in canonical_ids]
+            for value in stored_values:
                 self.db.add(value)
             
-            self.logger.info(f"Successfully imported {len(tables)} tables and {len(values)} values")
+            self.imported_table_ids.update(table.table_id for table in tables)
+            
+            # Compiled tables in this process are now stale
+            progression_registry.invalidate()
+            
+            self.logger.info(
+                f"Successfully imported {len(tables)} tables ({len(canonical_tables)} unique curves) "
+                f"and {len(stored_values)} values"
+            )
             
         except Exception as e:
             self.logger.error(f"Import failed: {str(e)}")
@@ -4,6 +4,9 @@ Script to run the data import process.
 This script handles importing LOTRO data with intelligent dependency management:
 - 'items': Imports equipment items along with required progression tables and icons
 - 'progressions': Imports only progression tables (for development/testing)
+- 'stat-values': Rebuilds the materialized item stat values only (e.g. after changing the ilvl band)
+- 'item-renders': Re-renders the stored item JSON only (e.g. after changing an item's to_json)
+- 'ev-values': Recomputes the stored equipment essence values only (e.g. after changing EVCalculator)
 
 Items cannot function without their progression tables (for stat calculations) and 
 icons (for display), so these dependencies are automatically included when importing items.
@@ -25,8 +28,14 @@ from database.models.base import Base
 from database.config import get_database_url
 from scripts.importers.progressions import ProgressionsImporter
 from scripts.importers.items import ItemImporter
+from scripts.importers.stat_values import StatValuesImporter
+from scripts.importers.item_renders import ItemRendersImporter
+from scripts.importers.ev_values import EVValuesImporter
+from database.models.items import ItemStatValue
+from database.models.data_version import DataVersion
 from scripts.copy_icons import copy_required_icons  # Import icon copying function
 from database.session import SessionLocal, engine
+from database.compiled import progression_registry
 from config.data_paths import get_data_paths
 
 def setup_logging(log_dir: Path = None):
@@ -124,7 +133,7 @@ def copy_icons(required_icons: set) -> None:
 def main():
     """Main entry point for the import script."""
     parser = argparse.ArgumentParser(description='Import LOTRO data into the database')
-    parser.add_argument('--import-type', type=str, choices=['items', 'progressions'],
+    parser.add_argument('--import-type', type=str, choices=['items', 'progressions', 'stat-values', 'item-renders', 'ev-values'],
                       default='items', help='Type of data to import (items includes required progressions and icons)')
     parser.add_argument('--log-dir', type=str,
                       help='Directory to store log files (default: current directory)')
@@ -132,6 +141,12 @@ def main():
                       help='Create database tables if they don\'t exist')
     parser.add_argument('--wipe', action='store_true',
                       help='Drop and recreate all tables before importing')
+    parser.add_argument('--stat-values-min-ilvl', type=int, default=ItemStatValue.DEFAULT_MIN_ILVL,
+                      help='First item level of the materialized stat values band')
+    parser.add_argument('--stat-values-max-ilvl', type=int, default=ItemStatValue.DEFAULT_MAX_ILVL,
+                      help='Last item level of the materialized stat values band')
+    parser.add_argument('--skip-stat-values', action='store_true',
+                      help='Do not refresh the materialized stat values after importing')
     
     args = parser.parse_args()
     
@@ -187,22 +202,90 @@ def main():
                 logger.info("Importing items...")
                 item_importer.run()
                 
+                # 5b. Materialize concrete stat values for everything this import touched
+                if not args.skip_stat_values:
+                    logger.info("Refreshing materialized stat values...")
+                    StatValuesImporter(
+                        session, args.stat_values_min_ilvl, args.stat_values_max_ilvl
+                    ).refresh(
+                        progression_table_ids=required_progression_tables,
+                        dps_table_ids=item_importer.imported_dps_table_ids,
+                        item_keys=item_importer.imported_item_keys
+                    )
+                
+                # 5c. Pre-render the JSON of the imported items
+                logger.info("Rendering item JSON...")
+                ItemRendersImporter(session).refresh(item_importer.imported_item_keys)
+                
+                # 5d. Score every equipment item against the (possibly re-imported) essences
+                logger.info("Computing equipment essence values...")
+                EVValuesImporter(session).refresh()
+                
                 # 6. Get required icons BEFORE session closes
                 logger.info("Collecting required icons...")
                 required_icons = item_importer.get_required_icons()
                 
                 # 7. Explicit commit to ensure data is saved
                 logger.info("Committing database changes...")
+                DataVersion.bump(session)
                 session.commit()
                 
+                # 8. Recompile progression and DPS tables from the committed data
+                logger.info("Rebuilding compiled progression tables...")
+                progression_registry.rebuild(session)
+                
             elif args.import_type == 'progressions':
                 # Import only progressions
                 logger.info("Starting progressions-only import...")
                 progressions_importer = ProgressionsImporter(progressions_path, session)
                 progressions_importer.run()
                 
+                # Refresh stat values of items that use the re-imported tables
+                if not args.skip_stat_values:
+                    logger.info("Refreshing materialized stat values...")
+                    StatValuesImporter(
+                        session, args.stat_values_min_ilvl, args.stat_values_max_ilvl
+                    ).refresh(progression_table_ids=progressions_importer.imported_table_ids)
+                
+                # Stat values (and so essence values) of any item may have changed
+                logger.info("Computing equipment essence values...")
+                EVValuesImporter(session).refresh()
+                
                 # Explicit commit for progressions too
                 logger.info("Committing database changes...")
+                DataVersion.bump(session)
+                session.commit()
+                
+                logger.info("Rebuilding compiled progression tables...")
+                progression_registry.rebuild(session)
+                
+            elif args.import_type == 'stat-values':
+                # Rebuild every materialized stat value over the requested band
+                logger.info("Starting stat values rebuild...")
+                StatValuesImporter(
+                    session, args.stat_values_min_ilvl, args.stat_values_max_ilvl
+                ).refresh()
+                
+                logger.info("Committing database changes...")
+                DataVersion.bump(session)
+                session.commit()
+                
+            elif args.import_type == 'item-renders':
+                # Re-render the stored JSON of every item
+                logger.info("Starting item renders rebuild...")
+                ItemRendersImporter(session).refresh()
+                
+                logger.info("Committing database changes...")
+                DataVersion.bump(session)
+                session.commit()
+                
+            elif args.import_type == 'ev-values':
+                # Recompute the essence value of every equipment item
+                logger.info("Starting essence values rebuild...")
+                EVValuesImporter(session).refresh()
+                
+                logger.info("Committing database changes...")
+                DataVersion.bump(session)
                 session.commit()
         
         # Copy required icons AFTER session closes (outside the session context)
@@ -0,0 +1,170 @@
+"""
+Import stage that materializes concrete item stat values.
+
+Once items and their progression/DPS tables are in the database, this stage evaluates every item stat
+(and weapon DPS) at each item level of a band and stores the results in item_stat_values, so the API
+can filter and sort on concrete values in SQL. It can refresh everything, or only the items that use
+tables touched by an import.
+
+The band of a full refresh is recorded on the data version row, where the API reads it to decide which
+item levels it can look up. A partial refresh over a different band than the recorded one would leave
+the table with a mix of bands, so it is done as a full refresh instead.
+"""
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from database.compiled import progression_registry
+from database.models.data_version import DataVersion
+from database.models.items import ItemStat, ItemStatValue, Weapon
+
+
+class StatValuesImporter:
+    """Materializes concrete item stat values over an item level band."""
+
+    # Rows sent per INSERT and keys per IN (...) clause
+    INSERT_BATCH_SIZE = 10000
+    KEY_BATCH_SIZE = 1000
+
+    def __init__(
+        self,
+        db_session: Session,
+        min_ilvl: int = ItemStatValue.DEFAULT_MIN_ILVL,
+        max_ilvl: int = ItemStatValue.DEFAULT_MAX_ILVL
+    ):
+        """Initialize the stage.
+
+        Args:
+            db_session: Database session
+            min_ilvl: First item level to materialize
+            max_ilvl: Last item level to materialize
+        """
+        if min_ilvl > max_ilvl:
+            raise ValueError(f"Invalid item level band: {min_ilvl}-{max_ilvl}")
+        self.db = db_session
+        self.min_ilvl = min_ilvl
+        self.max_ilvl = max_ilvl
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _chunks(self, keys: Iterable) -> Iterator[List]:
+        """Split keys into lists small enough for an IN (...) clause."""
+        keys = sorted(keys)
+        for start in range(0, len(keys), self.KEY_BATCH_SIZE):
+            yield keys[start:start + self.KEY_BATCH_SIZE]
+
+    def get_affected_item_keys(
+        self,
+        progression_table_ids: Optional[Set[str]] = None,
+        dps_table_ids: Optional[Set[str]] = None,
+        item_keys: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """Get the keys of items that use any of the given tables, plus any explicitly listed items."""
+        affected = set(item_keys or ())
+        for chunk in self._chunks(progression_table_ids or ()):
+            affected.update(self.db.scalars(
+                select(ItemStat.item_key).where(ItemStat.value_table_id.in_(chunk)).distinct()
+            ))
+        for chunk in self._chunks(dps_table_ids or ()):
+            affected.update(self.db.scalars(
+                select(Weapon.key).where(Weapon.dps_table_id.in_(chunk))
+            ))
+        return affected
+
+    def _select(self, query, key_column, item_keys: Optional[Set[int]]):
+        """Run a query for all items, or chunk by chunk for a set of item keys."""
+        if item_keys is None:
+            yield from self.db.execute(query)
+            return
+        for chunk in self._chunks(item_keys):
+            yield from self.db.execute(query.where(key_column.in_(chunk)))
+
+    def _compute_rows(self, item_keys: Optional[Set[int]]) -> Iterator[Dict]:
+        """Yield an item_stat_values row for every stat of the given items (or all items) at every ilvl."""
+        ilvls = np.arange(self.min_ilvl, self.max_ilvl + 1)
+        ilvl_list = ilvls.tolist()
+
+        # Many items share curves, so evaluate each canonical curve (or DPS table + quality) once
+        curves: Dict = {}
+
+        stat_query = select(ItemStat.item_key, ItemStat.stat_name, ItemStat.value_table_id)
+        for item_key, stat_name, table_id in self._select(stat_query, ItemStat.item_key, item_keys):
+            table = progression_registry.get_progression(table_id)
+            curve_key = table.table_id if table else None
+            if curve_key not in curves:
+                curves[curve_key] = table.get_values(ilvls).tolist() if table else [0.0] * len(ilvl_list)
+            for ilvl, value in zip(ilvl_list, curves[curve_key]):
+                yield {'item_key': item_key, 'stat_name': stat_name, 'ilvl': ilvl, 'value': value}
+
+        weapon_query = select(Weapon.key, Weapon.quality, Weapon.dps_table_id, Weapon.dps)
+        for item_key, quality, dps_table_id, base_dps in self._select(weapon_query, Weapon.key, item_keys):
+            dps_table = progression_registry.get_dps_table(dps_table_id) if dps_table_id else None
+            if dps_table:
+                curve_key = (dps_table_id, quality)
+                if curve_key not in curves:
+                    curves[curve_key] = dps_table.get_dps_at_levels(ilvls, quality).tolist()
+                dps_values = curves[curve_key]
+            elif base_dps is not None:
+                # Same fallback as Weapon.get_dps_at_ilvl
+                dps_values = [base_dps] * len(ilvl_list)
+            else:
+                continue
+            for ilvl, value in zip(ilvl_list, dps_values):
+                yield {'item_key': item_key, 'stat_name': ItemStatValue.DPS_STAT_NAME, 'ilvl': ilvl, 'value': value}
+
+    def refresh(
+        self,
+        progression_table_ids: Optional[Set[str]] = None,
+        dps_table_ids: Optional[Set[str]] = None,
+        item_keys: Optional[Set[int]] = None
+    ) -> int:
+        """Recompute materialized stat values.
+
+        With no arguments every item is refreshed. Otherwise only items that use one of the given
+        progression or DPS tables, or are listed in item_keys, are refreshed.
+
+        Returns:
+            int: Number of rows written
+        """
+        full_refresh = progression_table_ids is None and dps_table_ids is None and item_keys is None
+        if not full_refresh and DataVersion.get_stat_values_band(self.db) != (self.min_ilvl, self.max_ilvl):
+            self.logger.info(f"Stat values were not materialized for ilvl {self.min_ilvl}-{self.max_ilvl}, refreshing all items")
+            full_refresh = True
+            progression_table_ids = dps_table_ids = item_keys = None
+
+        # Compile tables from this session so uncommitted import changes are included
+        self.db.flush()
+        progression_registry.rebuild(self.db)
+
+        if full_refresh:
+            self.logger.info(f"Refreshing all stat values for ilvl {self.min_ilvl}-{self.max_ilvl}...")
+            self.db.execute(delete(ItemStatValue))
+            affected = None
+        else:
+            affected = self.get_affected_item_keys(progression_table_ids, dps_table_ids, item_keys)
+            if not affected:
+                self.logger.info("No items affected, stat values are up to date")
+                return 0
+            self.logger.info(f"Refreshing stat values of {len(affected)} items for ilvl {self.min_ilvl}-{self.max_ilvl}...")
+            for chunk in self._chunks(affected):
+                self.db.execute(delete(ItemStatValue).where(ItemStatValue.item_key.in_(chunk)))
+
+        written = 0
+        batch = []
+        for row in self._compute_rows(affected):
+            batch.append(row)
+            if len(batch) >= self.INSERT_BATCH_SIZE:
+                self.db.execute(insert(ItemStatValue), batch)
+                written += len(batch)
+                batch = []
+        if batch:
+            self.db.execute(insert(ItemStatValue), batch)
+            written += len(batch)
+
+        if full_refresh:
+            DataVersion.set_stat_values_band(self.db, self.min_ilvl, self.max_ilvl)
+
+        self.logger.info(f"Wrote {written} stat values")
+        return written
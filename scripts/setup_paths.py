@@ -92,6 +92,7 @@ DB_PASSWORD=your_db_password
 LOTRO_FORGE_HOST=127.0.0.1
 LOTRO_FORGE_PORT=8000
 LOTRO_FORGE_WORKERS=1
+LOTRO_FORGE_THREADS=1
 LOTRO_FORGE_ENV=development
 LOTRO_FORGE_SECRET_KEY=your-secret-key-here-change-in-production
 """
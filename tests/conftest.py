@@ -2,7 +2,23 @@
 Pytest configuration file.
 """
 
+from contextlib import contextmanager
+
 import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import database.config
+from database.models import Base
+from database.compiled import equipment_matrices, essence_references, name_index, progression_registry
+
+# database.session builds its engine from .env on import; the tests never connect with it, so import it
+# once without one, letting test modules import the API packages
+_get_database_url = database.config.get_database_url
+database.config.get_database_url = lambda: "sqlite://"
+import database.session  # noqa: E402,F401
+database.config.get_database_url = _get_database_url
 
 
 def pytest_configure(config):
@@ -14,4 +30,90 @@ def pytest_configure(config):
 def pytest_collection_modifyitems(config, items):
     """Modify test collection if needed."""
     # Add any test collection modifications here if needed
-    pass 
\ No newline at end of file
+    pass
+
+
+@pytest.fixture
+def db_session():
+    """Provide a session bound to a fresh in-memory SQLite database."""
+    # One shared connection, so API tests see the same database from FastAPI's threadpool
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    
+    # Compiled tables must come from this database, not a previous test's
+    progression_registry.invalidate()
+    name_index.invalidate()
+    essence_references.invalidate()
+    equipment_matrices.invalidate()
+    try:
+        yield session
+    finally:
+        session.close()
+        progression_registry.invalidate()
+        name_index.invalidate()
+        essence_references.invalidate()
+        equipment_matrices.invalidate()
+        engine.dispose()
+
+
+@pytest.fixture
+def query_budget(db_session):
+    """
+    Assert that a block runs at most a fixed number of SQL statements on the test database.
+    
+    Usage:
+        with query_budget(2):
+            load_item(db_session, key).to_json()
+    """
+    engine = db_session.get_bind()
+    
+    @contextmanager
+    def budget(max_queries: int):
+        statements = []
+        
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+        
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        
+        assert len(statements) <= max_queries, (
+            f"Expected at most {max_queries} queries, got {len(statements)}:\n" + "\n\n".join(statements)
+        )
+    
+    return budget
+
+
+@pytest.fixture
+def api_client(db_session, monkeypatch):
+    """
+    Provide a TestClient for the data API, serving from the test database.
+    
+    Usage:
+        response = api_client.get("/api/data/equipment/", params={"sort": "name"})
+    """
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    
+    from database.compiled import LRUCache
+    from web.api.data import coalescing, counts, equipment, essences, items
+    from web.api.services.single_flight import SingleFlight
+    from web.routers.api_routes import register_api_routes
+    
+    # Cached responses, totals and rankings are keyed by data version, which every test database starts at
+    monkeypatch.setattr(coalescing, "data_single_flight", SingleFlight(
+        ttl=coalescing.DATA_RESULT_CACHE_TTL, maxsize=coalescing.DATA_RESULT_CACHE_SIZE
+    ))
+    monkeypatch.setattr(counts, "count_cache", LRUCache(counts.COUNT_CACHE_SIZE))
+    monkeypatch.setattr(equipment, "ev_rankings", equipment.EVRankings(maxsize=4))
+    
+    app = FastAPI()
+    register_api_routes(app)
+    for module in (equipment, essences, items):
+        app.dependency_overrides[module.get_db] = lambda: db_session
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,114 @@
+"""
+Tests for compiled progression and DPS tables and the registry that serves them to the models.
+"""
+
+import pytest
+
+from database.compiled import CompiledProgression, CompiledDpsTable, get_registry
+from database.models import (
+    DpsTable, DpsValue, ItemQuality, ItemStat,
+    ProgressionTable, ProgressionType, ProgressionValue, Weapon
+)
+
+
+@pytest.mark.unit
+class TestCompiledProgression:
+    def test_linear_interpolates_between_points(self):
+        table = CompiledProgression.from_points("t", True, [(500, 100.0), (400, 0.0)])
+        assert table.levels == [400, 500]
+        assert table.get_value(400) == 0.0
+        assert table.get_value(450) == pytest.approx(50.0)
+        assert table.get_value(500) == 100.0
+
+    def test_linear_outside_range_is_zero(self):
+        table = CompiledProgression.from_points("t", True, [(400, 10.0), (500, 20.0)])
+        assert table.get_value(399) == 0.0
+        assert table.get_value(501) == 0.0
+
+    def test_array_only_answers_exact_levels(self):
+        table = CompiledProgression.from_points("t", False, [(1, 5.0), (2, 7.0), (4, 9.0)])
+        assert table.get_value(2) == 7.0
+        assert table.get_value(3) == 0.0
+
+    def test_empty_table_is_zero(self):
+        assert CompiledProgression.from_points("t", True, []).get_value(1) == 0.0
+
+    def test_segments_keep_points_exact(self):
+        points = [(1, 0.1), (7, 0.7), (50, 1234.5678), (51, 3.3)]
+        table = CompiledProgression.from_points("t", True, points)
+        assert table.slopes[-1] == 0.0
+        for level, value in points:
+            assert table.get_value(level) == value
+        assert table.get_values([level for level, _ in points]).tolist() == [value for _, value in points]
+
+    def test_single_point_linear_table(self):
+        table = CompiledProgression.from_points("t", True, [(10, 3.0)])
+        assert table.get_values([9, 10, 11]).tolist() == [0.0, 3.0, 0.0]
+
+    @pytest.mark.parametrize("linear", [True, False])
+    def test_vectorised_values_match_scalar(self, linear):
+        table = CompiledProgression.from_points("t", linear, [(2, 1.0), (5, 4.0), (6, 10.0), (9, 0.5)])
+        levels = list(range(0, 12))
+        assert table.get_values(levels).tolist() == pytest.approx([table.get_value(level) for level in levels])
+
+
+@pytest.mark.unit
+class TestCompiledDpsTable:
+    def test_quality_factor_applied(self):
+        table = CompiledDpsTable.from_points("d", [(1, 10.0), (3, 30.0)], {'rare': 1.5, 'common': None})
+        assert table.get_base_dps_at_level(2) == pytest.approx(20.0)
+        assert table.get_dps_at_level(2, ItemQuality.RARE) == pytest.approx(30.0)
+        assert table.get_dps_at_level(2, "RARE") == pytest.approx(30.0)
+        assert table.get_quality_factor(ItemQuality.COMMON) == 1.0
+
+    @pytest.mark.parametrize("quality", [ItemQuality.RARE, ItemQuality.COMMON])
+    def test_dense_lookup_matches_interpolation(self, quality):
+        table = CompiledDpsTable.from_points("d", [(2, 10.0), (5, 40.0), (9, 41.0)], {'rare': 1.5})
+        levels = list(range(-1, 12))
+        expected = [table.get_base_dps_at_level(level) * table.get_quality_factor(quality) for level in levels]
+        assert [table.get_dps_at_level(level, quality) for level in levels] == pytest.approx(expected)
+        assert table.get_dps_at_levels(levels, quality).tolist() == pytest.approx(expected)
+
+
+@pytest.mark.unit
+class TestRegistryBackedModels:
+    @pytest.fixture
+    def weapon(self, db_session):
+        db_session.add_all([
+            ProgressionTable(table_id="lin", progression_type=ProgressionType.LINEAR),
+            ProgressionValue(table_id="lin", item_level=500, value=100.0),
+            ProgressionValue(table_id="lin", item_level=600, value=200.0),
+            DpsTable(id="dps", quality_rare=1.04),
+            DpsValue(dps_table_id="dps", level=500, value=50.0),
+            DpsValue(dps_table_id="dps", level=600, value=150.0),
+            Weapon(
+                key=1, name="Sword", base_ilvl=500, quality=ItemQuality.RARE,
+                slot="MAIN_HAND", dps=12.0, dps_table_id="dps"
+            ),
+            ItemStat(item_key=1, stat_name="MIGHT", value_table_id="lin", order=0),
+        ])
+        db_session.commit()
+        return db_session.get(Weapon, 1)
+
+    def test_stat_values_come_from_registry(self, db_session, weapon):
+        assert weapon.get_stats_at_ilvl(550) == {"MIGHT": pytest.approx(150.0)}
+        assert get_registry().get_progression("lin") is not None
+
+    def test_weapon_dps_uses_compiled_table(self, weapon):
+        assert weapon.get_dps_at_ilvl(550) == pytest.approx(100.0 * 1.04)
+
+    def test_stats_curve_includes_dps(self, weapon):
+        curve = weapon.get_stats_curve_json(500, 600)
+        assert curve['stat_names'] == ["MIGHT", "DPS"]
+        assert len(curve['stat_values'][0]) == 101
+        assert curve['stat_values'][0][50] == pytest.approx(weapon.get_stats_at_ilvl(550)["MIGHT"])
+        assert curve['stat_values'][1][50] == pytest.approx(weapon.get_dps_at_ilvl(550))
+
+    def test_progression_table_get_value(self, db_session, weapon):
+        table = db_session.get(ProgressionTable, "lin")
+        assert table.get_value(525) == pytest.approx(125.0)
+
+    def test_weapon_without_table_falls_back_to_base_dps(self, db_session):
+        db_session.add(Weapon(key=2, name="Club", base_ilvl=500, quality=ItemQuality.COMMON, slot="MAIN_HAND", dps=9.0))
+        db_session.commit()
+        assert db_session.get(Weapon, 2).get_dps_at_ilvl(550) == 9.0
@@ -0,0 +1,72 @@
+"""
+Tests for cached listing totals.
+"""
+
+import pytest
+
+from database.compiled import LRUCache, progression_registry
+from database.models import DataVersion, EquipmentItem, ItemQuality
+from web.api.data import counts
+from web.api.data.counts import get_total, normalize_filters
+
+
+def count_statements(statements):
+    return [statement for statement in statements if "count(" in statement.lower()]
+
+
+@pytest.fixture
+def items(db_session, monkeypatch):
+    monkeypatch.setattr(counts, "count_cache", LRUCache(counts.COUNT_CACHE_SIZE))
+    db_session.add_all([
+        EquipmentItem(key=key, name=f"Ring {key}", base_ilvl=500, quality=ItemQuality.RARE,
+                      slot="FINGER" if key % 2 else "EAR")
+        for key in range(1, 8)
+    ])
+    db_session.commit()
+    return db_session
+
+
+def finger_query(db):
+    return db.query(EquipmentItem).filter(EquipmentItem.slot.in_(["FINGER", "EAR"]))
+
+
+@pytest.mark.unit
+class TestListingTotals:
+    def test_equivalent_filters_normalize_alike(self):
+        assert normalize_filters({"slots": ["EAR", "FINGER", "EAR"], "search": "Ring", "stat": None, "min_ev": ""}) == \
+            normalize_filters({"search": "rInG", "slots": ["FINGER", "EAR"]})
+
+    def test_equivalent_filter_sets_share_one_cached_total(self, items, query_budget):
+        assert get_total(items, finger_query(items), "equipment", {"slots": ["FINGER", "EAR"], "search": None}) == (7, False)
+        with query_budget(1) as statements:  # At most the data version poll
+            total = get_total(items, finger_query(items), "equipment", {"slots": ["EAR", "FINGER"]})
+        assert total == (7, False)
+        assert count_statements(statements) == []
+
+    def test_listings_do_not_share_totals(self, items, query_budget):
+        get_total(items, finger_query(items), "equipment", {})
+        with query_budget(2) as statements:
+            get_total(items, finger_query(items), "essences", {})
+        assert len(count_statements(statements)) == 1
+
+    def test_count_none_runs_no_count(self, items, query_budget):
+        with query_budget(0):
+            assert get_total(items, finger_query(items), "equipment", {}, "none") == (None, False)
+
+    def test_data_version_bump_misses_the_cache(self, items, query_budget):
+        assert get_total(items, finger_query(items), "equipment", {})[0] == 7
+        items.add(EquipmentItem(key=8, name="Ring 8", base_ilvl=500, quality=ItemQuality.RARE, slot="EAR"))
+        DataVersion.bump(items)
+        items.commit()
+        progression_registry.rebuild(items)
+
+        with query_budget(2) as statements:
+            assert get_total(items, finger_query(items), "equipment", {})[0] == 8
+        assert len(count_statements(statements)) == 1
+
+    def test_estimate_falls_back_to_exact_on_sqlite(self, items, query_budget):
+        assert get_total(items, finger_query(items), "equipment", {}, "estimate") == (7, False)
+        # The exact total is cached, and served to exact requests too
+        with query_budget(1) as statements:
+            assert get_total(items, finger_query(items), "equipment", {}) == (7, False)
+        assert count_statements(statements) == []
@@ -0,0 +1,158 @@
+"""
+Tests for the game data API endpoints, served from the test database.
+"""
+
+import pytest
+
+from database.compiled import get_registry, progression_registry
+from database.models import (
+    DataVersion, DpsTable, DpsValue, EquipmentItem, ItemQuality, ItemStat, ProgressionTable, ProgressionType,
+    ProgressionValue, Weapon
+)
+from database.models.items import load_item
+from scripts.importers.stat_values import StatValuesImporter
+
+# Loading any number of items plus their stats
+BATCH_QUERY_BUDGET = 2
+
+
+@pytest.fixture
+def weapons(db_session):
+    db_session.add_all([
+        DpsTable(id="d", quality_rare=1.5),
+        DpsValue(dps_table_id="d", level=500, value=10.0),
+        DpsValue(dps_table_id="d", level=510, value=20.0),
+        EquipmentItem(key=1, name="Ring", base_ilvl=505, quality=ItemQuality.RARE, slot="FINGER"),
+        Weapon(key=2, name="Sword", base_ilvl=505, quality=ItemQuality.RARE, slot="MAIN_HAND", dps_table_id="d"),
+        Weapon(key=3, name="Club", base_ilvl=505, quality=ItemQuality.COMMON, slot="MAIN_HAND", dps=12.0),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestEquipmentListing:
+    @pytest.mark.parametrize("params", [
+        {"stat": "DPS"},
+        {"stat": "DPS", "sort": "stat"},
+        {"stat": "DPS", "stat_ilvl": 700},
+        {"stat": "DPS", "stat_ilvl": 700, "sort": "stat"},
+    ])
+    def test_dps_listing(self, weapons, api_client, params):
+        response = api_client.get("/api/data/equipment/", params=params)
+        assert response.status_code == 200, response.text
+        body = response.json()
+        assert body["total"] == 3
+        assert {item["key"] for item in body["result"]} == {1, 2, 3}
+        club = next(item for item in body["result"] if item["key"] == 3)
+        assert club["weapon_type"] is None and club["base_dps"] == 12.0
+
+    def test_sort_by_dps(self, weapons, api_client):
+        response = api_client.get("/api/data/equipment/", params={"stat": "DPS", "sort": "stat"})
+        # Sword 15 * 1.5 at its base ilvl, then the Club's base DPS, then the Ring without DPS
+        assert [item["key"] for item in response.json()["result"]] == [2, 3, 1]
+
+    def test_min_dps(self, weapons, api_client):
+        response = api_client.get("/api/data/equipment/", params={"stat": "DPS", "min_stat_value": 20})
+        assert [item["key"] for item in response.json()["result"]] == [2]
+
+    @pytest.mark.parametrize("stat_ilvl", [505, 550])
+    def test_stat_values_inside_and_outside_the_imported_band(self, weapons, api_client, stat_ilvl):
+        weapons.add_all([
+            ProgressionTable(table_id="might", progression_type=ProgressionType.LINEAR),
+            ProgressionValue(table_id="might", item_level=500, value=100.0),
+            ProgressionValue(table_id="might", item_level=600, value=200.0),
+            ItemStat(item_key=1, stat_name="MIGHT", value_table_id="might", order=0),
+        ])
+        # Materialize a narrower band than the default, as --stat-values-max-ilvl would
+        StatValuesImporter(weapons, 500, 510).refresh()
+        DataVersion.bump(weapons)
+        weapons.commit()
+        progression_registry.rebuild(weapons)
+
+        response = api_client.get("/api/data/equipment/", params={
+            "stat": "MIGHT", "stat_ilvl": stat_ilvl, "min_stat_value": stat_ilvl - 400
+        })
+        assert [item["key"] for item in response.json()["result"]] == [1]
+
+
+@pytest.mark.unit
+class TestItemStatsBatch:
+    @pytest.fixture
+    def items(self, weapons, monkeypatch):
+        weapons.add_all([
+            ProgressionTable(table_id="might", progression_type=ProgressionType.LINEAR),
+            ProgressionValue(table_id="might", item_level=500, value=100.0),
+            ProgressionValue(table_id="might", item_level=510, value=200.0),
+            ItemStat(item_key=1, stat_name="MIGHT", value_table_id="might", order=0),
+            ItemStat(item_key=2, stat_name="MIGHT", value_table_id="might", order=0),
+        ])
+        weapons.commit()
+        weapons.expunge_all()
+
+        # The registry is loaded once per process, not per request
+        get_registry(weapons)
+        monkeypatch.setattr(progression_registry, "VERSION_POLL_SECONDS", 3600.0)
+        return weapons
+
+    def test_results_in_input_order(self, items, api_client):
+        response = api_client.post("/api/data/items/stats:batch", json={"items": [
+            {"key": 2, "ilvl": 510}, {"key": 99}, {"key": 1}, {"key": 2, "ilvl": 510}, {"key": 3, "ilvl": 500}
+        ]})
+        assert response.status_code == 200, response.text
+        result = response.json()["result"]
+        assert [entry and entry["key"] for entry in result] == [2, None, 1, 2, 3]
+        assert result[0] == result[3] == {"key": 2, **load_item(items, 2).get_stats_json(510)}
+        assert result[2] == {"key": 1, **load_item(items, 1).get_stats_json(505)}
+
+    def test_unknown_keys_give_null(self, items, api_client):
+        response = api_client.post("/api/data/items/stats:batch", json={"items": [{"key": 98}, {"key": 99}]})
+        assert response.json() == {"result": [None, None]}
+
+    def test_query_count_does_not_grow_with_the_batch(self, items, api_client, query_budget):
+        counts = []
+        for size in (1, 3, 12):
+            # Keys 1-3 and the unknown key 4, repeating
+            batch = [{"key": 1 + index % 4, "ilvl": 500 + index} for index in range(size)]
+            items.expunge_all()
+            with query_budget(BATCH_QUERY_BUDGET) as statements:
+                response = api_client.post("/api/data/items/stats:batch", json={"items": batch})
+            assert len(response.json()["result"]) == size
+            counts.append(len(statements))
+        assert len(set(counts)) == 1
+
+
+def single_flight_stats():
+    """Counters of the data API's response coalescer (imported late, once api_client has patched the session)."""
+    from web.api.data import coalescing
+    return coalescing.data_single_flight.get_stats()
+
+
+@pytest.mark.unit
+class TestCoalescing:
+    def test_identical_requests_reuse_the_response(self, weapons, api_client, query_budget):
+        first = api_client.get("/api/data/equipment/", params={"slots": ["FINGER", "MAIN_HAND"]})
+        with query_budget(1):  # Only the data version poll, if due
+            second = api_client.get("/api/data/equipment/", params={"slots": ["MAIN_HAND", "FINGER"]})
+        assert second.content == first.content
+        assert single_flight_stats()['computed'] == 1
+        assert single_flight_stats()['cache_hits'] == 1
+
+    def test_responses_expire_after_ttl(self, weapons, api_client, monkeypatch):
+        from web.api.data import coalescing
+        monkeypatch.setattr(coalescing.data_single_flight, "ttl", 0)
+        api_client.get("/api/data/equipment/")
+        api_client.get("/api/data/equipment/")
+        assert single_flight_stats()['computed'] == 2
+        assert single_flight_stats()['cache_hits'] == 0
+
+    def test_data_version_bump_misses(self, weapons, api_client):
+        before = api_client.get("/api/data/equipment/").json()
+        weapons.add(EquipmentItem(key=4, name="Earring", base_ilvl=505, quality=ItemQuality.RARE, slot="EAR"))
+        DataVersion.bump(weapons)
+        weapons.commit()
+        progression_registry.rebuild(weapons)
+
+        after = api_client.get("/api/data/equipment/").json()
+        assert before["total"] == 3 and after["total"] == 4
+        assert single_flight_stats()['computed'] == 2
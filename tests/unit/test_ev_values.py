@@ -0,0 +1,180 @@
+"""
+Tests for essence value (EV) scoring and the precomputed equipment EV import stage.
+"""
+
+import numpy as np
+import pytest
+
+from database.compiled import (
+    EquipmentStatMatrix, EssenceReference, EVCalculator, EVProfile, ev_profiles, get_essence_reference,
+    get_ev_calculator, get_registry, load_ev_profiles
+)
+from database.models import (
+    EquipmentItem, Essence, ItemQuality, ItemStat, ProgressionTable, ProgressionType, ProgressionValue
+)
+from scripts.importers.ev_values import EVValuesImporter
+from web.api.services.ev_rankings import EVRankings
+
+
+def flat_table(table_id, value):
+    """A progression table with the same value at every item level."""
+    return [
+        ProgressionTable(table_id=table_id, progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id=table_id, item_level=500, value=value),
+        ProgressionValue(table_id=table_id, item_level=540, value=value),
+    ]
+
+
+@pytest.fixture
+def catalog(db_session):
+    for table_id, value in [("might_e", 10.0), ("vit_e", 40.0), ("vit_s", 20.0), ("pmit_e", 50.0),
+                            ("tmit_e", 10.0), ("might_i", 30.0), ("armour_i", 100.0)]:
+        db_session.add_all(flat_table(table_id, value))
+    db_session.add_all([
+        Essence(key=10, name="Vivid Essence of Might", base_ilvl=532, quality=ItemQuality.RARE),
+        Essence(key=11, name="Vivid Essence of Vitality", base_ilvl=532, quality=ItemQuality.RARE),
+        Essence(key=12, name="Supplemental Essence of Vitality", base_ilvl=508, quality=ItemQuality.RARE),
+        Essence(key=13, name="Vivid Essence of Mitigation", base_ilvl=532, quality=ItemQuality.RARE),
+        ItemStat(item_key=10, stat_name="MIGHT", value_table_id="might_e", order=0),
+        ItemStat(item_key=11, stat_name="VITALITY", value_table_id="vit_e", order=0),
+        ItemStat(item_key=12, stat_name="VITALITY", value_table_id="vit_s", order=0),
+        ItemStat(item_key=13, stat_name="PHYSICAL_MITIGATION", value_table_id="pmit_e", order=0),
+        ItemStat(item_key=13, stat_name="TACTICAL_MITIGATION", value_table_id="tmit_e", order=1),
+        EquipmentItem(key=1, name="Helm", base_ilvl=520, quality=ItemQuality.RARE, slot="HEAD",
+                      sockets_basic=1, sockets_vital=1),
+        EquipmentItem(key=2, name="Plain Ring", base_ilvl=520, quality=ItemQuality.RARE, slot="FINGER"),
+        ItemStat(item_key=1, stat_name="MIGHT", value_table_id="might_i", order=0),
+        ItemStat(item_key=1, stat_name="ARMOUR", value_table_id="armour_i", order=1),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestEVValuesImporter:
+    def test_refresh_stores_ev_at_base_ilvl(self, catalog):
+        assert EVValuesImporter(catalog).refresh() == 2
+        catalog.commit()
+        catalog.expire_all()
+
+        # MIGHT 30/10 + ARMOUR (100/50 + 0.2*100/10) + basic socket 1 + vital socket 40/20
+        assert catalog.get(EquipmentItem, 1).ev == pytest.approx(3 + 4 + 1 + 2)
+        assert catalog.get(EquipmentItem, 2).ev == 0.0
+
+    def test_ev_sort_order(self, catalog):
+        EVValuesImporter(catalog).refresh()
+        ordered = catalog.query(EquipmentItem.key).order_by(EquipmentItem.ev.desc(), EquipmentItem.key.desc())
+        assert [key for key, in ordered] == [1, 2]
+
+
+@pytest.mark.unit
+class TestEssenceReference:
+    def test_reference_values(self, catalog):
+        reference = EssenceReference.load(catalog, get_registry(catalog))
+        assert reference.stat_values == {
+            "MIGHT": 10.0, "PHYSICAL_MITIGATION": 50.0, "TACTICAL_MITIGATION": 10.0, "VITALITY": 20.0
+        }
+        assert reference.vital_socket_ratio == pytest.approx(2.0)
+
+    def test_vital_sockets_fall_back_to_one_ev(self, catalog):
+        calculator = EVCalculator(EssenceReference(stat_values={}, vital_socket_ratio=None))
+        assert calculator.calculate_socket_ev({"vital": 2, "basic": 1}) == 3
+
+    def test_scoring_does_no_database_access(self, catalog, query_budget):
+        calculator = get_ev_calculator(catalog)
+        with query_budget(0):
+            ev = calculator.calculate_equipment_ev(
+                [{"stat_name": "MIGHT", "value": 30.0}, {"stat_name": "ARMOUR", "value": 100.0}],
+                {"basic": 1, "vital": 1}
+            )
+        assert ev == pytest.approx(10.0)
+
+    def test_process_wide_calculator_is_reused_per_data_version(self, catalog):
+        calculator = get_ev_calculator(catalog)
+        assert get_ev_calculator(catalog) is calculator
+        assert get_essence_reference(catalog) is calculator.reference
+
+
+@pytest.mark.unit
+class TestBatchEV:
+    def test_stat_matrix_values(self, catalog):
+        matrix = EquipmentStatMatrix.load(catalog, get_registry(catalog))
+        assert matrix.keys.tolist() == [1, 2]
+        values = matrix.get_values(matrix.base_ilvls)
+        helm = dict(zip(matrix.stat_names, values[0]))
+        assert helm == {"MIGHT": 30.0, "ARMOUR": 100.0}
+        assert values[1].tolist() == [0.0, 0.0]
+        assert matrix.sockets[0].tolist() == [1, 0, 1, 0, 0, 0]
+
+    def test_batch_matches_per_item_scoring(self, catalog):
+        calculator = get_ev_calculator(catalog)
+        stat_names = ["MIGHT", "ARMOUR", "VITALITY", "UNKNOWN"]
+        stat_values = np.array([[30.0, 100.0, 40.0, 5.0], [0.0, 50.0, 0.0, 0.0]])
+        socket_counts = np.array([[1, 0, 1, 0, 0, 0], [0, 2, 0, 0, 0, 1]], dtype=float)
+
+        batch = calculator.calculate_batch_ev(stat_values, stat_names, socket_counts)
+        for row in range(2):
+            expected = calculator.calculate_equipment_ev(
+                [{"stat_name": name, "value": value} for name, value in zip(stat_names, stat_values[row])],
+                {"basic": socket_counts[row][0], "primary": socket_counts[row][1], "vital": socket_counts[row][2],
+                 "pvp": socket_counts[row][5]}
+            )
+            assert batch[row] == pytest.approx(expected)
+
+    def test_score_equipment_at_an_ilvl(self, catalog):
+        matrix = EquipmentStatMatrix.load(catalog, get_registry(catalog))
+        assert get_ev_calculator(catalog).score_equipment(matrix, 530).tolist() == pytest.approx([10.0, 0.0])
+
+
+@pytest.mark.unit
+class TestEVRankings:
+    def test_ranking_best_first_and_memoized(self, catalog):
+        rankings = EVRankings(maxsize=4)
+        keys, evs = rankings.get_ranking(None, 530, catalog)
+        assert keys.tolist() == [1, 2]
+        assert evs.tolist() == pytest.approx([10.0, 0.0])
+        assert rankings.get_ranking(None, 530, catalog)[0] is keys
+
+    def test_ranking_by_slot(self, catalog):
+        keys, _ = EVRankings(maxsize=4).get_ranking("FINGER", 530, catalog)
+        assert keys.tolist() == [2]
+
+    def test_curve_matches_scoring_at_each_ilvl(self, catalog):
+        helm = catalog.get(EquipmentItem, 1)
+        calculator = get_ev_calculator(catalog)
+        evs = calculator.calculate_curve_ev(helm.get_stats_curve_json(520, 522), helm.socket_summary)
+        assert evs.tolist() == pytest.approx([10.0, 10.0, 10.0])
+
+
+@pytest.mark.unit
+class TestEVProfiles:
+    def test_profiles_file_defines_the_default(self):
+        assert "default" in ev_profiles
+        assert ev_profiles["default"].get_selector("FATE").ilvl == 508
+
+    def test_profiles_file_without_default_is_rejected(self, tmp_path):
+        path = tmp_path / "ev_profiles.json"
+        path.write_text('{"other": {"essence": {"ilvl": 532}}}')
+        with pytest.raises(ValueError):
+            load_ev_profiles(path)
+
+    def test_profile_selects_reference_essences(self, catalog):
+        # Every stat from Vivid essences at 532, VITALITY included
+        profile = EVProfile.from_dict("vivid", {"essence": {"ilvl": 532, "name": "Vivid"}})
+        reference = EssenceReference.load(catalog, get_registry(catalog), profile)
+        assert reference.profile == "vivid"
+        assert reference.stat_values["VITALITY"] == 40.0
+        assert reference.vital_socket_ratio is None
+
+    def test_rankings_per_profile(self, catalog, monkeypatch):
+        monkeypatch.setitem(ev_profiles, "vivid", EVProfile.from_dict("vivid", {
+            "essence": {"ilvl": 532, "name": "Vivid"},
+            "vital_socket": {"ilvl": 532, "name": "Vitality"}
+        }))
+        rankings = EVRankings(maxsize=4)
+        _, default_evs = rankings.get_ranking(None, 530, catalog)
+        _, vivid_evs = rankings.get_ranking(None, 530, catalog, "vivid")
+        # The vital socket holds exactly one reference VITALITY essence under the vivid profile
+        assert default_evs.tolist() == pytest.approx([10.0, 0.0])
+        assert vivid_evs.tolist() == pytest.approx([9.0, 0.0])
+        assert get_essence_reference(catalog, "vivid") is not get_essence_reference(catalog)
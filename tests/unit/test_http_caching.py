@@ -0,0 +1,98 @@
+"""
+Tests for data version ETags on the game data API.
+"""
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from database.compiled import get_registry
+from web.middleware import caching
+from web.middleware.caching import CACHE_CONTROL, DataCacheMiddleware, etag_matches, make_etag
+
+
+@pytest.fixture
+def client(db_session, monkeypatch):
+    """A client for a small app behind the middleware, reading the data version from the test database."""
+    monkeypatch.setattr(caching, "get_registry", lambda: get_registry(db_session))
+    app = FastAPI()
+    app.add_middleware(DataCacheMiddleware)
+    app.state.calls = 0
+
+    @app.get("/api/data/things/{key}")
+    def get_thing(key: int):
+        app.state.calls += 1
+        if key == 0:
+            raise HTTPException(status_code=404, detail="No such thing")
+        return {"result": key}
+
+    @app.post("/api/data/things")
+    def post_things():
+        return {"result": []}
+
+    @app.get("/api/auth/me")
+    def get_me():
+        return {"result": "me"}
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.mark.unit
+class TestDataETags:
+    def test_query_order_does_not_matter(self):
+        etag = make_etag(3, "/api/data/equipment/", [("sort", "name"), ("slots", "HEAD"), ("slots", "CHEST")])
+        assert etag == make_etag(3, "/api/data/equipment/", [("slots", "CHEST"), ("sort", "name"), ("slots", "HEAD")])
+        assert etag.startswith('"3-') and etag.endswith('"')
+
+    def test_version_path_and_query_change_the_etag(self):
+        etag = make_etag(3, "/api/data/equipment/", [("sort", "name")])
+        assert etag != make_etag(4, "/api/data/equipment/", [("sort", "name")])
+        assert etag != make_etag(3, "/api/data/essences/", [("sort", "name")])
+        assert etag != make_etag(3, "/api/data/equipment/", [("sort", "recent")])
+
+    def test_build_changes_the_etag(self):
+        # A deploy can change response shapes without a data import
+        assert make_etag(3, "/api/data/items/1", [], build="a") != make_etag(3, "/api/data/items/1", [], build="b")
+
+    def test_if_none_match(self):
+        etag = make_etag(1, "/api/data/items/1", [])
+        assert etag_matches(etag, etag)
+        assert etag_matches(f'"other", W/{etag}', etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches('"other"', etag)
+        assert not etag_matches(None, etag)
+
+
+@pytest.mark.unit
+class TestDataCacheMiddleware:
+    def test_headers_on_data_responses(self, client):
+        response = client.get("/api/data/things/1", params={"a": "1"})
+        assert response.status_code == 200
+        assert response.headers["etag"] == make_etag(0, "/api/data/things/1", [("a", "1")])
+        assert response.headers["cache-control"] == CACHE_CONTROL
+        assert response.headers["vary"] == "Cookie"
+
+    def test_matching_if_none_match_is_answered_without_the_endpoint(self, client):
+        etag = client.get("/api/data/things/1").headers["etag"]
+        response = client.get("/api/data/things/1", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+        assert client.app.state.calls == 1
+
+    def test_stale_etag_gets_the_response(self, client):
+        response = client.get("/api/data/things/1", headers={"If-None-Match": '"0-stale"'})
+        assert response.status_code == 200
+        assert response.json() == {"result": 1}
+
+    def test_errors_are_not_cached(self, client):
+        response = client.get("/api/data/things/0")
+        assert response.status_code == 404
+        assert "etag" not in response.headers and "cache-control" not in response.headers
+
+    @pytest.mark.parametrize("method, path", [("post", "/api/data/things"), ("get", "/api/auth/me")])
+    def test_other_requests_are_skipped(self, client, method, path):
+        response = getattr(client, method)(path)
+        assert response.status_code == 200
+        assert "etag" not in response.headers and "cache-control" not in response.headers
@@ -0,0 +1,72 @@
+"""
+Tests for server-side (SQL) evaluation of progression and DPS tables.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from database.compiled import get_registry
+from database.interpolation import get_progression_values, join_item_stat_value
+from database.models import (
+    DpsTable, DpsValue, EquipmentItem, ItemQuality, ItemStat,
+    ProgressionTable, ProgressionType, ProgressionValue, Weapon
+)
+
+LEVELS = [0, 1, 2, 3, 4, 499, 500, 503, 510, 511]
+
+
+@pytest.fixture
+def tables(db_session):
+    db_session.add_all([
+        ProgressionTable(table_id="linear", progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id="linear", item_level=500, value=100.0),
+        ProgressionValue(table_id="linear", item_level=510, value=200.0),
+        ProgressionTable(table_id="array", progression_type=ProgressionType.ARRAY),
+        ProgressionValue(table_id="array", item_level=1, value=5.0),
+        ProgressionValue(table_id="array", item_level=3, value=7.0),
+        ProgressionTable(table_id="alias", progression_type=ProgressionType.LINEAR, canonical_id="linear"),
+        DpsTable(id="d", quality_rare=1.5),
+        DpsValue(dps_table_id="d", level=500, value=10.0),
+        DpsValue(dps_table_id="d", level=510, value=20.0),
+        EquipmentItem(key=1, name="Ring", base_ilvl=503, quality=ItemQuality.RARE, slot="FINGER"),
+        EquipmentItem(key=2, name="Earring", base_ilvl=2, quality=ItemQuality.RARE, slot="EAR"),
+        Weapon(key=3, name="Sword", base_ilvl=505, quality=ItemQuality.RARE, slot="MAIN_HAND", dps_table_id="d"),
+        Weapon(key=4, name="Club", base_ilvl=505, quality=ItemQuality.COMMON, slot="MAIN_HAND", dps=12.0),
+        ItemStat(item_key=1, stat_name="MIGHT", value_table_id="alias", order=0),
+        ItemStat(item_key=2, stat_name="MIGHT", value_table_id="array", order=0),
+        ItemStat(item_key=3, stat_name="MIGHT", value_table_id="linear", order=0),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestServerSideInterpolation:
+    def test_bulk_values_match_registry(self, tables):
+        pairs = [(table_id, level) for table_id in ("linear", "array", "alias") for level in LEVELS]
+        values = get_progression_values(tables, pairs)
+        registry = get_registry(tables)
+        assert values == {pair: pytest.approx(registry.get_value(*pair)) for pair in pairs}
+
+    def test_unknown_tables_are_left_out(self, tables):
+        assert get_progression_values(tables, [("missing", 500)]) == {}
+        assert get_progression_values(tables, []) == {}
+
+    @pytest.mark.parametrize("item_level", [None, 507])
+    def test_item_stat_values_match_models(self, tables, item_level):
+        query, value = join_item_stat_value(
+            select(EquipmentItem.key, EquipmentItem.base_ilvl), EquipmentItem, "MIGHT",
+            item_level if item_level is not None else EquipmentItem.base_ilvl
+        )
+        rows = tables.execute(query.add_columns(value).order_by(EquipmentItem.key)).all()
+        for key, base_ilvl, sql_value in rows:
+            stats = tables.get(EquipmentItem, key).get_stats_at_ilvl(item_level or base_ilvl)
+            assert sql_value == pytest.approx(stats.get("MIGHT"))
+        assert rows[-1][2] is None  # Club has no MIGHT
+
+    def test_dps_matches_models(self, tables):
+        query, value = join_item_stat_value(select(EquipmentItem.key), EquipmentItem, "DPS", 505)
+        rows = dict(tables.execute(query.add_columns(value)).all())
+        assert rows[3] == pytest.approx(tables.get(Weapon, 3).get_dps_at_ilvl(505))
+        assert rows[4] == 12.0
+        assert rows[1] is None
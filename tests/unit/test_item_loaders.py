@@ -0,0 +1,103 @@
+"""
+Tests for the item loader strategies used by the item detail endpoints.
+"""
+
+import pytest
+
+from database.compiled import get_registry, progression_registry
+from database.models import (
+    DpsTable, DpsValue, EquipmentItem, Essence, Item, ItemQuality, ItemStat,
+    ProgressionTable, ProgressionType, ProgressionValue, Weapon
+)
+from database.models.items import load_item, load_items
+
+# Loading an item plus its stats, whatever the subclass
+DETAIL_QUERY_BUDGET = 2
+
+# Item detail without pre-rendered JSON: the item_renders lookup, then loading the item
+ITEM_ENDPOINT_QUERY_BUDGET = 1 + DETAIL_QUERY_BUDGET
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        ProgressionTable(table_id="a", progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id="a", item_level=500, value=100.0),
+        ProgressionValue(table_id="a", item_level=510, value=200.0),
+        DpsTable(id="d", quality_rare=1.5),
+        DpsValue(dps_table_id="d", level=500, value=10.0),
+        DpsValue(dps_table_id="d", level=510, value=20.0),
+        EquipmentItem(key=1, name="Ring", base_ilvl=505, quality=ItemQuality.RARE, slot="FINGER"),
+        Weapon(key=2, name="Sword", base_ilvl=505, quality=ItemQuality.RARE, slot="MAIN_HAND", dps_table_id="d"),
+        Essence(key=3, name="Essence of Might", base_ilvl=505, quality=ItemQuality.RARE, tier=10, essence_type=1),
+    ])
+    for key in (1, 2, 3):
+        for order, stat_name in enumerate(("MIGHT", "AGILITY", "VITALITY")):
+            db_session.add(ItemStat(item_key=key, stat_name=stat_name, value_table_id="a", order=order))
+    db_session.commit()
+    db_session.expunge_all()
+
+    # The registry is loaded once per process, not per request
+    get_registry(db_session)
+    return db_session
+
+
+@pytest.mark.unit
+class TestItemLoaders:
+    @pytest.mark.parametrize("key", [1, 2, 3])
+    def test_detail_responses_within_query_budget(self, items, query_budget, key):
+        with query_budget(DETAIL_QUERY_BUDGET):
+            item = load_item(items, key)
+            item.to_json()
+            item.get_stats_json(505)
+            item.get_stats_curve_json(500, 510)
+
+    def test_loads_concrete_subclass(self, items):
+        assert isinstance(load_item(items, 2), Weapon)
+        assert isinstance(load_item(items, 3), Essence)
+        assert load_item(items, 99) is None
+
+    def test_weapon_dps_resolved_without_dps_table(self, items):
+        weapon = load_item(items, 2)
+        assert weapon.get_dps_at_ilvl(505) == pytest.approx(22.5)
+
+    def test_batch_within_query_budget(self, items, query_budget):
+        with query_budget(DETAIL_QUERY_BUDGET):
+            loaded = load_items(items, [1, 2, 3, 99])
+            for item in loaded:
+                item.get_stats_json(505)
+        assert sorted(item.key for item in loaded) == [1, 2, 3]
+
+    def test_budget_catches_lazy_loading(self, items, query_budget):
+        with pytest.raises(AssertionError):
+            with query_budget(DETAIL_QUERY_BUDGET):
+                item = items.query(Item).filter(Item.key == 2).first()
+                item.to_json()
+                item.get_stats_json(505)
+
+
+@pytest.mark.unit
+class TestItemEndpointQueryBudgets:
+    """The item endpoints, so a relationship a handler starts touching breaks the budget."""
+
+    @pytest.fixture
+    def warm_items(self, items, monkeypatch):
+        # The data version is not polled within a test
+        monkeypatch.setattr(progression_registry, "VERSION_POLL_SECONDS", 3600.0)
+        return items
+
+    @pytest.mark.parametrize("key", [1, 2, 3])
+    @pytest.mark.parametrize("path, budget", [
+        ("/api/data/items/{key}", ITEM_ENDPOINT_QUERY_BUDGET),
+        ("/api/data/items/{key}/stats?ilvl=505", DETAIL_QUERY_BUDGET),
+        ("/api/data/items/{key}/concrete", DETAIL_QUERY_BUDGET),
+        ("/api/data/items/{key}/concrete?ilvl=510", DETAIL_QUERY_BUDGET),
+    ])
+    def test_within_query_budget(self, warm_items, api_client, query_budget, key, path, budget):
+        with query_budget(budget):
+            response = api_client.get(path.format(key=key))
+        assert response.status_code == 200, response.text
+
+    def test_unknown_item_within_query_budget(self, warm_items, api_client, query_budget):
+        with query_budget(ITEM_ENDPOINT_QUERY_BUDGET):
+            assert api_client.get("/api/data/items/99/concrete").status_code == 404
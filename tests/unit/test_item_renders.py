@@ -0,0 +1,49 @@
+"""
+Tests for the pre-rendered item JSON import stage.
+"""
+
+import orjson
+import pytest
+
+from database.models import EquipmentItem, Essence, ItemQuality, ItemRender, ItemStat, Weapon
+from database.models.items import equipment_list_bytes, load_item, project_equipment_list
+from scripts.importers.item_renders import ItemRendersImporter
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        EquipmentItem(key=1, name="Ring", base_ilvl=500, quality=ItemQuality.RARE, slot="FINGER", icon="1-2"),
+        Weapon(key=2, name="Sword", base_ilvl=505, quality=ItemQuality.RARE, slot="MAIN_HAND", dps=12.5),
+        Essence(key=3, name="Vivid Essence", base_ilvl=532, quality=ItemQuality.RARE, essence_type=22),
+        ItemStat(item_key=1, stat_name="MIGHT", value_table_id="t", order=0),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestItemRenders:
+    def test_renders_match_models(self, items):
+        assert ItemRendersImporter(items).refresh() == 3
+        for key in (1, 2, 3):
+            render = items.get(ItemRender, key)
+            item = load_item(items, key)
+            assert orjson.loads(render.detail_json) == item.to_json()
+            assert orjson.loads(render.list_json) == item.to_list_json()
+
+    def test_partial_refresh_replaces_renders(self, items):
+        ItemRendersImporter(items).refresh()
+        items.get(EquipmentItem, 1).name = "Band"
+        assert ItemRendersImporter(items).refresh({1}) == 1
+        assert orjson.loads(items.get(ItemRender, 1).list_json)['name'] == "Band"
+        assert items.query(ItemRender).count() == 3
+
+    def test_list_uses_renders_and_falls_back(self, items):
+        ItemRendersImporter(items).refresh({1})
+        items.get(ItemRender, 1).list_json = b'{"key":1}'
+        items.flush()
+        query = project_equipment_list(items.query(EquipmentItem).order_by(EquipmentItem.key))
+        parts = [equipment_list_bytes(row) for row in query]
+        assert parts[0] == b'{"key":1}'
+        assert orjson.loads(parts[1]) == items.get(Weapon, 2).to_list_json()
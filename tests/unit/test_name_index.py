@@ -0,0 +1,49 @@
+"""
+Tests for the in-memory item name prefix index.
+"""
+
+import pytest
+
+from database.compiled import NameIndex, get_name_index, progression_registry
+from database.models import DataVersion, EquipmentItem, Essence, ItemQuality
+
+
+@pytest.fixture
+def index():
+    index = NameIndex()
+    index.build([
+        (1, "Ring of the Dawn", "FINGER"),
+        (2, "Dawn Bracelet", "WRIST"),
+        (3, "Vivid Essence of Might", None),
+        (4, "Ring  of Dusk", "FINGER"),
+    ])
+    return index
+
+
+@pytest.mark.unit
+class TestNameIndex:
+    def test_full_name_matches_come_first(self, index):
+        assert [item['key'] for item in index.suggest("dawn")] == [2, 1]
+
+    def test_matches_later_words_and_phrases(self, index):
+        assert index.suggest("essence OF") == [{'key': 3, 'name': "Vivid Essence of Might"}]
+        assert [item['key'] for item in index.suggest("ring   of")] == [4, 1]
+        assert index.suggest("ing") == []
+
+    def test_slot_and_limit(self, index):
+        assert [item['key'] for item in index.suggest("r", slot="FINGER")] == [4, 1]
+        assert len(index.suggest("r", limit=1)) == 1
+        assert index.suggest("  ") == []
+
+    def test_rebuilds_on_data_version_change(self, db_session, monkeypatch):
+        db_session.add(EquipmentItem(key=1, name="Ring", base_ilvl=500, quality=ItemQuality.RARE, slot="FINGER"))
+        db_session.commit()
+        assert [item['name'] for item in get_name_index(db_session).suggest("ri")] == ["Ring"]
+
+        db_session.add(Essence(key=2, name="Rich Essence", base_ilvl=500, quality=ItemQuality.RARE))
+        DataVersion.bump(db_session)
+        db_session.commit()
+        monkeypatch.setattr(progression_registry, "VERSION_POLL_SECONDS", 0.0)
+        index = get_name_index(db_session)
+        assert index.version == 1
+        assert [item['name'] for item in index.suggest("ri")] == ["Rich Essence", "Ring"]
@@ -0,0 +1,111 @@
+"""
+Tests for keyset (cursor) pagination of item listings.
+"""
+
+import base64
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from database.models import EquipmentItem, Essence, ItemQuality
+from web.api.data.pagination import (
+    KEYSET_ORDERS, after_cursor, decode_cursor, encode_cursor, fetch_keyset_page, get_keyset_order
+)
+
+
+def make_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+@pytest.fixture
+def items(db_session):
+    # Repeated names, ilvls and EVs so every order needs its tie-breaking columns
+    db_session.add_all([
+        EquipmentItem(key=key, name=f"Item {key % 3}", base_ilvl=500 + key % 4, quality=ItemQuality.RARE,
+                      slot="HEAD", ev=float(key % 5))
+        for key in range(1, 24)
+    ])
+    db_session.commit()
+    return db_session
+
+
+def sort_key(item, order):
+    """Python sort key matching a keyset order (only numeric columns are ever descending)."""
+    return tuple(-getattr(item, name) if descending else getattr(item, name) for name, descending in order)
+
+
+@pytest.mark.unit
+class TestKeysetPagination:
+    @pytest.mark.parametrize("sort", ["recent", "name", "base_ilvl", "ev"])
+    def test_pages_cover_the_listing_in_order(self, items, sort):
+        order = KEYSET_ORDERS[sort]
+        expected = [item.key for item in sorted(items.query(EquipmentItem), key=lambda item: sort_key(item, order))]
+
+        keys, cursor, pages = [], None, 0
+        while True:
+            rows, cursor, has_more = fetch_keyset_page(items.query(EquipmentItem), EquipmentItem, sort, 5, cursor=cursor)
+            keys += [row.key for row in rows]
+            pages += 1
+            assert has_more == (cursor is not None)
+            if not has_more:
+                break
+        assert keys == expected
+        assert pages == 5
+
+    def test_last_full_page_has_no_cursor(self, items):
+        rows, cursor, has_more = fetch_keyset_page(items.query(EquipmentItem), EquipmentItem, "recent", 23)
+        assert len(rows) == 23 and cursor is None and not has_more
+
+    def test_cursor_round_trip(self, items):
+        item = items.get(EquipmentItem, 7)
+        order = KEYSET_ORDERS["base_ilvl"]
+        cursor = encode_cursor("base_ilvl", item, order)
+        assert decode_cursor(cursor, "base_ilvl", order, EquipmentItem) == [503, "Item 1", 7]
+
+    def test_after_cursor_is_strictly_after(self, items):
+        order = KEYSET_ORDERS["name"]
+        keys = [key for key, in items.query(EquipmentItem.key).filter(
+            after_cursor(EquipmentItem, order, ["Item 2", 20])
+        ).order_by(EquipmentItem.key)]
+        assert keys == [23]
+
+    def test_sorts_on_missing_columns_fall_back_to_recent(self):
+        assert get_keyset_order("ev", Essence) == KEYSET_ORDERS["recent"]
+        assert get_keyset_order("unknown") == KEYSET_ORDERS["recent"]
+
+    @pytest.mark.parametrize("sort, cursor", [
+        ("name", make_cursor({"s": "name", "v": [{}, 1]})),
+        ("name", make_cursor({"s": "name", "v": ["Item 1", "7"]})),
+        ("name", make_cursor({"s": "name", "v": [None, 7]})),
+        ("name", make_cursor({"s": "name", "v": ["Item 1"]})),
+        ("name", make_cursor({"s": "recent", "v": [7]})),  # Issued for another sort
+        ("recent", make_cursor({"s": "recent", "v": [True]})),
+        ("ev", make_cursor({"s": "ev", "v": [float("nan"), 7]})),
+        ("ev", make_cursor({"s": "ev", "v": [1.5, 7.0]})),
+        ("name", make_cursor(["name"])),
+        ("name", "not a cursor"),
+    ])
+    def test_tampered_cursors_are_rejected(self, sort, cursor):
+        with pytest.raises(HTTPException) as error:
+            decode_cursor(cursor, sort, KEYSET_ORDERS[sort], EquipmentItem)
+        assert error.value.status_code == 400
+
+    def test_integral_float_columns_accept_ints(self):
+        cursor = make_cursor({"s": "ev", "v": [2, 7]})
+        assert decode_cursor(cursor, "ev", KEYSET_ORDERS["ev"], EquipmentItem) == [2, 7]
+
+    def test_tampered_cursor_gives_400_from_the_api(self, items, api_client):
+        response = api_client.get("/api/data/equipment/", params={
+            "sort": "name", "cursor": "eyJzIjoibmFtZSIsInYiOlt7fSwxXX0="  # {"s":"name","v":[{},1]}
+        })
+        assert response.status_code == 400
+
+    def test_paging_through_the_api(self, items, api_client):
+        first = api_client.get("/api/data/equipment/", params={"sort": "ev", "limit": 20}).json()
+        second = api_client.get("/api/data/equipment/", params={
+            "sort": "ev", "limit": 20, "cursor": first["next_cursor"]
+        }).json()
+        assert first["has_more"] and not second["has_more"] and second["next_cursor"] is None
+        keys = [item["key"] for item in first["result"] + second["result"]]
+        assert sorted(keys) == list(range(1, 24))
@@ -0,0 +1,62 @@
+"""
+Tests for content-hash interning of identical progression tables.
+"""
+
+import pytest
+
+from database.compiled import get_registry
+from database.models import ProgressionTable, ProgressionValue
+from scripts.importers.progressions import ProgressionsImporter
+
+
+def table_data(points, table_type='linear'):
+    return {
+        'type': table_type,
+        'name': '',
+        'description': '',
+        'values': [{'level': level, 'value': value} for level, value in points]
+    }
+
+
+@pytest.fixture
+def importer(db_session):
+    return ProgressionsImporter(None, db_session)
+
+
+def run_import(importer, data):
+    importer.import_data(importer.transform_data(data))
+    importer.db.commit()
+
+
+@pytest.mark.unit
+class TestProgressionInterning:
+    def test_identical_tables_share_one_curve(self, importer, db_session):
+        curve = [(1, 2.0), (10, 20.0)]
+        run_import(importer, {'b': table_data(curve), 'a': table_data(curve), 'c': table_data([(1, 3.0)])})
+
+        assert db_session.get(ProgressionTable, 'a').canonical_id is None
+        assert db_session.get(ProgressionTable, 'b').canonical_id == 'a'
+        assert db_session.query(ProgressionValue).filter_by(table_id='b').count() == 0
+
+        registry = get_registry(db_session)
+        assert registry.get_progression('b') is registry.get_progression('a')
+        assert registry.get_value('b', 5) == pytest.approx(10.0)
+        assert registry.curve_count == 2
+
+    def test_array_and_linear_tables_are_not_merged(self, importer, db_session):
+        curve = [(1, 2.0), (2, 4.0)]
+        run_import(importer, {'a': table_data(curve), 'b': table_data(curve, 'array')})
+        assert db_session.get(ProgressionTable, 'b').canonical_id is None
+
+    def test_changing_a_canonical_table_keeps_its_aliases(self, importer, db_session):
+        curve = [(1, 2.0), (10, 20.0)]
+        run_import(importer, {'a': table_data(curve), 'b': table_data(curve), 'c': table_data(curve)})
+
+        # Re-import only the canonical table, with different content
+        run_import(importer, {'a': table_data([(1, 100.0)])})
+
+        assert db_session.get(ProgressionTable, 'b').canonical_id is None
+        assert db_session.get(ProgressionTable, 'c').canonical_id == 'b'
+        registry = get_registry(db_session)
+        assert registry.get_value('a', 1) == 100.0
+        assert registry.get_value('c', 10) == 20.0
@@ -0,0 +1,42 @@
+"""
+Tests for the column-only list projections.
+"""
+
+import pytest
+
+from database.models import EquipmentItem, Essence, ItemQuality, Weapon
+from database.models.items import equipment_list_json, essence_list_json, project_equipment_list, project_essence_list
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        EquipmentItem(key=1, name="Ring", base_ilvl=500, quality=ItemQuality.RARE, slot="FINGER",
+                      icon="1-2", sockets_basic=1),
+        Weapon(key=2, name="Sword", base_ilvl=505, quality=ItemQuality.INCOMPARABLE, slot="MAIN_HAND",
+               weapon_type="ONE_HANDED_SWORD", dps=12.5, sockets_primary=1, sockets_vital=1),
+        Weapon(key=3, name="Club", base_ilvl=505, quality=ItemQuality.COMMON, slot="MAIN_HAND"),
+        Essence(key=4, name="Vivid Essence", base_ilvl=532, quality=ItemQuality.RARE, essence_type=22, icon="7"),
+        Essence(key=5, name="Odd Essence", base_ilvl=532, quality=ItemQuality.RARE, essence_type=99),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestListProjections:
+    def test_equipment_matches_models(self, items, query_budget):
+        models = [item.to_list_json() for item in items.query(EquipmentItem).order_by(EquipmentItem.key)]
+        items.expunge_all()
+        with query_budget(1):
+            rows = project_equipment_list(items.query(EquipmentItem).order_by(EquipmentItem.key)).all()
+        assert [equipment_list_json(row) for row in rows] == models
+
+    def test_filters_are_kept(self, items):
+        query = items.query(EquipmentItem).filter(EquipmentItem.slot == "MAIN_HAND")
+        assert [row.key for row in project_equipment_list(query)] == [2, 3]
+
+    def test_essences_match_models(self, items):
+        models = [item.to_list_json() for item in items.query(Essence).order_by(Essence.key)]
+        rows = project_essence_list(items.query(Essence).order_by(Essence.key)).all()
+        assert [essence_list_json(row) for row in rows] == models
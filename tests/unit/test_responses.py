@@ -0,0 +1,78 @@
+"""
+Tests for the data API's response encoding and pre-rendered item JSON.
+"""
+
+import orjson
+import pytest
+
+from database.models import EquipmentItem, ItemQuality, ItemRender, ItemStat, Weapon
+from database.models.items import equipment_list_json, load_item, project_equipment_list
+from scripts.importers.item_renders import ItemRendersImporter
+from web.api.data.models import EquipmentListResponse, ItemResponse
+from web.api.data.responses import DataJSONResponse, join_json_array, rendered_response
+
+PAGE = dict(total=2, total_is_estimate=False, limit=99, skip=0, has_more=False, next_cursor=None)
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        EquipmentItem(key=1, name="Ring", base_ilvl=505, quality=ItemQuality.RARE, slot="FINGER", icon="1-2"),
+        Weapon(key=2, name="Sword", base_ilvl=505, quality=ItemQuality.RARE, slot="MAIN_HAND", dps=12.5,
+               sockets_basic=2),
+        ItemStat(item_key=1, stat_name="MIGHT", value_table_id="might", order=0),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestRenderedResponse:
+    def test_matches_the_dict_path_with_fields(self, items):
+        rows = project_equipment_list(items.query(EquipmentItem).order_by(EquipmentItem.key)).all()
+        entries = [equipment_list_json(row) for row in rows]
+
+        spliced = rendered_response(join_json_array(orjson.dumps(entry) for entry in entries), **PAGE)
+        expected = DataJSONResponse({"result": entries, **PAGE})
+        assert spliced.media_type == "application/json"
+        assert orjson.loads(spliced.body) == orjson.loads(expected.body)
+        assert EquipmentListResponse.model_validate_json(spliced.body) == EquipmentListResponse(result=entries, **PAGE)
+
+    def test_matches_the_dict_path_without_fields(self, items):
+        detail = load_item(items, 2).to_json()
+        spliced = rendered_response(orjson.dumps(detail))
+        assert orjson.loads(spliced.body) == orjson.loads(DataJSONResponse({"result": detail}).body)
+        assert ItemResponse.model_validate_json(spliced.body) == ItemResponse(result=detail)
+
+    def test_empty_result(self):
+        assert orjson.loads(rendered_response(join_json_array([]), total=0).body) == {"result": [], "total": 0}
+
+
+@pytest.mark.unit
+class TestRenderedEndpoints:
+    def mark_renders(self, items):
+        """Pre-render every item, then tag the stored JSON so responses show where they came from."""
+        ItemRendersImporter(items).refresh()
+        for render in items.query(ItemRender):
+            render.detail_json = orjson.dumps({**orjson.loads(render.detail_json), "name": "Rendered"})
+            render.list_json = orjson.dumps({**orjson.loads(render.list_json), "name": "Rendered"})
+        items.commit()
+
+    def test_detail_uses_renders(self, items, api_client):
+        self.mark_renders(items)
+        assert api_client.get("/api/data/items/2").json()["result"]["name"] == "Rendered"
+
+    def test_detail_falls_back_to_the_model(self, items, api_client):
+        response = api_client.get("/api/data/items/2")
+        assert response.json() == {"result": load_item(items, 2).to_json()}
+
+    def test_listing_uses_renders(self, items, api_client):
+        self.mark_renders(items)
+        result = api_client.get("/api/data/equipment/").json()["result"]
+        assert [entry["name"] for entry in result] == ["Rendered", "Rendered"]
+
+    def test_listing_falls_back_to_the_model(self, items, api_client):
+        body = api_client.get("/api/data/equipment/").json()
+        expected = [items.get(EquipmentItem, key).to_list_json() for key in (2, 1)]
+        assert body["result"] == expected
+        assert body["total"] == 2
@@ -0,0 +1,56 @@
+"""
+Tests for item name search, including the word similarity fallback used outside PostgreSQL.
+"""
+
+import pytest
+
+from database.models import EquipmentItem, ItemQuality
+from database.search import filter_by_name, order_by_relevance, word_similarity
+
+
+@pytest.mark.unit
+class TestWordSimilarity:
+    def test_matches_pg_trgm_documented_value(self):
+        # Example from the pg_trgm documentation
+        assert word_similarity('word', 'two words') == pytest.approx(0.8)
+
+    def test_whole_word_is_exact(self):
+        assert word_similarity('ring', 'Ring of Might') == 1.0
+
+    def test_typo_is_similar(self):
+        assert 0.4 <= word_similarity('braclet', 'Ancient Bracelet') < 1.0
+
+    def test_unrelated_and_empty(self):
+        assert word_similarity('xyz', 'Ring') == 0.0
+        assert word_similarity('', 'Ring') == 0.0
+        assert word_similarity('ring', None) == 0.0
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        EquipmentItem(key=1, name="Ancient Bracelet", base_ilvl=500, quality=ItemQuality.RARE, slot="WRIST"),
+        EquipmentItem(key=2, name="Ring of Might", base_ilvl=500, quality=ItemQuality.RARE, slot="FINGER"),
+        EquipmentItem(key=3, name="Earring", base_ilvl=500, quality=ItemQuality.RARE, slot="EAR"),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestNameSearch:
+    def test_substring(self, items):
+        query = filter_by_name(items.query(EquipmentItem), EquipmentItem.name, "RING")
+        assert sorted(item.key for item in query) == [2, 3]
+
+    def test_substring_does_not_tolerate_typos(self, items):
+        assert filter_by_name(items.query(EquipmentItem), EquipmentItem.name, "braclet").count() == 0
+
+    def test_fuzzy_tolerates_typos(self, items):
+        query = filter_by_name(items.query(EquipmentItem), EquipmentItem.name, "braclet", "fuzzy")
+        assert [item.key for item in query] == [1]
+
+    def test_fuzzy_ranks_best_match_first(self, items):
+        query = filter_by_name(items.query(EquipmentItem), EquipmentItem.name, "ring", "fuzzy")
+        ranked = order_by_relevance(query, EquipmentItem.name, "ring", EquipmentItem.key)
+        assert [item.key for item in ranked] == [2, 3]
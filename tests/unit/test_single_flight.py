@@ -0,0 +1,59 @@
+"""
+Tests for single-flight request coalescing.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from web.api.services.single_flight import SingleFlight
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_computation(self):
+        flight = SingleFlight(ttl=60, maxsize=8)
+        started, release = threading.Event(), threading.Event()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return b"page"
+
+        with ThreadPoolExecutor(4) as pool:
+            leader = pool.submit(flight.do, "key", compute)
+            started.wait(5)
+            followers = [pool.submit(flight.do, "key", compute) for _ in range(3)]
+            while flight.get_stats()['collapsed'] < 3:
+                time.sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+
+        assert results == [b"page"] * 4
+        assert len(calls) == 1
+        assert flight.get_stats()['collapsed'] == 3
+
+    def test_results_expire_after_ttl(self):
+        flight = SingleFlight(ttl=60, maxsize=8)
+        assert flight.do("key", lambda: 1) == 1
+        assert flight.do("key", lambda: 2) == 1
+        assert flight.get_stats()['cache_hits'] == 1
+
+        flight.ttl = 0
+        flight.do("other", lambda: 3)
+        assert flight.do("other", lambda: 4) == 4
+
+    def test_errors_are_not_cached(self):
+        flight = SingleFlight(ttl=60, maxsize=8)
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            flight.do("key", fail)
+        assert flight.do("key", lambda: 5) == 5
+        assert flight.get_stats()['in_flight'] == 0
@@ -0,0 +1,63 @@
+"""
+Tests for the materialized item stat values import stage.
+"""
+
+import pytest
+
+from database.models import (
+    DataVersion, EquipmentItem, ItemQuality, ItemStat, ItemStatValue, ProgressionTable, ProgressionType, ProgressionValue
+)
+from scripts.importers.stat_values import StatValuesImporter
+
+
+@pytest.fixture
+def items(db_session):
+    db_session.add_all([
+        ProgressionTable(table_id="a", progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id="a", item_level=500, value=100.0),
+        ProgressionValue(table_id="a", item_level=510, value=200.0),
+        ProgressionTable(table_id="b", progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id="b", item_level=500, value=1.0),
+        ProgressionValue(table_id="b", item_level=510, value=2.0),
+        EquipmentItem(key=1, name="Ring", base_ilvl=505, quality=ItemQuality.RARE, slot="FINGER"),
+        EquipmentItem(key=2, name="Earring", base_ilvl=505, quality=ItemQuality.RARE, slot="EAR"),
+        ItemStat(item_key=1, stat_name="MIGHT", value_table_id="a", order=0),
+        ItemStat(item_key=2, stat_name="FATE", value_table_id="b", order=0),
+    ])
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestStatValuesImporter:
+    def test_full_refresh_matches_model_values(self, items):
+        written = StatValuesImporter(items, 500, 510).refresh()
+        assert written == 2 * 11
+        row = items.get(ItemStatValue, (1, "MIGHT", 505))
+        assert row.value == pytest.approx(items.get(EquipmentItem, 1).get_stats_at_ilvl(505)["MIGHT"])
+
+    def test_incremental_refresh_only_touches_affected_items(self, items):
+        StatValuesImporter(items, 500, 510).refresh()
+        items.get(ProgressionValue, ("b", 510)).value = 12.0
+        items.commit()
+
+        written = StatValuesImporter(items, 500, 510).refresh(progression_table_ids={"b"})
+        assert written == 11
+        assert items.get(ItemStatValue, (2, "FATE", 510)).value == 12.0
+        assert items.query(ItemStatValue).count() == 2 * 11
+
+    def test_full_refresh_records_band(self, items):
+        assert DataVersion.get_stat_values_band(items) is None
+        StatValuesImporter(items, 500, 510).refresh()
+        assert DataVersion.get_stat_values_band(items) == (500, 510)
+
+    def test_incremental_refresh_over_another_band_refreshes_everything(self, items):
+        StatValuesImporter(items, 500, 510).refresh()
+        written = StatValuesImporter(items, 505, 506).refresh(progression_table_ids={"b"})
+        assert written == 2 * 2
+        assert items.query(ItemStatValue).count() == 2 * 2
+        assert DataVersion.get_stat_values_band(items) == (505, 506)
+
+    def test_invalid_band(self, items):
+        with pytest.raises(ValueError):
+            StatValuesImporter(items, 600, 500)
@@ -0,0 +1,79 @@
+"""
+Tests for the stat value LRU cache and data version invalidation of the registry.
+"""
+
+import pytest
+
+from database.compiled import LRUCache, get_registry, progression_registry
+from database.compiled.cache import MISSING
+from database.models import DataVersion, ProgressionTable, ProgressionType, ProgressionValue
+
+
+@pytest.mark.unit
+class TestLRUCache:
+    def test_counts_hits_and_misses(self):
+        cache = LRUCache(2)
+        assert cache.get("a") is MISSING
+        cache.put("a", 1.0)
+        assert cache.get("a") == 1.0
+        assert cache.get_stats() == {'size': 1, 'maxsize': 2, 'hits': 1, 'misses': 1, 'evictions': 0}
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1.0)
+        cache.put("b", 2.0)
+        cache.get("a")
+        cache.put("c", 3.0)
+        assert cache.get("b") is MISSING
+        assert cache.get("a") == 1.0
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_invalid_size(self):
+        with pytest.raises(ValueError):
+            LRUCache(0)
+
+
+@pytest.fixture
+def table(db_session):
+    db_session.add_all([
+        ProgressionTable(table_id="a", progression_type=ProgressionType.LINEAR),
+        ProgressionValue(table_id="a", item_level=500, value=100.0),
+        ProgressionValue(table_id="a", item_level=510, value=200.0),
+    ])
+    DataVersion.bump(db_session)
+    db_session.commit()
+    return db_session
+
+
+@pytest.mark.unit
+class TestDataVersionInvalidation:
+    def test_bump_increments(self, db_session):
+        assert DataVersion.get_current(db_session) == 0
+        assert DataVersion.bump(db_session) == 1
+        assert DataVersion.bump(db_session) == 2
+
+    def test_repeated_lookups_hit_cache(self, table):
+        registry = get_registry(table)
+        registry.get_value("a", 505)
+        registry.get_value("a", 505)
+        stats = registry.get_cache_stats()
+        assert stats['data_version'] == 1
+        assert (stats['hits'], stats['misses']) == (1, 1)
+
+    def test_reimport_reloads_after_version_bump(self, table, monkeypatch):
+        registry = get_registry(table)
+        assert registry.get_value("a", 510) == 200.0
+
+        # Another process re-imports the table and bumps the version
+        table.get(ProgressionValue, ("a", 510)).value = 300.0
+        DataVersion.bump(table)
+        table.commit()
+
+        # Within the poll interval the worker keeps its compiled tables
+        assert get_registry(table).get_value("a", 510) == 200.0
+
+        monkeypatch.setattr(progression_registry, "VERSION_POLL_SECONDS", 0.0)
+        registry = get_registry(table)
+        assert registry.version == 2
+        assert registry.get_value("a", 510) == 300.0
@@ -9,6 +9,10 @@ from typing import List
 
 from database.session import get_session
 from database.models.user import User, UserSession, UserRole
+from database.compiled import progression_registry
+from ..data.counts import count_cache
+from ..data.coalescing import data_single_flight
+from ..data.equipment import ev_rankings
 from .models import (
     UserCreate, UserResponse, AdminUserCreate, AdminUserResponse,
     UserListResponse, UserRoleUpdate
@@ -33,7 +37,7 @@ def generate_random_password(length: int = 8) -> str:
 router = APIRouter(tags=["admin"])
 
 @router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-async def create_user(
+def create_user(
     user_in: UserCreate,
     request: Request,
     db_session: Session = Depends(get_session)
@@ -70,7 +74,7 @@ async def create_user(
     return new_user
 
 @router.post("/users/simple", response_model=AdminUserResponse, status_code=status.HTTP_201_CREATED)
-async def create_simple_user(
+def create_simple_user(
     user_in: AdminUserCreate,
     request: Request,
     db_session: Session = Depends(get_session)
@@ -116,7 +120,7 @@ async def create_simple_user(
     )
 
 @router.get("/users", response_model=List[UserListResponse])
-async def list_users(
+def list_users(
     request: Request,
     db_session: Session = Depends(get_session)
 ):
@@ -142,7 +146,7 @@ async def list_users(
     ]
 
 @router.put("/users/{user_id}/role", response_model=UserListResponse)
-async def update_user_role(
+def update_user_role(
     user_id: int,
     role_update: UserRoleUpdate,
     request: Request,
@@ -173,7 +177,7 @@ async def update_user_role(
     )
 
 @router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(
+def delete_user(
     user_id: int,
     request: Request,
     db_session: Session = Depends(get_session)
@@ -199,4 +203,19 @@ async def delete_user(
     db_session.delete(user)
     db_session.commit()
     
-    return 
\ No newline at end of file
+    return 
+
+@router.get("/cache-stats")
+async def get_cache_stats(request: Request):
+    """
+    Admin-only endpoint to inspect the in-memory game data caches of this worker.
+    Returns the data version the worker has compiled, the stat value cache counters, the
+    list count cache counters, the data request coalescing counters and the EV ranking cache counters.
+    """
+    # Middleware ensures current_user is set and has admin role for /api/auth/admin/* routes
+    return {
+        "progressions": progression_registry.get_cache_stats(),
+        "counts": count_cache.get_stats(),
+        "coalescing": data_single_flight.get_stats(),
+        "ev_rankings": ev_rankings.get_stats()
+    }
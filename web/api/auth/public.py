@@ -38,7 +38,7 @@ def get_auth_session_expiry() -> datetime:
 router = APIRouter(tags=["auth"])
 
 @router.post("/login", response_model=UserResponse)
-async def login(
+def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db_session: Session = Depends(get_session),
@@ -86,7 +86,7 @@ async def login(
     return user
 
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
-async def logout(
+def logout(
     request: Request,
     db_session: Session = Depends(get_session),
     response: Response = None
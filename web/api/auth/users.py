@@ -25,7 +25,7 @@ def hash_password(password: str) -> str:
 router = APIRouter(tags=["users"])
 
 @router.put("/profile", response_model=UserResponse)
-async def update_profile(
+def update_profile(
     profile_data: ProfileUpdate,
     request: Request,
     db_session: Session = Depends(get_session)
@@ -58,7 +58,7 @@ async def update_profile(
     return current_user
 
 @router.put("/password", status_code=status.HTTP_204_NO_CONTENT)
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     request: Request,
     db_session: Session = Depends(get_session)
@@ -0,0 +1,57 @@
+"""
+Request coalescing for data endpoints.
+
+Pages often fire the same data request several times while loading. Identical requests - same
+route, same normalized parameters, same data version - share one computation: concurrent ones wait
+for the request already in flight, and ones arriving within DATA_RESULT_CACHE_TTL reuse its
+serialized response. The data version in the key means a reimport is never served from before it.
+"""
+import functools
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from database.compiled import get_registry
+from ...config.config import DATA_RESULT_CACHE_SIZE, DATA_RESULT_CACHE_TTL
+from ..services.single_flight import SingleFlight
+
+# Process-wide coalescer shared by all data routes
+data_single_flight = SingleFlight(ttl=DATA_RESULT_CACHE_TTL, maxsize=DATA_RESULT_CACHE_SIZE)
+
+
+def normalize_params(params: Dict[str, Any]) -> Tuple:
+    """Turn endpoint parameters into a hashable key; list order does not matter."""
+    normalized = []
+    for name, value in sorted(params.items()):
+        if isinstance(value, list):
+            value = tuple(sorted(value))
+        elif isinstance(value, BaseModel):
+            value = value.model_dump_json()  # Request bodies
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def coalesced(route: str) -> Callable:
+    """
+    Decorate a data endpoint (a plain def with a `db` session parameter) so identical concurrent
+    requests share one computation of its response.
+
+    Args:
+        route: Name of the route, part of the key
+    """
+    def decorator(handler: Callable) -> Callable:
+        @functools.wraps(handler)
+        def wrapper(**kwargs):
+            db = kwargs['db']
+            params = {name: value for name, value in kwargs.items() if name != 'db'}
+            key = (route, get_registry(db).version, normalize_params(params))
+
+            def compute():
+                response = handler(**kwargs)
+                return response.status_code, response.media_type, response.body
+
+            status_code, media_type, body = data_single_flight.do(key, compute)
+            return Response(content=body, status_code=status_code, media_type=media_type)
+        return wrapper
+    return decorator
@@ -0,0 +1,98 @@
+"""
+Total counts for list endpoints.
+
+Exact totals are cached per listing and normalized filter set, keyed by the data version the
+worker's registry has compiled, so a reimport retires every cached total. Clients that do not need
+an exact total (e.g. infinite scroll loading the next page) can ask for a planner estimate or for
+no count at all.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from database.compiled import LRUCache, get_registry
+from database.compiled.cache import MISSING
+
+# Values of the `count` query parameter
+COUNT_MODES = ('exact', 'estimate', 'none')
+COUNT_MODE_PATTERN = f"^({'|'.join(COUNT_MODES)})$"
+
+# Number of (listing, filters) totals kept per worker
+COUNT_CACHE_SIZE = 1024
+
+count_cache = LRUCache(COUNT_CACHE_SIZE)
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN of a SELECT, used to read the planner's row estimate."""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, 'postgresql')
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def normalize_filters(filters: Dict[str, Any]) -> Tuple:
+    """
+    Normalize list filters into a hashable cache key.
+    Unset filters are dropped, lists become sorted tuples and search text is case-folded, so
+    equivalent requests share one cached total.
+    """
+    normalized = []
+    for name, value in sorted(filters.items()):
+        if value is None or value == [] or value == '':
+            continue
+        if isinstance(value, (list, tuple, set)):
+            value = tuple(sorted(set(value)))
+        elif name == 'search':
+            value = value.lower()  # Search is case-insensitive
+        normalized.append((name, value))
+    return tuple(normalized)
+
+
+def estimate_count(db: Session, query) -> Optional[int]:
+    """Get the planner's row estimate for a query (PostgreSQL only), or None."""
+    if db.get_bind().dialect.name != 'postgresql':
+        return None
+    plan = db.execute(_Explain(query.statement)).scalar()
+    return int(plan[0]['Plan']['Plan Rows'])
+
+
+def get_total(db: Session, query, listing: str, filters: Dict[str, Any], mode: str = 'exact') -> Tuple[Optional[int], bool]:
+    """
+    Get the total row count of a filtered listing.
+
+    Args:
+        db: Database session
+        query: The filtered (unsorted, unpaged) listing query
+        listing: Name of the listing, e.g. "equipment"
+        filters: Every filter applied to the query
+        mode: exact, estimate or none
+
+    Returns:
+        (total, is_estimate) - total is None in "none" mode. A cached exact total is returned for
+        "estimate" too; otherwise the estimate falls back to an exact count where the database
+        cannot provide one.
+    """
+    if mode == 'none':
+        return None, False
+
+    key = (get_registry(db).version, listing, normalize_filters(filters))
+    total = count_cache.get(key)
+    if total is not MISSING:
+        return total, False
+
+    if mode == 'estimate':
+        estimate = estimate_count(db, query)
+        if estimate is not None:
+            return estimate, True
+
+    total = query.count()
+    count_cache.put(key, total)
+    return total, False
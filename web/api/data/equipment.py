@@ -3,35 +3,72 @@ API endpoints for equipment database queries.
 This module handles complex database queries for equipment with search, filtering, and pagination.
 """
 from typing import List, Optional
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
 from database.session import SessionLocal
-from database.models.items import EquipmentItem
+from database.models.items import (
+    EquipmentItem, ItemStatValue, project_equipment_list, equipment_list_bytes, load_item
+)
+from database.interpolation import join_item_stat_value
+from database.search import SEARCH_MODE_PATTERN, filter_by_name, order_by_relevance
+from database.compiled import DEFAULT_EV_PROFILE, ev_profiles, get_ev_calculator, get_registry
+from ...config.config import MIN_ILVL, MAX_ILVL, EV_RANKING_CACHE_SIZE
+from ..services.ev_rankings import EVRankings
+from .pagination import fetch_keyset_page, fetch_offset_page
+from .counts import COUNT_MODE_PATTERN, get_total
+from .models import EquipmentListResponse, EVRankingResponse, EVCurveResponse, EVProfilesResponse
+from .responses import DataJSONResponse, join_json_array, rendered_response
+from .coalescing import coalesced
 
 # Create router
 router = APIRouter()
 
+# Process-wide EV rankings per (EV profile, slot, ilvl, data version)
+ev_rankings = EVRankings(maxsize=EV_RANKING_CACHE_SIZE)
+
+def check_ev_profile(profile: str) -> None:
+    """Reject EV profiles that are not defined (config/ev_profiles.json)."""
+    if profile not in ev_profiles:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown EV profile '{profile}'. Available profiles: {', '.join(sorted(ev_profiles))}"
+        )
+
 # Database session dependency
 def get_db():
     """Get a database session."""
     with SessionLocal() as session:
         yield session
 
-@router.get("/")
-async def query_equipment(
+@router.get("/", response_model=EquipmentListResponse)
+@coalesced("equipment")
+def query_equipment(
     # Pagination
     limit: int = Query(99, ge=1, le=99, description="Number of items to return"),
-    skip: int = Query(0, ge=0, description="Number of items to skip"),
+    skip: int = Query(0, ge=0, description="Number of items to skip (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     
     # Filtering
     slots: Optional[List[str]] = Query(None, description="Equipment slots to filter by"),
     
     # Search
     search: Optional[str] = Query(None, description="Search query for item names"),
+    search_mode: str = Query("substring", pattern=SEARCH_MODE_PATTERN, description="Search mode: substring or fuzzy (typo tolerant)"),
+    
+    # Concrete stat values (materialized at import time)
+    stat: Optional[str] = Query(None, description="Stat to filter or sort by concrete value, e.g. MIGHT or DPS"),
+    stat_ilvl: Optional[int] = Query(None, description="Item level of the stat values (defaults to each item's base ilvl)"),
+    min_stat_value: Optional[float] = Query(None, description="Only include items whose stat value is at least this"),
+    
+    # Essence value (precomputed at import time at each item's base ilvl)
+    min_ev: Optional[float] = Query(None, description="Only include items whose essence value is at least this"),
     
-    # Sorting
-    sort: str = Query("recent", description="Sort by: recent, name, base_ilvl"),
+    # Sorting (ev is the default EV profile's, at each item's base ilvl)
+    sort: str = Query("recent", description="Sort by: recent, name, base_ilvl, ev, stat, relevance"),
     
     db: Session = Depends(get_db)
 ):
@@ -48,33 +85,170 @@ async def query_equipment(
         
         # Apply search filtering
         if search:
-            search_term = f"%{search.lower()}%"
-            query = query.filter(EquipmentItem.name.ilike(search_term))
+            query = filter_by_name(query, EquipmentItem.name, search, search_mode)
+        
+        # Join concrete stat values for the requested stat and item level
+        if stat:
+            band = get_registry(db).stat_values_band
+            if stat_ilvl is not None and band is not None and band[0] <= stat_ilvl <= band[1]:
+                # Inside the band materialized at import time - use the indexed values
+                query = query.outerjoin(ItemStatValue, and_(
+                    ItemStatValue.item_key == EquipmentItem.key,
+                    ItemStatValue.stat_name == stat,
+                    ItemStatValue.ilvl == stat_ilvl
+                ))
+                stat_value = ItemStatValue.value
+            else:
+                # Any other ilvl (or each item's own base ilvl) - interpolate in the database
+                value_ilvl = stat_ilvl if stat_ilvl is not None else EquipmentItem.base_ilvl
+                query, stat_value = join_item_stat_value(query, EquipmentItem, stat, value_ilvl)
+            if min_stat_value is not None:
+                query = query.filter(stat_value >= min_stat_value)
+        
+        # Apply essence value filtering
+        if min_ev is not None:
+            query = query.filter(EquipmentItem.ev >= min_ev)
+        
+        # Get total count for pagination info (before applying sorting and paging)
+        filters = dict(
+            slots=slots, search=search, search_mode=search_mode,
+            stat=stat, stat_ilvl=stat_ilvl, min_stat_value=min_stat_value, min_ev=min_ev
+        )
+        total_count, total_is_estimate = get_total(db, query, "equipment", filters, count)
+        
+        # Page over plain rows of just the list columns - no ORM objects are hydrated
+        query = project_equipment_list(query)
         
-        # Apply sorting
-        if sort == "name":
-            query = query.order_by(EquipmentItem.name.asc())
-        elif sort == "base_ilvl":
-            query = query.order_by(EquipmentItem.base_ilvl.desc(), EquipmentItem.name.asc())
-        else:  # recent or default
-            query = query.order_by(EquipmentItem.key.desc(), EquipmentItem.name.asc())
+        # Apply sorting and pagination
+        if sort == "stat" and stat:
+            # Stat values can be NULL and are not unique, so this order pages by offset only
+            query = query.order_by(stat_value.desc().nulls_last(), EquipmentItem.key.desc())
+            equipment_items, has_more = fetch_offset_page(query, limit, skip)
+            next_cursor = None
+        elif sort == "relevance" and search:
+            # Best name matches first - also offset only
+            query = order_by_relevance(query, EquipmentItem.name, search, EquipmentItem.key.desc())
+            equipment_items, has_more = fetch_offset_page(query, limit, skip)
+            next_cursor = None
+        else:
+            equipment_items, next_cursor, has_more = fetch_keyset_page(
+                query, EquipmentItem, sort, limit, skip, cursor
+            )
         
-        # Get total count for pagination info (before applying limit/offset)
-        total_count = query.count()
+        # Splice the pre-rendered list JSON of each item (same JSON as the models' to_list_json)
+        equipment_data = join_json_array(equipment_list_bytes(row) for row in equipment_items)
         
-        # Apply pagination
-        equipment_items = query.offset(skip).limit(limit).all()
+        return rendered_response(
+            equipment_data,
+            total=total_count,
+            total_is_estimate=total_is_estimate,
+            limit=limit,
+            skip=skip,
+            has_more=has_more,
+            next_cursor=next_cursor
+        )
         
-        # Use polymorphic to_list_json method - each item type provides appropriate minimal data
-        equipment_data = [item.to_list_json() for item in equipment_items]
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to query equipment: {str(e)}")
+
+@router.get("/ev/profiles", response_model=EVProfilesResponse)
+def list_ev_profiles():
+    """
+    List the EV profiles the EV endpoints accept, with the default profile first.
+    """
+    names = [DEFAULT_EV_PROFILE] + sorted(name for name in ev_profiles if name != DEFAULT_EV_PROFILE)
+    return DataJSONResponse({
+        "result": [{"name": name, "description": ev_profiles[name].description} for name in names]
+    })
+
+@router.get("/ev", response_model=EVRankingResponse)
+@coalesced("equipment.ev")
+def rank_equipment_by_ev(
+    slot: Optional[str] = Query(None, description="Equipment slot to rank (every slot if omitted)"),
+    ilvl: int = Query(..., ge=MIN_ILVL, le=MAX_ILVL, description="Item level to compare every item at"),
+    limit: int = Query(99, ge=1, le=99, description="Number of items to return"),
+    skip: int = Query(0, ge=0, description="Number of items to skip"),
+    profile: str = Query(DEFAULT_EV_PROFILE, description="EV profile choosing the reference essences"),
+    db: Session = Depends(get_db)
+):
+    """
+    Rank equipment by essence value (EV) at an item level, best first.
+    
+    Unlike sort=ev on the listing (default profile EV at each item's base ilvl), every item is
+    scored at the requested ilvl with the requested profile. Rankings are memoized per profile,
+    slot, ilvl and data version.
+    """
+    check_ev_profile(profile)
+    
+    try:
+        keys, evs = ev_rankings.get_ranking(slot, ilvl, db, profile)
+        page_keys = keys[skip:skip + limit].tolist()
+        page_evs = evs[skip:skip + limit].tolist()
         
-        return {
-            "result": equipment_data,
-            "total": total_count,
-            "limit": limit,
-            "skip": skip,
-            "has_more": skip + len(equipment_data) < total_count
+        # The same list JSON as the listing, for just this page
+        rows = {
+            row.key: row for row in
+            project_equipment_list(db.query(EquipmentItem)).filter(EquipmentItem.key.in_(page_keys))
         }
+        entries = join_json_array(
+            b'{"ev":' + orjson.dumps(ev) + b',"item":' + equipment_list_bytes(rows[key]) + b'}'
+            for key, ev in zip(page_keys, page_evs) if key in rows
+        )
+        
+        return rendered_response(
+            entries,
+            total=len(keys),
+            limit=limit,
+            skip=skip,
+            has_more=skip + limit < len(keys),
+            slot=slot,
+            ilvl=ilvl,
+            profile=profile
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to rank equipment by EV: {str(e)}")
+
+@router.get("/ev/curve", response_model=EVCurveResponse)
+@coalesced("equipment.ev.curve")
+def get_equipment_ev_curve(
+    item_key: int = Query(..., description="Equipment item key"),
+    min_ilvl: int = Query(MIN_ILVL, ge=MIN_ILVL, le=MAX_ILVL, description="First item level of the curve"),
+    max_ilvl: int = Query(MAX_ILVL, ge=MIN_ILVL, le=MAX_ILVL, description="Last item level of the curve"),
+    profile: str = Query(DEFAULT_EV_PROFILE, description="EV profile choosing the reference essences"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the essence value (EV) of an equipment item at every item level in a range.
+    """
+    if min_ilvl > max_ilvl:
+        raise HTTPException(status_code=400, detail="min_ilvl must not be greater than max_ilvl")
+    check_ev_profile(profile)
+    
+    try:
+        item = load_item(db, item_key)
+        if not isinstance(item, EquipmentItem):
+            raise HTTPException(status_code=404, detail="Equipment item not found")
+        
+        # Score the item's stat curve as one batch, one row per item level
+        evs = get_ev_calculator(db, profile).calculate_curve_ev(
+            item.get_stats_curve_json(min_ilvl, max_ilvl), item.socket_summary
+        )
+        return DataJSONResponse({
+            "result": {
+                "key": item.key,
+                "min_ilvl": min_ilvl,
+                "max_ilvl": max_ilvl,
+                "profile": profile,
+                "ev": evs
+            }
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to query equipment: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get equipment EV curve: {str(e)}")
@@ -7,7 +7,13 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from database.session import SessionLocal
-from database.models.items import Essence
+from database.models.items import Essence, project_essence_list, essence_list_bytes
+from database.search import SEARCH_MODE_PATTERN, filter_by_name, order_by_relevance
+from .pagination import fetch_keyset_page, fetch_offset_page
+from .counts import COUNT_MODE_PATTERN, get_total
+from .models import EssenceListResponse
+from .responses import join_json_array, rendered_response
+from .coalescing import coalesced
 
 # Create router
 router = APIRouter()
@@ -18,11 +24,14 @@ def get_db():
     with SessionLocal() as session:
         yield session
 
-@router.get("/")
-async def query_essences(
+@router.get("/", response_model=EssenceListResponse)
+@coalesced("essences")
+def query_essences(
     # Pagination
     limit: int = Query(99, ge=1, le=99, description="Number of items to return"),
-    skip: int = Query(0, ge=0, description="Number of items to skip"),
+    skip: int = Query(0, ge=0, description="Number of items to skip (ignored when a cursor is given)"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page's next_cursor"),
+    count: str = Query("exact", pattern=COUNT_MODE_PATTERN, description="Total count: exact, estimate or none"),
     
     # Filtering
     essence_type: Optional[int] = Query(None, description="Filter by essence type"),
@@ -30,9 +39,10 @@ async def query_essences(
     
     # Search
     search: Optional[str] = Query(None, description="Search query for item names"),
+    search_mode: str = Query("substring", pattern=SEARCH_MODE_PATTERN, description="Search mode: substring or fuzzy (typo tolerant)"),
     
     # Sorting
-    sort: str = Query("recent", description="Sort by: recent, name, base_ilvl"),
+    sort: str = Query("recent", description="Sort by: recent, name, base_ilvl, relevance"),
     
     db: Session = Depends(get_db)
 ):
@@ -53,33 +63,38 @@ async def query_essences(
         
         # Apply search filtering
         if search:
-            search_term = f"%{search.lower()}%"
-            query = query.filter(Essence.name.ilike(search_term))
+            query = filter_by_name(query, Essence.name, search, search_mode)
         
-        # Apply sorting
-        if sort == "name":
-            query = query.order_by(Essence.name.asc())
-        elif sort == "base_ilvl":
-            query = query.order_by(Essence.base_ilvl.desc(), Essence.name.asc())
-        else:  # recent or default
-            query = query.order_by(Essence.key.desc(), Essence.name.asc())
+        # Get total count for pagination info (before applying sorting and paging)
+        filters = dict(essence_type=essence_type, tier=tier, search=search, search_mode=search_mode)
+        total_count, total_is_estimate = get_total(db, query, "essences", filters, count)
         
-        # Get total count for pagination info (before applying limit/offset)
-        total_count = query.count()
+        # Page over plain rows of just the list columns - no ORM objects are hydrated
+        query = project_essence_list(query)
         
-        # Apply pagination
-        essence_items = query.offset(skip).limit(limit).all()
+        # Apply sorting and pagination
+        if sort == "relevance" and search:
+            # Best name matches first - relevance is not a unique position, so offset only
+            query = order_by_relevance(query, Essence.name, search, Essence.key.desc())
+            essence_items, has_more = fetch_offset_page(query, limit, skip)
+            next_cursor = None
+        else:
+            essence_items, next_cursor, has_more = fetch_keyset_page(query, Essence, sort, limit, skip, cursor)
         
-        # Use polymorphic to_list_json method - each item type provides appropriate minimal data
-        essence_data = [essence.to_list_json() for essence in essence_items]
+        # Splice the pre-rendered list JSON of each item (same JSON as the models' to_list_json)
+        essence_data = join_json_array(essence_list_bytes(row) for row in essence_items)
         
-        return {
-            "result": essence_data,
-            "total": total_count,
-            "limit": limit,
-            "skip": skip,
-            "has_more": skip + len(essence_data) < total_count
-        }
+        return rendered_response(
+            essence_data,
+            total=total_count,
+            total_is_estimate=total_is_estimate,
+            limit=limit,
+            skip=skip,
+            has_more=has_more,
+            next_cursor=next_cursor
+        )
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to query essences: {str(e)}") 
\ No newline at end of file
@@ -5,10 +5,19 @@ Provides efficient endpoints that separate base item data from concrete calculat
 """
 from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from database.session import SessionLocal
-from database.models.items import Item
+from database.models.items import ItemRender, load_item, load_items
+from database.compiled import get_name_index
+from ...config.config import MIN_ILVL, MAX_ILVL
+from .models import (
+    StatsBatchRequest, ItemStatsBatchResponse, ItemSuggestionsResponse, ItemResponse,
+    ItemStatsResponse, ConcreteItemResponse, ItemStatCurveResponse
+)
+from .responses import DataJSONResponse, rendered_response
+from .coalescing import coalesced
 
 # Create router
 router = APIRouter()
@@ -19,8 +28,65 @@ def get_db():
     with SessionLocal() as session:
         yield session
 
-@router.get("/{item_key}")
-async def get_item(
+@router.post("/stats:batch", response_model=ItemStatsBatchResponse)
+@coalesced("items.stats_batch")
+def get_items_stats_batch(
+    batch: StatsBatchRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Get concrete stats for many items in one request.
+    
+    Takes a list of {key, ilvl} pairs (ilvl defaults to the item's base ilvl) and returns one
+    result per pair, in input order. Items and their stats are loaded with a fixed number of
+    queries regardless of batch size; unknown keys give a null entry.
+    """
+    try:
+        # Load every requested item as its concrete subclass, with stats, in two queries
+        items = load_items(db, (entry.key for entry in batch.items))
+        items_by_key = {item.key: item for item in items}
+        
+        results = []
+        for entry in batch.items:
+            item = items_by_key.get(entry.key)
+            if not item:
+                results.append(None)
+                continue
+            
+            target_ilvl = entry.ilvl if entry.ilvl is not None else item.base_ilvl
+            results.append({
+                "key": item.key,
+                **item.get_stats_json(target_ilvl)
+            })
+        
+        return DataJSONResponse({
+            "result": results
+        })
+        
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get batch item stats: {str(e)}")
+
+@router.get("/suggest", response_model=ItemSuggestionsResponse)
+def suggest_items(
+    q: str = Query(..., min_length=1, max_length=100, description="Name prefix"),
+    slot: Optional[str] = Query(None, description="Only suggest equipment for this slot"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions")
+):
+    """
+    Suggest items whose name, or a later word of it, starts with a prefix.
+    Served from the in-memory name index, so search-as-you-type does not query the database.
+    """
+    try:
+        return DataJSONResponse({
+            "result": get_name_index().suggest(q, slot=slot, limit=limit)
+        })
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get item suggestions: {str(e)}")
+
+@router.get("/{item_key}", response_model=ItemResponse)
+@coalesced("items.item")
+def get_item(
     item_key: int = Path(..., description="Item key"),
     db: Session = Depends(get_db)
 ):
@@ -29,23 +95,29 @@ async def get_item(
     Returns the item object with all base properties but no concrete stats.
     """
     try:
-        # Get the item (will automatically load the correct subclass)
-        item = db.query(Item).filter(Item.key == item_key).first()
+        # Serve the JSON pre-rendered at import time when there is one - a single primary key read
+        detail_json = db.scalar(select(ItemRender.detail_json).where(ItemRender.item_key == item_key))
+        if detail_json is not None:
+            return rendered_response(detail_json)
+        
+        # Get the item as its concrete subclass, with stats, in two queries
+        item = load_item(db, item_key)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         
         # Use polymorphic to_json method - each subclass provides appropriate data
-        return {
+        return DataJSONResponse({
             "result": item.to_json()
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get item: {str(e)}")
 
-@router.get("/{item_key}/stats")
-async def get_item_stats(
+@router.get("/{item_key}/stats", response_model=ItemStatsResponse)
+@coalesced("items.stats")
+def get_item_stats(
     item_key: int = Path(..., description="Item key"),
     ilvl: int = Query(..., description="Item level for concrete stats"),
     db: Session = Depends(get_db)
@@ -55,23 +127,24 @@ async def get_item_stats(
     Returns only the calculated stat values and DPS - no base item data.
     """
     try:
-        # Get the item
-        item = db.query(Item).filter(Item.key == item_key).first()
+        # Get the item as its concrete subclass, with stats, in two queries
+        item = load_item(db, item_key)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         
         # Use polymorphic get_stats_json method - handles type-specific stats like DPS
-        return {
+        return DataJSONResponse({
             "result": item.get_stats_json(ilvl)
-        }
+        })
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get item stats: {str(e)}")
 
-@router.get("/{item_key}/concrete")
-async def get_concrete_item(
+@router.get("/{item_key}/concrete", response_model=ConcreteItemResponse)
+@coalesced("items.concrete")
+def get_concrete_item(
     item_key: int = Path(..., description="Item key"),
     ilvl: Optional[int] = Query(None, description="Item level for concrete stats (defaults to base ilvl)"),
     db: Session = Depends(get_db)
@@ -85,8 +158,8 @@ async def get_concrete_item(
     Returns combined item data and stats at the specified level (or base ilvl if not specified).
     """
     try:
-        # Get the item
-        item = db.query(Item).filter(Item.key == item_key).first()
+        # Get the item as its concrete subclass, with stats, in two queries
+        item = load_item(db, item_key)
         if not item:
             raise HTTPException(status_code=404, detail="Item not found")
         
@@ -98,15 +171,48 @@ async def get_concrete_item(
         stats_data = item.get_stats_json(target_ilvl)
         
         # Combine into a single response
-        return {
+        return DataJSONResponse({
             "result": {
                 **item_data,  # All base item properties
                 "concrete_ilvl": stats_data['ilvl'],  # The level these stats are calculated for
                 "stats": stats_data['stat_values']  # Calculated stats at the target level
             }
-        }
+        })
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get concrete item: {str(e)}")
+
+@router.get("/{item_key}/curve", response_model=ItemStatCurveResponse)
+@coalesced("items.curve")
+def get_item_stat_curve(
+    item_key: int = Path(..., description="Item key"),
+    min_ilvl: int = Query(MIN_ILVL, ge=MIN_ILVL, le=MAX_ILVL, description="First item level of the curve"),
+    max_ilvl: int = Query(MAX_ILVL, ge=MIN_ILVL, le=MAX_ILVL, description="Last item level of the curve"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get concrete stats for an item at every item level in a range.
+    
+    Returns parallel arrays (one value per item level for each stat, plus DPS for weapons)
+    so the frontend can move through item levels without any further requests.
+    """
+    if min_ilvl > max_ilvl:
+        raise HTTPException(status_code=400, detail="min_ilvl must not be greater than max_ilvl")
+    
+    try:
+        # Get the item as its concrete subclass, with stats, in two queries
+        item = load_item(db, item_key)
+        if not item:
+            raise HTTPException(status_code=404, detail="Item not found")
+        
+        # Use polymorphic get_stats_curve_json method - handles type-specific curves like DPS
+        return DataJSONResponse({
+            "result": item.get_stats_curve_json(min_ilvl, max_ilvl)
+        })
         
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to get concrete item: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Failed to get item stat curve: {str(e)}")
@@ -0,0 +1,151 @@
+"""
+Pydantic models specific to data endpoints.
+"""
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+from ...config.config import MIN_ILVL, MAX_ILVL
+
+# --- Item Input Models ---
+
+class ItemLevelRequest(BaseModel):
+    """A single item to evaluate, optionally at a specific item level."""
+    key: int
+    ilvl: Optional[int] = Field(None, ge=MIN_ILVL, le=MAX_ILVL)  # Defaults to the item's base ilvl
+
+class StatsBatchRequest(BaseModel):
+    """A batch of items to evaluate in one request (e.g. every equipped slot of a build)."""
+    items: List[ItemLevelRequest] = Field(..., min_length=1, max_length=50)
+
+# --- Response Models ---
+# Endpoints return DataJSONResponse directly, so these document the responses (OpenAPI) without
+# validating or re-encoding them at runtime.
+
+class ItemListEntry(BaseModel):
+    """An item in a list view."""
+    key: int
+    name: str
+    quality: str
+    icon_urls: List[str]
+
+class EquipmentListEntry(ItemListEntry):
+    """An equipment item in a list view. The equipment fields are only present for weapons."""
+    slot: Optional[str] = None
+    armour_type: Optional[str] = None
+    weapon_type: Optional[str] = None
+    base_dps: Optional[float] = None
+    total_sockets: Optional[int] = None
+
+class EssenceListEntry(ItemListEntry):
+    """An essence in a list view."""
+    essence_type: Optional[int] = None
+    essence_type_name: Optional[str] = None
+
+class ListPage(BaseModel):
+    """Paging information of a list response."""
+    total: Optional[int]  # None when count=none
+    total_is_estimate: bool
+    limit: int
+    skip: int
+    has_more: bool
+    next_cursor: Optional[str]
+
+class EquipmentListResponse(ListPage):
+    result: List[EquipmentListEntry]
+
+class EssenceListResponse(ListPage):
+    result: List[EssenceListEntry]
+
+class EVRankingEntry(BaseModel):
+    """An equipment item and its essence value at the ranking's item level."""
+    ev: float
+    item: EquipmentListEntry
+
+class EVRankingResponse(BaseModel):
+    result: List[EVRankingEntry]  # Best EV first
+    total: int
+    limit: int
+    skip: int
+    has_more: bool
+    slot: Optional[str]
+    ilvl: int
+    profile: str
+
+class EVCurve(BaseModel):
+    """Essence value of an item over a range of item levels: ev[j] is the EV at min_ilvl + j."""
+    key: int
+    min_ilvl: int
+    max_ilvl: int
+    profile: str
+    ev: List[float]
+
+class EVCurveResponse(BaseModel):
+    result: EVCurve
+
+class EVProfile(BaseModel):
+    """A named choice of reference essences for EV scoring."""
+    name: str
+    description: str
+
+class EVProfilesResponse(BaseModel):
+    result: List[EVProfile]
+
+class ItemSuggestion(BaseModel):
+    """An item name suggestion."""
+    key: int
+    name: str
+
+class ItemSuggestionsResponse(BaseModel):
+    result: List[ItemSuggestion]
+
+class ItemDetail(BaseModel):
+    """Base item data. Equipment, weapons and essences add their own fields."""
+    model_config = ConfigDict(extra="allow")
+    key: int
+    name: str
+    base_ilvl: int
+    quality: str
+    item_type: str
+    icon_urls: List[str]
+    stat_names: List[str]
+
+class ItemResponse(BaseModel):
+    result: ItemDetail
+
+class StatValue(BaseModel):
+    """A concrete stat value."""
+    stat_name: str
+    value: Optional[float]
+
+class ItemStats(BaseModel):
+    """Concrete stats of an item at an item level."""
+    ilvl: int
+    stat_values: List[StatValue]
+
+class ItemStatsResponse(BaseModel):
+    result: ItemStats
+
+class ItemStatsBatchEntry(ItemStats):
+    """Concrete stats of one item of a batch."""
+    key: int
+
+class ItemStatsBatchResponse(BaseModel):
+    result: List[Optional[ItemStatsBatchEntry]]  # None for unknown keys
+
+class ConcreteItem(ItemDetail):
+    """Base item data with concrete stats."""
+    concrete_ilvl: int
+    stats: List[StatValue]
+
+class ConcreteItemResponse(BaseModel):
+    result: ConcreteItem
+
+class ItemStatCurve(BaseModel):
+    """Concrete stats over a range of item levels: stat_values[i][j] is stat_names[i] at min_ilvl + j."""
+    min_ilvl: int
+    max_ilvl: int
+    stat_names: List[str]
+    stat_values: List[List[float]]
+
+class ItemStatCurveResponse(BaseModel):
+    result: ItemStatCurve
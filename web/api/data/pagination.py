@@ -0,0 +1,141 @@
+"""
+Keyset (cursor) pagination for item listings.
+
+Each listing sort order is a list of columns ending in the unique item key, so every row has a
+distinct position. A page ends with an opaque cursor holding the sort order and the last row's
+values; the next page starts strictly after that position instead of counting past `skip` rows,
+so deep pages cost the same as the first one.
+"""
+import base64
+import json
+import math
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+# Sort orders that support cursors: sort name -> [(attribute, descending)]
+KEYSET_ORDERS = {
+    'recent': [('key', True)],
+    'name': [('name', False), ('key', False)],
+    'base_ilvl': [('base_ilvl', True), ('name', False), ('key', False)],
+    # Equipment only - essence value precomputed at import time
+    'ev': [('ev', True), ('key', True)],
+}
+
+
+def get_keyset_order(sort: str, entity=None) -> List[Tuple[str, bool]]:
+    """
+    Get the keyset columns for a sort option. Unknown sorts, and sorts on columns the listed
+    entity does not have, fall back to recent.
+    """
+    order = KEYSET_ORDERS.get(sort)
+    if order is None or (entity is not None and not all(hasattr(entity, name) for name, _ in order)):
+        return KEYSET_ORDERS['recent']
+    return order
+
+
+def order_by_keyset(query, entity, order: List[Tuple[str, bool]]):
+    """Apply a keyset sort order to a query."""
+    return query.order_by(*(
+        getattr(entity, name).desc() if descending else getattr(entity, name).asc()
+        for name, descending in order
+    ))
+
+
+def encode_cursor(sort: str, row, order: List[Tuple[str, bool]]) -> str:
+    """Encode the position of a row in a sort order as an opaque cursor."""
+    payload = {'s': sort, 'v': [getattr(row, name) for name, _ in order]}
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(',', ':')).encode()).decode()
+
+
+def is_cursor_value(column, value: Any) -> bool:
+    """Whether a decoded cursor value fits a keyset column: its Python type, or None if nullable."""
+    if value is None:
+        return bool(column.nullable)
+    python_type = column.type.python_type
+    if isinstance(value, bool):
+        return False
+    if python_type is float:
+        return isinstance(value, (int, float)) and math.isfinite(value)
+    return isinstance(value, python_type)
+
+
+def decode_cursor(cursor: str, sort: str, order: List[Tuple[str, bool]], entity) -> List[Any]:
+    """
+    Decode a cursor into the position values for a sort order.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed, was issued for another sort order, or holds
+            values that do not fit the order's columns
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        values = payload['v']
+        valid = (
+            payload['s'] == sort and isinstance(values, list) and len(values) == len(order)
+            and all(is_cursor_value(getattr(entity, name), value) for (name, _), value in zip(order, values))
+        )
+    except (ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise HTTPException(status_code=400, detail="Invalid cursor for this sort order")
+    return values
+
+
+def after_cursor(entity, order: List[Tuple[str, bool]], values: List[Any]):
+    """
+    Build the filter for rows strictly after a position in a sort order.
+    (a DESC, b, c) after (x, y, z) is: a < x OR (a = x AND b > y) OR (a = x AND b = y AND c > z)
+    """
+    clauses = []
+    for index, (name, descending) in enumerate(order):
+        column = getattr(entity, name)
+        equal_prefix = [getattr(entity, prefix) == value for (prefix, _), value in zip(order[:index], values)]
+        past = column < values[index] if descending else column > values[index]
+        clauses.append(and_(*equal_prefix, past))
+    return or_(*clauses)
+
+
+def fetch_offset_page(query, limit: int, skip: int = 0) -> Tuple[List, bool]:
+    """
+    Fetch one page of an already sorted listing by offset, for orders without a unique position
+    (e.g. by a computed stat value or search relevance).
+
+    Returns:
+        (rows, has_more)
+    """
+    rows = query.offset(skip).limit(limit + 1).all()
+    return rows[:limit], len(rows) > limit
+
+
+def fetch_keyset_page(
+    query,
+    entity,
+    sort: str,
+    limit: int,
+    skip: int = 0,
+    cursor: Optional[str] = None
+) -> Tuple[List, Optional[str], bool]:
+    """
+    Fetch one page of a listing in a keyset sort order.
+
+    With a cursor the page starts right after it (skip is ignored); without one, skip is used
+    as an offset for compatibility with older clients.
+
+    Returns:
+        (rows, next_cursor, has_more) - next_cursor is None on the last page
+    """
+    order = get_keyset_order(sort, entity)
+    query = order_by_keyset(query, entity, order)
+    if cursor:
+        query = query.filter(after_cursor(entity, order, decode_cursor(cursor, sort, order, entity)))
+    elif skip:
+        query = query.offset(skip)
+
+    # One extra row tells whether there is a next page without counting
+    rows = query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(sort, rows[-1], order) if has_more else None
+    return rows, next_cursor, has_more
@@ -0,0 +1,43 @@
+"""
+JSON response class for the data API.
+
+Data endpoints build plain dicts and lists of JSON types, so FastAPI's jsonable_encoder pass (which
+walks every value again to convert it) is wasted work. Endpoints return DataJSONResponse directly,
+which FastAPI sends as-is, and orjson encodes the content in one pass. NumPy scalars and arrays are
+encoded natively.
+
+Item JSON pre-rendered at import time (item_renders) is already encoded, so it is spliced into the
+response body as bytes with rendered_response instead.
+"""
+from typing import Any, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+
+
+class DataJSONResponse(JSONResponse):
+    """JSON response encoded with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def join_json_array(parts: Iterable[bytes]) -> bytes:
+    """Join encoded JSON values into an encoded JSON array."""
+    return b"[" + b",".join(parts) + b"]"
+
+
+def rendered_response(result: bytes, **fields: Any) -> Response:
+    """
+    Build a {"result": ..., **fields} JSON response around an already encoded result.
+
+    Args:
+        result: Encoded JSON of the result
+        fields: Other top-level fields, encoded with orjson
+    """
+    body = b'{"result":' + result
+    if fields:
+        body += b"," + orjson.dumps(fields)[1:]  # The fields object without its opening brace
+    else:
+        body += b"}"
+    return Response(content=body, media_type="application/json")
@@ -0,0 +1,77 @@
+"""
+EV Rankings Service
+
+Ranks equipment by essence value (EV) at a requested item level rather than at each item's base
+ilvl. The whole catalog is scored in one batch from the compiled equipment stat matrix, and the
+resulting ranking is memoized per (EV profile, slot, ilvl, data version), so paging through a
+ranking or revisiting an ilvl does not score the catalog again. A reimport changes the data version, so
+stale rankings are never served; they simply age out of the cache.
+"""
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from database.compiled import DEFAULT_EV_PROFILE, LRUCache, get_equipment_matrix, get_ev_calculator
+from database.compiled.cache import MISSING
+
+
+class EVRankings:
+    """Memoized EV rankings of the equipment catalog."""
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of memoized rankings
+        """
+        self._rankings = LRUCache(maxsize)  # (profile, slot, ilvl, version) -> (keys, evs)
+        self._lock = threading.Lock()
+
+    def get_ranking(
+        self,
+        slot: Optional[str],
+        ilvl: int,
+        session: Optional[Session] = None,
+        profile: str = DEFAULT_EV_PROFILE
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get equipment ranked by EV at an item level.
+
+        Args:
+            slot: Only rank equipment for this slot; None ranks every item
+            ilvl: Item level to score every item at
+            session: Optional session to compile the matrix and reference table with if needed
+            profile: Name of the EV profile to score with
+
+        Returns:
+            (keys, evs) - parallel arrays, best EV first (ties by most recent key)
+
+        Raises:
+            KeyError: If there is no such profile
+        """
+        matrix = get_equipment_matrix(session)
+        key = (profile, slot, ilvl, matrix.version)
+        ranking = self._rankings.get(key)
+        if ranking is not MISSING:
+            return ranking
+
+        # Rankings are computed one at a time, so requests missing the same key score it once
+        with self._lock:
+            ranking = self._rankings.get(key)
+            if ranking is not MISSING:
+                return ranking
+
+            evs = get_ev_calculator(session, profile).score_equipment(matrix, ilvl)
+            keys = matrix.keys
+            if slot is not None:
+                in_slot = matrix.slots == slot
+                keys, evs = keys[in_slot], evs[in_slot]
+            order = np.lexsort((-keys, -evs))
+            ranking = (keys[order], evs[order])
+            self._rankings.put(key, ranking)
+            return ranking
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get the ranking cache size and counters."""
+        return self._rankings.get_stats()
@@ -0,0 +1,90 @@
+"""
+Single-flight Service
+
+Shares one computation between concurrent identical calls: the first caller for a key computes the
+result while later callers for the same key wait for it instead of repeating the work. Results are
+also kept for a short TTL, so calls that arrive just after a computation finishes reuse it too.
+"""
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from database.compiled import LRUCache
+from database.compiled.cache import MISSING
+
+
+class _Call:
+    """An in-flight computation and its outcome."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces concurrent identical computations and caches their results briefly."""
+
+    def __init__(self, ttl: float, maxsize: int):
+        """
+        Args:
+            ttl: Seconds a computed result is reused for
+            maxsize: Maximum number of cached results
+        """
+        self.ttl = ttl
+        self._results = LRUCache(maxsize)  # key -> (expires_at, result)
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.computed = 0
+        self.collapsed = 0
+        self.cache_hits = 0
+
+    def do(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """
+        Get the result for a key, computing it at most once across concurrent callers.
+
+        Errors are shared with the callers waiting on the same computation but are not cached.
+        """
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not MISSING and cached[0] > time.monotonic():
+                self.cache_hits += 1
+                return cached[1]
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = compute()
+            with self._lock:
+                self.computed += 1
+                self._results.put(key, (time.monotonic() + self.ttl, call.result))
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def get_stats(self) -> Dict:
+        """Get counters: computations run, requests collapsed onto one, and TTL cache hits."""
+        with self._lock:
+            return {
+                'computed': self.computed,
+                'collapsed': self.collapsed,
+                'cache_hits': self.cache_hits,
+                'in_flight': len(self._calls),
+                'cached': len(self._results),
+                'ttl': self.ttl
+            }
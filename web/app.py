@@ -2,6 +2,8 @@
 Main FastAPI application for the LOTRO Forge web interface.
 """
 import logging
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI, Request, HTTPException, status
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
@@ -14,13 +16,15 @@ from sqlalchemy.orm import Session
 from .config.config import (
     APP_NAME, APP_VERSION, APP_DESCRIPTION,
     CORS_ORIGINS, STATIC_DIR, TEMPLATES_DIR,
-    DEBUG
+    DEBUG, WEB_THREADS
 )
 from .middleware.security import add_security_middleware
 from .middleware.auth import AuthenticationMiddleware
+from .middleware.caching import add_data_cache_middleware
 from .routers import web_router, register_api_routes, not_found_handler
 
 from database.models.user import User
+from database.compiled import progression_registry, name_index
 
 # Configure logging
 logging.basicConfig(
@@ -29,16 +33,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Bound the handler threadpool and warm process-wide caches before serving requests."""
+    # Sync handlers (and get_db dependencies) run on anyio's default threadpool of 40 threads
+    to_thread.current_default_thread_limiter().total_tokens = WEB_THREADS
+    # Compile progression and DPS tables once so requests never load their rows
+    try:
+        progression_registry.ensure_loaded()
+    except Exception as e:
+        logger.warning(f"Could not compile progression tables at startup: {e}")
+    # Build the item name index used for search suggestions
+    try:
+        name_index.ensure_current()
+    except Exception as e:
+        logger.warning(f"Could not build the item name index at startup: {e}")
+    yield
+
 # Create FastAPI app
 app = FastAPI(
     title=APP_NAME,
     version=APP_VERSION,
-    description=APP_DESCRIPTION
+    description=APP_DESCRIPTION,
+    lifespan=lifespan
 )
 
 # Add middleware
 add_security_middleware(app)
 
+# Add data version caching for game data API routes (inside authentication, so 304s are never
+# served to anonymous requests)
+add_data_cache_middleware(app)
+
 # Add authentication middleware for API routes
 app.add_middleware(AuthenticationMiddleware)
 
@@ -12,12 +12,19 @@ DEBUG = ENV == "development"
 # Application settings
 APP_NAME = "LotRO Forge"
 APP_VERSION = "0.1.0"
+# Identifies the deployed build, so responses cached by an older deploy are not revalidated by a newer
+# one (fly.io machines get FLY_IMAGE_REF; set LOTRO_FORGE_BUILD_ID to override)
+BUILD_ID = os.getenv("LOTRO_FORGE_BUILD_ID") or os.getenv("FLY_IMAGE_REF") or APP_VERSION
 APP_DESCRIPTION = "A tool for creating, managing, and optimizing builds for end-game characters in The Lord of the Rings Online."
 
 # Web settings
 WEB_HOST = os.getenv("LOTRO_FORGE_HOST", "127.0.0.1")
 WEB_PORT = int(os.getenv("LOTRO_FORGE_PORT", "8000"))
 WEB_WORKERS = int(os.getenv("LOTRO_FORGE_WORKERS", "1"))
+# Threads per worker running sync API handlers and their database sessions. The handlers are CPU
+# bound under the GIL, so extra threads only interleave them and stretch tail latency; keep this
+# below the database connection pool size (5 + 10 overflow) so no thread waits for a connection
+WEB_THREADS = int(os.getenv("LOTRO_FORGE_THREADS", "1"))
 
 # CORS settings
 def get_cors_origins() -> List[str]:
@@ -49,6 +56,21 @@ DATABASE_URL = os.getenv(
     f"sqlite:///{BASE_DIR}/lotro_forge.db"
 )
 
+# Game data settings
+MIN_ILVL = 1  # Lowest item level the API will calculate stats for
+MAX_ILVL = 999  # Highest item level the API will calculate stats for
+
+# HTTP caching of /api/data responses (revalidated by data version ETags)
+DATA_CACHE_MAX_AGE = 60  # Seconds a response is used without revalidating
+DATA_CACHE_STALE_WHILE_REVALIDATE = 86400  # Seconds a stale response may be shown while revalidating
+
+# Server-side coalescing of identical /api/data requests
+DATA_RESULT_CACHE_TTL = 2.0  # Seconds a computed response is reused for identical requests
+DATA_RESULT_CACHE_SIZE = 512  # Maximum number of reused responses per worker
+
+# Essence value (EV) rankings of the equipment catalog at a requested item level
+EV_RANKING_CACHE_SIZE = 64  # Maximum number of memoized (slot, ilvl) rankings per worker
+
 # Static files
 STATIC_DIR = BASE_DIR / "web" / "static"
 TEMPLATES_DIR = BASE_DIR / "web" / "templates"
@@ -7,6 +7,7 @@ from typing import Optional, Tuple
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse, RedirectResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from database.session import SessionLocal
@@ -93,6 +94,13 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
             "/api/auth/admin/",     # All admin API routes require admin role
         ]
     
+    @staticmethod
+    def _load_user(auth_token: str) -> Optional[User]:
+        """Get the user of a session token, or None."""
+        with SessionLocal() as db_session:
+            user, error_message = validate_user_session(auth_token, db_session)
+            return user
+    
     async def dispatch(self, request: Request, call_next):
         # Always try to get the current user from session if available
         auth_token = request.cookies.get(AUTH_SESSION_COOKIE_NAME)
@@ -100,11 +108,11 @@ class AuthenticationMiddleware(BaseHTTPMiddleware):
         
         if auth_token:
             try:
-                with SessionLocal() as db_session:
-                    user, error_message = validate_user_session(auth_token, db_session)
-                    if user:
-                        current_user = user
-                        request.state.current_user = user
+                # Session lookups are blocking database queries - keep them off the event loop
+                user = await run_in_threadpool(self._load_user, auth_token)
+                if user:
+                    current_user = user
+                    request.state.current_user = user
             except Exception as e:
                 logger.error(f"Authentication middleware error: {e}")
                 # Don't fail the request, just don't set current_user
@@ -0,0 +1,88 @@
+"""
+HTTP caching for game data API routes.
+
+Game data only changes when an import runs and bumps the data version, and response shapes only
+change with a deploy, so a GET under /api/data is fully determined by the data version, the build
+and its path and query. Responses get a strong ETag derived from all of them, and a request whose
+If-None-Match already holds the current ETag is answered with 304 Not Modified before the endpoint
+runs.
+
+The data routes require a logged-in user, so responses are cacheable by the browser only
+(private); stale-while-revalidate lets repeated database browsing render from the browser cache
+while the ETag is checked in the background.
+"""
+import hashlib
+import logging
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from database.compiled import get_registry
+from ..config.config import BUILD_ID, DATA_CACHE_MAX_AGE, DATA_CACHE_STALE_WHILE_REVALIDATE
+
+logger = logging.getLogger(__name__)
+
+DATA_API_PREFIX = "/api/data/"
+
+CACHE_CONTROL = f"private, max-age={DATA_CACHE_MAX_AGE}, stale-while-revalidate={DATA_CACHE_STALE_WHILE_REVALIDATE}"
+
+
+def make_etag(version: int, path: str, query_items, build: str = BUILD_ID) -> str:
+    """
+    Build a strong ETag for a data response.
+
+    Args:
+        version: Data version the response is computed from
+        path: Request path
+        query_items: (name, value) query parameter pairs; their order does not matter
+        build: Build serving the response, whose code decides the response shape
+    """
+    normalized = "&".join(f"{name}={value}" for name, value in sorted(query_items))
+    digest = hashlib.sha256(f"{build}\n{path}?{normalized}".encode()).hexdigest()[:32]
+    return f'"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches an ETag (weak comparison, as RFC 9110 requires)."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class DataCacheMiddleware(BaseHTTPMiddleware):
+    """Adds data version ETags and Cache-Control to /api/data GET responses and answers 304s."""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method != "GET" or not request.url.path.startswith(DATA_API_PREFIX):
+            return await call_next(request)
+
+        try:
+            # Checking the data version can query the database (at most once per poll interval)
+            version = (await run_in_threadpool(get_registry)).version
+        except Exception as e:
+            # Without a data version there is nothing safe to validate against
+            logger.warning(f"Could not read the data version for caching: {e}")
+            return await call_next(request)
+
+        etag = make_etag(version, request.url.path, request.query_params.multi_items())
+        headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Cookie"}
+
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        response = await call_next(request)
+        # Errors are not cached - only successful responses belong to the data version
+        if response.status_code == 200:
+            response.headers.update(headers)
+        return response
+
+
+def add_data_cache_middleware(app):
+    app.add_middleware(DataCacheMiddleware)
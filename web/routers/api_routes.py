@@ -3,6 +3,10 @@ API routes organization and registration.
 
 This module centralizes all API router imports and provides a single function
 to register all API routes with the main FastAPI application.
+
+Endpoints that use a (synchronous) SQLAlchemy Session are declared with plain `def`, so FastAPI
+runs them in its threadpool instead of blocking the event loop for the duration of each query.
+Only handlers that never touch the database or block are `async def`.
 """
 from fastapi import FastAPI
 
@@ -102,8 +102,8 @@ class EquipmentFilters extends BaseFilters {
     }
     
     // Build API URL with current filters and pagination
-    static buildApiUrl(filterState, offset = 0, limit = 99) {
-        const params = super.buildBaseParams(filterState, offset, limit);
+    static buildApiUrl(filterState, offset = 0, limit = 99, cursor = null) {
+        const params = super.buildBaseParams(filterState, offset, limit, cursor);
         
         if (filterState.slot) {
             const selectedGroup = EQUIPMENT_SLOT_GROUPS[filterState.slot];
@@ -4,6 +4,10 @@ document.addEventListener('alpine:init', () => {
         panelId: panelId,
         databaseController: null,
         equipmentManager: null,
+        
+        // Stat curve for the selected item - lets the ilvl editor update stats without API calls
+        statCurve: null,
+        statCurveKey: null,
 
         // Filter state and options
         filterOptions: {},
@@ -87,12 +91,12 @@ document.addEventListener('alpine:init', () => {
         },
         
         handleLoadMore(event) {
-            this.loadData(event.detail.offset, event.detail.limit, true);
+            this.loadData(event.detail.offset, event.detail.limit, true, event.detail.cursor);
         },
 
-        async loadData(offset = 0, limit = 99, append = false) {
+        async loadData(offset = 0, limit = 99, append = false, cursor = null) {
             // Load equipment data with current filters
-            apiUrl = window.EquipmentFilters.buildApiUrl(this.filterState, offset, limit);
+            apiUrl = window.EquipmentFilters.buildApiUrl(this.filterState, offset, limit, cursor);
             listOptions = {
                 offset: offset,
                 limit: limit,
@@ -110,6 +114,20 @@ document.addEventListener('alpine:init', () => {
             await this.databaseController.selectSpecificData(apiUrl, item);
         },
         
+        async loadStatCurve(itemKey) {
+            // Fetch the stats of an item across every ilvl once, then reuse it for each ilvl change
+            if (this.statCurveKey === itemKey && this.statCurve) {
+                return this.statCurve;
+            }
+            
+            const curve = await this.databaseController.queryApi(`/api/data/items/${itemKey}/curve`);
+            if (curve) {
+                this.statCurve = curve;
+                this.statCurveKey = itemKey;
+            }
+            return curve;
+        },
+        
         async updateItemLevel(event) {
             // Update item level and recalculate stats
             if (!this.databaseController.selectedData) return;
@@ -125,11 +143,17 @@ document.addEventListener('alpine:init', () => {
             if (newIlvl === currentIlvl) return;
             
             try {
-                apiUrl = `/api/data/items/${this.databaseController.selectedData.key}/stats?ilvl=${newIlvl}`;
-                const newStats = await this.databaseController.queryApi(apiUrl);
+                const curve = await this.loadStatCurve(this.databaseController.selectedData.key);
+                if (!curve) {
+                    throw new Error('Failed to load stat curve');
+                }
                 
-                this.databaseController.selectedData.stats = newStats.stat_values;
-                this.databaseController.selectedData.concrete_ilvl = newStats.ilvl;
+                const index = newIlvl - curve.min_ilvl;
+                this.databaseController.selectedData.stats = curve.stat_names.map((statName, statIndex) => ({
+                    stat_name: statName,
+                    value: curve.stat_values[statIndex][index]
+                }));
+                this.databaseController.selectedData.concrete_ilvl = newIlvl;
                 
             } catch (error) {
                 logError('Error updating item level:', error);
@@ -42,8 +42,8 @@ class EssenceFilters extends BaseFilters {
     /**
      * Builds API URL with filter parameters
      */
-    static buildApiUrl(filterState, offset = 0, limit = 99) {
-        const params = super.buildBaseParams(filterState, offset, limit);
+    static buildApiUrl(filterState, offset = 0, limit = 99, cursor = null) {
+        const params = super.buildBaseParams(filterState, offset, limit, cursor);
         
         if (filterState.essence_type) {
             params.append('essence_type', filterState.essence_type);
@@ -48,11 +48,11 @@ document.addEventListener('alpine:init', () => {
         },
         
         handleLoadMore(event) {
-            this.loadData(event.detail.offset, event.detail.limit, true);
+            this.loadData(event.detail.offset, event.detail.limit, true, event.detail.cursor);
         },
 
-        async loadData(offset = 0, limit = 99, append = false) {
-            const apiUrl = window.EssenceFilters.buildApiUrl(this.filterState, offset, limit);
+        async loadData(offset = 0, limit = 99, append = false, cursor = null) {
+            const apiUrl = window.EssenceFilters.buildApiUrl(this.filterState, offset, limit, cursor);
             const listOptions = {
                 offset: offset,
                 limit: limit,
@@ -21,12 +21,23 @@ class BaseFilters {
     }
     
     // Build API URL with current filters and pagination
-    static buildBaseParams(filterState, offset = 0, limit = 99) {
+    // A cursor (next_cursor from the previous page) takes the place of the offset where supported
+    static buildBaseParams(filterState, offset = 0, limit = 99, cursor = null) {
         const params = new URLSearchParams();
         
         params.append('limit', limit);
-        params.append('skip', offset);
+        if (cursor) {
+            params.append('cursor', cursor);
+        } else {
+            params.append('skip', offset);
+        }
+        
+        // Later pages keep the total from the first page
+        if (cursor || offset > 0) {
+            params.append('count', 'none');
+        }
         
+        // Substring search by default - the controller retries with fuzzy matching when it finds nothing
         if (filterState.search) {
             params.append('search', filterState.search);
         }
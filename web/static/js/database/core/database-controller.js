@@ -9,8 +9,10 @@ document.addEventListener('alpine:init', () => {
             loading: false,
             hasMore: true,
             offset: 0,
+            cursor: null,
             totalResults: null,
-            currentlyShowing: 0
+            currentlyShowing: 0,
+            fuzzySearch: false
         },
 
         dataList: [],
@@ -39,11 +41,22 @@ document.addEventListener('alpine:init', () => {
             window.dispatchEvent(new CustomEvent(`database-load-more-${panelId}`, {
                 detail: {
                     offset: this.pagination.offset,
+                    cursor: this.pagination.cursor,
                     limit: 99
                 }
             }));
         },
         
+        // Get a list URL with typo tolerant (fuzzy) name search, or null if it has no search to retry
+        getFuzzySearchUrl(apiUrl) {
+            const url = new URL(apiUrl, window.location.origin);
+            if (!url.searchParams.get('search') || url.searchParams.has('search_mode')) {
+                return null;
+            }
+            url.searchParams.set('search_mode', 'fuzzy');
+            return url.pathname + url.search;
+        },
+        
         // Query API endpoint and handle pagination/list updates
         async queryApi(apiUrl, listOptions = null) {
             await this.waitForLoad();
@@ -52,12 +65,31 @@ document.addEventListener('alpine:init', () => {
 
             try {
                 this.loading = true;
-                const response = await fetch(apiUrl);
+                // Later pages of a search that fell back to fuzzy matching stay fuzzy
+                if (listOptions && listOptions.append && this.pagination.fuzzySearch) {
+                    apiUrl = this.getFuzzySearchUrl(apiUrl) || apiUrl;
+                }
+                let response = await fetch(apiUrl);
                 if (!response.ok) {
                     throw new Error('Failed to load data');
                 }
                 
-                const data = await response.json();
+                let data = await response.json();
+                
+                // Fuzzy matching is much slower (especially without PostgreSQL's trigram index),
+                // so it only runs when a new substring search finds nothing
+                if (listOptions && !listOptions.append) {
+                    this.pagination.fuzzySearch = false;
+                    const fuzzyUrl = data.result.length === 0 ? this.getFuzzySearchUrl(apiUrl) : null;
+                    if (fuzzyUrl) {
+                        response = await fetch(fuzzyUrl);
+                        if (!response.ok) {
+                            throw new Error('Failed to load data');
+                        }
+                        data = await response.json();
+                        this.pagination.fuzzySearch = true;
+                    }
+                }
                 result = data.result;
                 
                 if (listOptions) {
@@ -66,10 +98,13 @@ document.addEventListener('alpine:init', () => {
                     } else {
                         this.dataList = result;
                     }
-                    this.pagination.totalResults = data.total;
+                    if (data.total !== null && data.total !== undefined) {
+                        this.pagination.totalResults = data.total;
+                    }
                     this.pagination.currentlyShowing = this.dataList.length;
                     this.pagination.hasMore = data.has_more;
                     this.pagination.offset = listOptions.offset + listOptions.limit;
+                    this.pagination.cursor = data.next_cursor || null;
                 }
             } catch (error) {
                 logError("Error loading data: ", error);
@@ -114,9 +149,11 @@ document.addEventListener('alpine:init', () => {
             
             // Reset pagination state
             this.pagination.offset = 0;
+            this.pagination.cursor = null;
             this.pagination.totalResults = null;
             this.pagination.currentlyShowing = 0;
             this.pagination.hasMore = false;
+            this.pagination.fuzzySearch = false;
         },
 
         async waitForLoad() {